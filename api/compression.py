@@ -0,0 +1,216 @@
+"""Response compression: content negotiation, gzip/brotli encoders and an ASGI middleware."""
+
+from __future__ import annotations
+
+import os
+import zlib
+from typing import Optional, Tuple
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is an optional dependency
+    brotli = None
+
+# Responses smaller than this many bytes are sent uncompressed
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
+GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+
+# Bodies at least this large are compressed in a worker thread instead of on the event loop
+THREAD_MIN_SIZE = 128 * 1024
+
+# Media types that are already compressed or must not be buffered
+EXCLUDED_MEDIA_TYPES = frozenset(
+    {
+        "application/gzip",
+        "application/zip",
+        "application/vnd.apache.parquet",
+        "image/png",
+        "image/jpeg",
+        "image/webp",
+        "text/event-stream",
+    }
+)
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Return the supported content codings in order of preference."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the preferred content coding acceptable to the client.
+
+    Parameters:
+        accept_encoding (Optional[str]): Raw `Accept-Encoding` header value.
+
+    Returns:
+        Optional[str]: "br" or "gzip", or `None` if the client accepts neither.
+    """
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip().lower()] = quality
+    wildcard = weights.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in available_encodings():
+        quality = weights.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def is_compressible(media_type: Optional[str]) -> bool:
+    """Return True unless `media_type` is already compressed or a server-sent event stream."""
+    return (media_type or "").partition(";")[0].strip().lower() not in EXCLUDED_MEDIA_TYPES
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Compress a complete body with the given content coding.
+
+    Parameters:
+        body (bytes): Uncompressed bytes.
+        encoding (str): "br" or "gzip".
+
+    Returns:
+        bytes: The encoded body.
+
+    Raises:
+        ValueError: If `encoding` is not available.
+    """
+    if encoding == "gzip":
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(body) + compressor.flush()
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+class _StreamCompressor:
+    """Incremental encoder for chunked responses; every chunk is flushed so clients can decode it immediately."""
+
+    def __init__(self, encoding: str) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._zlib = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes, final: bool) -> bytes:
+        if self.encoding == "br":
+            out = self._brotli.process(chunk)
+            return out + (self._brotli.finish() if final else self._brotli.flush())
+        return self._zlib.compress(chunk) + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with brotli or gzip according to the client's `Accept-Encoding`.
+
+    Responses below `minimum_size`, responses that already carry a `Content-Encoding` (such as precompressed
+    cache entries) and already-compressed media types pass through untouched. Streaming responses are compressed
+    chunk by chunk.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressionResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressionResponder:
+    """Per-request state for `CompressionMiddleware`."""
+
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Optional[Send] = None
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[_StreamCompressor] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 206, 304)
+                or not is_compressible(headers.get("content-type"))
+            )
+            self.start_message = message
+            if self.passthrough:
+                await self.send(message)
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            if self.start_message is not None and not self.passthrough:
+                await self.send(self.start_message)
+                self.start_message = None
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is None:
+            # Subsequent chunk of a response that is already being streamed
+            if self.compressor is not None:
+                message["body"] = self.compressor.compress(body, final=not more_body)
+            await self.send(message)
+            return
+
+        start, self.start_message = self.start_message, None
+        headers = MutableHeaders(raw=start["headers"])
+        headers.add_vary_header("Accept-Encoding")
+
+        if not more_body:
+            if len(body) >= self.minimum_size:
+                if len(body) >= THREAD_MIN_SIZE:
+                    body = await anyio.to_thread.run_sync(compress, body, self.encoding)
+                else:
+                    body = compress(body, self.encoding)
+                headers["Content-Encoding"] = self.encoding
+                headers["Content-Length"] = str(len(body))
+                message["body"] = body
+            await self.send(start)
+            await self.send(message)
+            return
+
+        self.compressor = _StreamCompressor(self.encoding)
+        headers["Content-Encoding"] = self.encoding
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        message["body"] = self.compressor.compress(body, final=False)
+        await self.send(start)
+        await self.send(message)
@@ -0,0 +1,230 @@
+"""Bulk export helpers that stream graph data without materialising it in memory."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow is an optional dependency
+    pa = None
+    pq = None
+
+# Number of rows encoded into each chunk handed to the response stream
+EXPORT_CHUNK_ROWS = 1000
+
+RELATIONSHIP_COLUMNS = ("source_id", "target_id", "relationship_type", "strength")
+
+ASSET_COLUMNS = ("id", "symbol", "name", "asset_class", "sector", "price", "market_cap", "currency")
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+COLUMNAR_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def iter_relationship_rows(
+    relationships: Dict[str, List[Tuple[str, str, float]]], relationship_type: Optional[str] = None
+) -> Iterator[Tuple[str, str, str, float]]:
+    """
+    Yield `(source_id, target_id, relationship_type, strength)` rows straight from the adjacency mapping.
+
+    Parameters:
+        relationships (Dict[str, List[Tuple[str, str, float]]]): The graph's `relationships` mapping.
+        relationship_type (Optional[str]): Only yield edges of this type when given.
+
+    Yields:
+        Tuple[str, str, str, float]: One directed edge.
+    """
+    for source_id, rels in relationships.items():
+        for target_id, rel_type, strength in rels:
+            if relationship_type and rel_type != relationship_type:
+                continue
+            yield source_id, target_id, rel_type, float(strength)
+
+
+def _chunked_ndjson(rows: Iterator[Tuple], chunk_rows: int) -> Iterator[bytes]:
+    """Encode rows as newline-delimited JSON objects, `chunk_rows` lines per chunk."""
+    lines: List[str] = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(RELATIONSHIP_COLUMNS, row)), separators=(",", ":")))
+        if len(lines) >= chunk_rows:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def _chunked_csv(rows: Iterator[Tuple], chunk_rows: int) -> Iterator[bytes]:
+    """Encode rows as CSV with a header line, `chunk_rows` rows per chunk."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(RELATIONSHIP_COLUMNS)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def stream_relationships(
+    relationships: Dict[str, List[Tuple[str, str, float]]],
+    export_format: str = "ndjson",
+    relationship_type: Optional[str] = None,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> Iterator[bytes]:
+    """
+    Stream every relationship as encoded chunks of NDJSON or CSV.
+
+    Only one chunk is held in memory at a time, so memory use is independent of graph size.
+
+    Parameters:
+        relationships (Dict[str, List[Tuple[str, str, float]]]): The graph's `relationships` mapping.
+        export_format (str): Either "ndjson" or "csv".
+        relationship_type (Optional[str]): Only export edges of this type when given.
+        chunk_rows (int): Rows per yielded chunk.
+
+    Returns:
+        Iterator[bytes]: Encoded chunks ready to be written to the response.
+
+    Raises:
+        ValueError: If `export_format` is not supported.
+    """
+    rows = iter_relationship_rows(relationships, relationship_type)
+    if export_format == "ndjson":
+        return _chunked_ndjson(rows, chunk_rows)
+    if export_format == "csv":
+        return _chunked_csv(rows, chunk_rows)
+    raise ValueError(f"Unsupported export format: {export_format}")
+
+
+def columnar_export_available() -> bool:
+    """Return True if pyarrow is installed and Arrow/Parquet exports can be produced."""
+    return pa is not None
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise RuntimeError("Arrow and Parquet exports require the optional 'pyarrow' package")
+
+
+def assets_table(assets: Dict[str, Any], clusters: Optional[Dict[str, int]] = None) -> "pa.Table":
+    """
+    Build an Arrow table of the core asset columns, ordered by asset id.
+
+    Low-cardinality string columns (asset class, sector, currency) are dictionary encoded and numeric columns are
+    built from contiguous NumPy buffers.
+
+    Parameters:
+        assets (Dict[str, Any]): The graph's `assets` mapping.
+        clusters (Optional[Dict[str, int]]): Community id per asset id; adds a `cluster` column (null for assets
+            without one) when given.
+
+    Returns:
+        pa.Table: One row per asset with the columns in `ASSET_COLUMNS`, plus `cluster` when requested.
+
+    Raises:
+        RuntimeError: If pyarrow is not installed.
+    """
+    _require_pyarrow()
+    ordered = [assets[asset_id] for asset_id in sorted(assets)]
+    count = len(ordered)
+    price = np.fromiter((a.price for a in ordered), dtype=np.float64, count=count)
+    market_cap = np.fromiter(
+        (np.nan if a.market_cap is None else a.market_cap for a in ordered), dtype=np.float64, count=count
+    )
+    columns = {
+        "id": pa.array([a.id for a in ordered], type=pa.string()),
+        "symbol": pa.array([a.symbol for a in ordered], type=pa.string()),
+        "name": pa.array([a.name for a in ordered], type=pa.string()),
+        "asset_class": pa.array([a.asset_class.value for a in ordered], type=pa.string()).dictionary_encode(),
+        "sector": pa.array([a.sector for a in ordered], type=pa.string()).dictionary_encode(),
+        "price": pa.array(price),
+        "market_cap": pa.array(market_cap, mask=np.isnan(market_cap)),
+        "currency": pa.array([a.currency for a in ordered], type=pa.string()).dictionary_encode(),
+    }
+    if clusters is not None:
+        cluster = np.fromiter((clusters.get(a.id, -1) for a in ordered), dtype=np.int32, count=count)
+        columns["cluster"] = pa.array(cluster, mask=cluster < 0)
+    return pa.table(columns)
+
+
+def relationships_table(
+    relationships: Dict[str, List[Tuple[str, str, float]]], relationship_type: Optional[str] = None
+) -> "pa.Table":
+    """
+    Build an Arrow table of directed edges from the adjacency mapping.
+
+    Parameters:
+        relationships (Dict[str, List[Tuple[str, str, float]]]): The graph's `relationships` mapping.
+        relationship_type (Optional[str]): Only include edges of this type when given.
+
+    Returns:
+        pa.Table: One row per edge with the columns in `RELATIONSHIP_COLUMNS`; `relationship_type` is dictionary
+            encoded and `strength` is float64.
+
+    Raises:
+        RuntimeError: If pyarrow is not installed.
+    """
+    _require_pyarrow()
+    sources: List[str] = []
+    targets: List[str] = []
+    types: List[str] = []
+    strengths: List[float] = []
+    for source_id, target_id, rel_type, strength in iter_relationship_rows(relationships, relationship_type):
+        sources.append(source_id)
+        targets.append(target_id)
+        types.append(rel_type)
+        strengths.append(strength)
+    return pa.table(
+        {
+            "source_id": pa.array(sources, type=pa.string()),
+            "target_id": pa.array(targets, type=pa.string()),
+            "relationship_type": pa.array(types, type=pa.string()).dictionary_encode(),
+            "strength": pa.array(np.asarray(strengths, dtype=np.float64)),
+        }
+    )
+
+
+def encode_table(table: "pa.Table", export_format: str) -> bytes:
+    """
+    Serialize an Arrow table as an Arrow IPC stream or a Parquet file.
+
+    Parameters:
+        table (pa.Table): Table to serialize.
+        export_format (str): Either "arrow" or "parquet".
+
+    Returns:
+        bytes: The encoded payload.
+
+    Raises:
+        ValueError: If `export_format` is not supported.
+        RuntimeError: If pyarrow is not installed.
+    """
+    _require_pyarrow()
+    sink = pa.BufferOutputStream()
+    if export_format == "arrow":
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    elif export_format == "parquet":
+        pq.write_table(table, sink)
+    else:
+        raise ValueError(f"Unsupported export format: {export_format}")
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,50 @@
+"""High-throughput JSON encoding for API responses, with native NumPy support."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import numpy as np
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the standard library encoder
+    orjson = None
+
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+def _default(obj: Any) -> Any:
+    """Convert NumPy scalars and arrays for the standard library encoder."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode `content` as compact UTF-8 JSON.
+
+    NumPy arrays and scalars are serialized natively, without first converting each element to a Python object.
+    Uses orjson when it is installed and the standard library encoder otherwise.
+
+    Parameters:
+        content (Any): JSON-compatible data, possibly containing NumPy arrays or scalars.
+
+    Returns:
+        bytes: The encoded document.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+    return json.dumps(content, default=_default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with `dumps`; used as the application's default response class."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
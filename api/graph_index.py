@@ -0,0 +1,252 @@
+"""Precomputed lookup indexes and cursor pagination helpers for the graph API."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# Edge tuple layout used by RelationshipIndex: (source_id, target_id, relationship_type, strength)
+Edge = Tuple[str, str, str, float]
+
+CursorPart = Union[str, int, float]
+
+# Component types of asset cursors: the asset id
+ASSET_CURSOR_TYPES: Tuple[type, ...] = (str,)
+
+# Component types of relationship cursors: the full edge sort key, then how many equal edges precede the edge
+RELATIONSHIP_CURSOR_TYPES: Tuple[type, ...] = (str, str, str, float, int)
+
+
+def encode_cursor(key: Sequence[CursorPart]) -> str:
+    """
+    Encode the sort key of the last item on a page as an opaque cursor string.
+
+    Parameters:
+        key (Sequence[CursorPart]): Sort key of the last returned item.
+
+    Returns:
+        str: URL-safe cursor token.
+    """
+    raw = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _cursor_part(part: Any, expected: type) -> CursorPart:
+    """Return `part` as `expected`, accepting integers for floats; raise ValueError for any other type."""
+    if isinstance(part, bool):
+        raise ValueError("Invalid cursor")
+    if expected is float and isinstance(part, (int, float)):
+        return float(part)
+    if not isinstance(part, expected):
+        raise ValueError("Invalid cursor")
+    return part
+
+
+def decode_cursor(cursor: str, key_types: Sequence[type]) -> Tuple[CursorPart, ...]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Parameters:
+        cursor (str): Cursor token supplied by the client.
+        key_types (Sequence[type]): Type of each sort key component, such as `RELATIONSHIP_CURSOR_TYPES`.
+
+    Returns:
+        Tuple[CursorPart, ...]: The decoded sort key.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the expected key shape.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(key, list) or len(key) != len(key_types):
+        raise ValueError("Invalid cursor")
+    return tuple(_cursor_part(part, expected) for part, expected in zip(key, key_types))
+
+
+@dataclass
+class Page:
+    """A slice of an ordered result set together with the cursor for the following slice."""
+
+    items: List[Any]
+    total: int
+    next_cursor: Optional[str]
+
+
+def _paginate(
+    ordered: List[Any],
+    sort_key,
+    key_types: Sequence[type],
+    cursor: Optional[str],
+    limit: Optional[int],
+    counts_duplicates: bool = False,
+) -> Page:
+    """
+    Slice `ordered` after the cursor position, returning at most `limit` items.
+
+    When `counts_duplicates` is set, items may share a sort key; the cursor then ends with the number of equal
+    items preceding the last returned one, so it points at exactly one item.
+    """
+    start = 0
+    if cursor:
+        key = decode_cursor(cursor, key_types)
+        if counts_duplicates:
+            key, preceding = key[:-1], int(key[-1])
+            first = bisect_left(ordered, key, key=sort_key)
+            start = min(first + max(preceding, 0) + 1, bisect_right(ordered, key, lo=first, key=sort_key))
+        else:
+            start = bisect_right(ordered, key, key=sort_key)
+    end = len(ordered) if limit is None else min(len(ordered), start + limit)
+    items = ordered[start:end]
+    next_cursor = None
+    if items and end < len(ordered):
+        last_key = sort_key(items[-1])
+        if counts_duplicates:
+            last_key = (*last_key, end - 1 - bisect_left(ordered, last_key, hi=end - 1, key=sort_key))
+        next_cursor = encode_cursor(last_key)
+    return Page(items=items, total=len(ordered), next_cursor=next_cursor)
+
+
+def _asset_sort_key(asset_id: str) -> Tuple[str]:
+    return (asset_id,)
+
+
+def _edge_sort_key(edge: Edge) -> Edge:
+    return edge
+
+
+@dataclass
+class AssetIndex:
+    """
+    Asset ids sorted for stable pagination, with precomputed per-filter id lists.
+
+    Attributes:
+        sorted_ids: Every asset id in ascending order.
+        by_class: Sorted ids per `asset_class.value`.
+        by_sector: Sorted ids per sector.
+        by_class_sector: Sorted ids per `(asset_class.value, sector)` pair.
+    """
+
+    sorted_ids: List[str] = field(default_factory=list)
+    by_class: Dict[str, List[str]] = field(default_factory=dict)
+    by_sector: Dict[str, List[str]] = field(default_factory=dict)
+    by_class_sector: Dict[Tuple[str, str], List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, assets: Dict[str, Any]) -> "AssetIndex":
+        """
+        Build the index from a mapping of asset id to asset.
+
+        Parameters:
+            assets (Dict[str, Any]): The graph's `assets` mapping.
+
+        Returns:
+            AssetIndex: Index over the supplied assets.
+        """
+        index = cls(sorted_ids=sorted(assets))
+        for asset_id in index.sorted_ids:
+            asset = assets[asset_id]
+            class_name = asset.asset_class.value
+            index.by_class.setdefault(class_name, []).append(asset_id)
+            index.by_sector.setdefault(asset.sector, []).append(asset_id)
+            index.by_class_sector.setdefault((class_name, asset.sector), []).append(asset_id)
+        return index
+
+    def select(self, asset_class: Optional[str] = None, sector: Optional[str] = None) -> List[str]:
+        """
+        Return the sorted ids matching the filters without scanning the asset table.
+
+        Parameters:
+            asset_class (Optional[str]): Asset class value to match.
+            sector (Optional[str]): Sector to match.
+
+        Returns:
+            List[str]: Matching asset ids in ascending order.
+        """
+        if asset_class and sector:
+            return self.by_class_sector.get((asset_class, sector), [])
+        if asset_class:
+            return self.by_class.get(asset_class, [])
+        if sector:
+            return self.by_sector.get(sector, [])
+        return self.sorted_ids
+
+    def page(
+        self,
+        asset_class: Optional[str] = None,
+        sector: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Page:
+        """
+        Return one page of matching asset ids, ordered by id.
+
+        Raises:
+            ValueError: If `cursor` is malformed.
+        """
+        return _paginate(self.select(asset_class, sector), _asset_sort_key, ASSET_CURSOR_TYPES, cursor, limit)
+
+
+@dataclass
+class RelationshipIndex:
+    """
+    Directed edges sorted by `(source_id, target_id, relationship_type, strength)`, with per-type edge lists.
+
+    Attributes:
+        edges: Every edge in sort order.
+        by_type: Sorted edges per relationship type.
+    """
+
+    edges: List[Edge] = field(default_factory=list)
+    by_type: Dict[str, List[Edge]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, relationships: Dict[str, List[Tuple[str, str, float]]]) -> "RelationshipIndex":
+        """
+        Build the index from the graph's `relationships` adjacency mapping.
+
+        Parameters:
+            relationships (Dict[str, List[Tuple[str, str, float]]]): Source id to outgoing `(target, type, strength)`.
+
+        Returns:
+            RelationshipIndex: Index over the supplied edges.
+        """
+        edges = sorted(
+            (source_id, target_id, rel_type, float(strength))
+            for source_id, rels in relationships.items()
+            for target_id, rel_type, strength in rels
+        )
+        index = cls(edges=edges)
+        for edge in edges:
+            index.by_type.setdefault(edge[2], []).append(edge)
+        return index
+
+    def select(self, relationship_type: Optional[str] = None) -> List[Edge]:
+        """Return the sorted edges of `relationship_type`, or every edge when it is not given."""
+        if relationship_type:
+            return self.by_type.get(relationship_type, [])
+        return self.edges
+
+    def page(
+        self, relationship_type: Optional[str] = None, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Page:
+        """
+        Return one page of matching edges in sort order.
+
+        Raises:
+            ValueError: If `cursor` is malformed.
+        """
+        return _paginate(
+            self.select(relationship_type),
+            _edge_sort_key,
+            RELATIONSHIP_CURSOR_TYPES,
+            cursor,
+            limit,
+            counts_duplicates=True,
+        )
@@ -0,0 +1,163 @@
+"""Background rebuilding of the global graph with atomic publication of the result."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class GraphRefreshScheduler:
+    """
+    Rebuild the graph on a worker thread, on an interval or on demand, and hand each result to a publish callback.
+
+    The build runs without holding any lock used by request handlers, so requests keep being served from the
+    previous snapshot until the new one is published. Only one refresh runs at a time. Refresh duration,
+    failures and staleness are tracked for monitoring.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[], Any],
+        publish: Callable[[Any], None],
+        interval_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Create a stopped scheduler.
+
+        Parameters:
+            build (Callable[[], Any]): Zero-argument callable that builds a new graph.
+            publish (Callable[[Any], None]): Callable that atomically installs a freshly built graph.
+            interval_seconds (Optional[float]): Seconds between periodic refreshes; `None` or a non-positive
+                value refreshes only when triggered.
+            clock (Callable[[], float]): Wall-clock source, overridable in tests.
+        """
+        self.build = build
+        self.publish = publish
+        self.interval_seconds = interval_seconds if interval_seconds and interval_seconds > 0 else None
+        self.clock = clock
+        self._refresh_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.refresh_count = 0
+        self.failure_count = 0
+        self.last_started_at: Optional[float] = None
+        self.last_success_at: Optional[float] = None
+        self.last_duration_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        """True while the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def in_progress(self) -> bool:
+        """True while a refresh is building or publishing a graph."""
+        return self._refresh_lock.locked()
+
+    def start(self) -> None:
+        """Start the worker thread if it is not already running."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="graph-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the worker thread, waiting up to `timeout` seconds for an in-flight refresh to finish.
+
+        Parameters:
+            timeout (float): Maximum seconds to wait for the worker to exit.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def trigger(self) -> None:
+        """Request a refresh as soon as possible, starting the worker thread if necessary."""
+        self._wake.set()
+        self.start()
+
+    def refresh_now(self) -> bool:
+        """
+        Build and publish a new graph on the calling thread.
+
+        If another refresh is already in progress this waits for it and then performs its own.
+
+        Returns:
+            bool: True if the new graph was published, False if the build failed.
+        """
+        with self._refresh_lock:
+            started_at = self.clock()
+            start = time.perf_counter()
+            with self._stats_lock:
+                self.last_started_at = started_at
+            try:
+                new_graph = self.build()
+                self.publish(new_graph)
+            except Exception as exc:
+                with self._stats_lock:
+                    self.failure_count += 1
+                    self.last_error = str(exc)
+                logger.exception("Background graph refresh failed; keeping the current graph")
+                return False
+            self.record_refresh(started_at, time.perf_counter() - start)
+            logger.info("Graph refreshed in %.3fs", self.last_duration_seconds)
+            return True
+
+    def record_refresh(self, started_at: float, duration_seconds: float) -> None:
+        """
+        Record a successful build and publish, including one performed outside the scheduler.
+
+        Parameters:
+            started_at (float): Wall-clock time the build started.
+            duration_seconds (float): How long the build and publish took.
+        """
+        with self._stats_lock:
+            self.refresh_count += 1
+            self.last_started_at = started_at
+            self.last_success_at = started_at + duration_seconds
+            self.last_duration_seconds = duration_seconds
+            self.last_error = None
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Return refresh metrics.
+
+        Returns:
+            Dict[str, Any]: Mapping with `running`, `in_progress`, `interval_seconds`, `refresh_count`,
+                `failure_count`, `last_started_at`, `last_success_at` (epoch seconds), `last_duration_seconds`,
+                `staleness_seconds` (age of the published graph, `None` if nothing was published yet) and `last_error`.
+        """
+        with self._stats_lock:
+            staleness = None if self.last_success_at is None else max(0.0, self.clock() - self.last_success_at)
+            return {
+                "running": self.running,
+                "in_progress": self.in_progress,
+                "interval_seconds": self.interval_seconds,
+                "refresh_count": self.refresh_count,
+                "failure_count": self.failure_count,
+                "last_started_at": self.last_started_at,
+                "last_success_at": self.last_success_at,
+                "last_duration_seconds": self.last_duration_seconds,
+                "staleness_seconds": staleness,
+                "last_error": self.last_error,
+            }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.interval_seconds)
+            if self._stop.is_set():
+                break
+            self._wake.clear()
+            self.refresh_now()
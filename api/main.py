@@ -2,26 +2,53 @@
 """FastAPI backend for Financial Asset Relationship Database"""
 
 from contextlib import asynccontextmanager
-from typing import Dict, List, Optional, Any, Callable
+from typing import Collection, Dict, List, Optional, Any, Callable, Tuple, Union
 import logging
 import os
 import re
 import threading
+import time
 from datetime import timedelta
 
-from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, TypeAdapter
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
 from src.data.real_data_fetcher import RealDataFetcher
 from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_centrality import CentralityScores
+from src.logic.level_of_detail import LayoutIndex, top_k_per_source
 from src.models.financial_models import AssetClass
+from src.visualizations.static_render import SNAPSHOT_FORMATS, SNAPSHOT_RENDERERS
 
 from .auth import Token, User, authenticate_user, create_access_token, get_current_active_user
+from .compression import COMPRESSION_MIN_SIZE, CompressionMiddleware, is_compressible, negotiate_encoding
+from .export import (
+    COLUMNAR_MEDIA_TYPES,
+    EXPORT_MEDIA_TYPES,
+    assets_table,
+    columnar_export_available,
+    encode_table,
+    relationships_table,
+    stream_relationships,
+)
+from .fast_json import FastJSONResponse, dumps
+from .graph_refresh import GraphRefreshScheduler
+from .offload import ComputeBusyError, ComputeExecutor, ComputeTimeoutError
+from .graph_index import (
+    ASSET_CURSOR_TYPES,
+    RELATIONSHIP_CURSOR_TYPES,
+    AssetIndex,
+    RelationshipIndex,
+    decode_cursor,
+)
+from .response_cache import DEFAULT_CACHE_CONTROL, CachedResponse, ResponseCache, SnapshotCache, etag_matches
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -35,6 +62,36 @@ graph: Optional[AssetRelationshipGraph] = None
 graph_factory: Optional[Callable[[], AssetRelationshipGraph]] = None
 graph_lock = threading.Lock()
 
+# Monotonic counter identifying the current graph snapshot; bumped whenever the global graph is replaced
+graph_version = 0
+
+# Encoded response bodies for the current graph snapshot
+response_cache = ResponseCache()
+
+# Lookup indexes (sorted ids, per-filter id lists) for the current graph snapshot
+index_cache = SnapshotCache(max_entries=8)
+
+# Dedicated thread pool for CPU-heavy response builds, bounded in concurrency and time
+compute_executor = ComputeExecutor()
+
+# Upper bound for the `limit` query parameter on paginated endpoints
+MAX_PAGE_LIMIT = 10_000
+
+# Deepest neighborhood query allowed; contagion views rarely need more than a few hops
+MAX_NEIGHBORHOOD_HOPS = 5
+
+# Most alternative paths a single path query may request
+MAX_PATHS = 10
+
+# Above this many visible nodes the visualization subgraph is served as spatial clusters
+LOD_MAX_NODES = int(os.getenv("VISUALIZATION_LOD_MAX_NODES", "2000"))
+
+# Strongest edges kept per cluster when a clustered level is served without an explicit top_k
+LOD_CLUSTER_TOP_K = int(os.getenv("VISUALIZATION_LOD_CLUSTER_TOP_K", "8"))
+
+# Seconds between background graph rebuilds; 0 disables periodic refresh (manual triggers still work)
+GRAPH_REFRESH_INTERVAL_SECONDS = float(os.getenv("GRAPH_REFRESH_INTERVAL_SECONDS", "0"))
+
 
 def get_graph() -> AssetRelationshipGraph:
     """
@@ -43,26 +100,50 @@ def get_graph() -> AssetRelationshipGraph:
     Returns:
         AssetRelationshipGraph: The global graph instance.
     """
-    global graph
+    global graph, graph_version
     if graph is None:
         with graph_lock:
             if graph is None:
+                started_at, start = time.time(), time.perf_counter()
                 graph = _initialize_graph()
+                graph_version += 1
+                refresh_scheduler.record_refresh(started_at, time.perf_counter() - start)
                 logger.info("Graph initialized successfully")
     return graph
 
 
+def get_graph_snapshot() -> Tuple[AssetRelationshipGraph, int]:
+    """
+    Provide the global graph together with the version of the snapshot it belongs to.
+
+    Returns:
+        Tuple[AssetRelationshipGraph, int]: The global graph instance and its snapshot version.
+    """
+    g = get_graph()
+    with graph_lock:
+        if graph is g:
+            return g, graph_version
+    # The graph was replaced between the two reads; retry against the new snapshot
+    return get_graph_snapshot()
+
+
 def set_graph(graph_instance: AssetRelationshipGraph) -> None:
     """
     Set the module-level graph to the provided AssetRelationshipGraph and clear any configured graph factory.
 
+    The graph's derived structures are invalidated, so publishing an instance that was edited in place serves the
+    edits rather than structures built before them.
+
     Parameters:
         graph_instance (AssetRelationshipGraph): Graph instance to use as the global graph.
     """
-    global graph, graph_factory
+    global graph, graph_factory, graph_version
     with graph_lock:
+        if isinstance(graph_instance, AssetRelationshipGraph):
+            graph_instance.invalidate_caches()
         graph = graph_instance
         graph_factory = None
+        graph_version += 1
 
 
 def set_graph_factory(factory: Optional[Callable[[], AssetRelationshipGraph]]) -> None:
@@ -74,10 +155,32 @@ def set_graph_factory(factory: Optional[Callable[[], AssetRelationshipGraph]]) -
     Parameters:
         factory (Optional[Callable[[], AssetRelationshipGraph]]): A zero-argument callable that returns an `AssetRelationshipGraph`, or `None` to remove the factory and force recreation from defaults.
     """
-    global graph, graph_factory
+    global graph, graph_factory, graph_version
     with graph_lock:
         graph_factory = factory
         graph = None
+        graph_version += 1
+
+
+def _publish_graph(graph_instance: AssetRelationshipGraph) -> None:
+    """
+    Atomically replace the global graph with a freshly built instance, keeping any configured factory.
+
+    Requests that already hold the previous snapshot finish against it; new requests see the new graph and version.
+    Community detection on the new graph starts from the previous graph's communities so cluster ids stay stable.
+
+    Parameters:
+        graph_instance (AssetRelationshipGraph): Newly built graph to publish.
+    """
+    global graph, graph_version
+    with graph_lock:
+        previous = graph
+        if isinstance(graph_instance, AssetRelationshipGraph):
+            graph_instance.invalidate_caches()
+            if isinstance(previous, AssetRelationshipGraph):
+                graph_instance.seed_communities(previous)
+        graph = graph_instance
+        graph_version += 1
 
 
 def reset_graph() -> None:
@@ -129,12 +232,18 @@ def _should_use_real_data_fetcher() -> bool:
     return flag.strip().lower() in {"1", "true", "yes", "on"}
 
 
+# Rebuilds the graph off the request path and publishes it atomically
+refresh_scheduler = GraphRefreshScheduler(
+    build=lambda: _initialize_graph(), publish=_publish_graph, interval_seconds=GRAPH_REFRESH_INTERVAL_SECONDS
+)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Manage the application's lifespan by initialising the global graph on startup and logging shutdown.
 
-    Initialises the global asset relationship graph before the application begins handling requests; if initialisation fails the exception is re-raised to abort startup. Yields control for the application's running lifetime and logs on shutdown.
+    Initialises the global asset relationship graph before the application begins handling requests; if initialisation fails the exception is re-raised to abort startup. Starts the background refresh scheduler when `GRAPH_REFRESH_INTERVAL_SECONDS` is positive. Yields control for the application's running lifetime, then stops the scheduler and logs on shutdown.
 
     Parameters:
         app (FastAPI): The FastAPI application instance.
@@ -147,9 +256,14 @@ async def lifespan(app: FastAPI):
         logger.exception("Failed to initialize graph during startup")
         raise
 
+    if refresh_scheduler.interval_seconds:
+        refresh_scheduler.start()
+
     yield
 
     # Shutdown (cleanup if needed)
+    refresh_scheduler.stop()
+    compute_executor.shutdown()
     logger.info("Application shutdown")
 
 
@@ -162,6 +276,7 @@ app = FastAPI(
     description="REST API for Financial Asset Relationship Database",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # Add rate limiting exception handler
@@ -301,6 +416,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses; cached responses arrive precompressed and pass through untouched
+app.add_middleware(CompressionMiddleware, minimum_size=COMPRESSION_MIN_SIZE)
+
 
 def raise_asset_not_found(asset_id: str, resource_type: str = "Asset") -> None:
     """
@@ -312,13 +430,16 @@ def raise_asset_not_found(asset_id: str, resource_type: str = "Asset") -> None:
     """
     raise HTTPException(status_code=404, detail=f"{resource_type} {asset_id} not found")
 
-def serialize_asset(asset: Any, include_issuer: bool = False) -> Dict[str, Any]:
+def serialize_asset(
+    asset: Any, include_issuer: bool = False, fields: Optional[Collection[str]] = None
+) -> Dict[str, Any]:
     """
     Serialize an Asset object to a dictionary representation.
     
     Args:
         asset: Asset object to serialize
         include_issuer: Whether to include issuer_id field (for detail views)
+        fields: Optional subset of top-level keys to include; additional_fields is only built when requested
         
     Returns:
         Dictionary containing asset data with additional_fields
@@ -332,11 +453,16 @@ def serialize_asset(asset: Any, include_issuer: bool = False) -> Dict[str, Any]:
         "price": asset.price,
         "market_cap": asset.market_cap,
         "currency": asset.currency,
-        "additional_fields": {},
     }
 
+    if fields is not None:
+        asset_dict = {key: value for key, value in asset_dict.items() if key in fields}
+        if "additional_fields" not in fields:
+            return asset_dict
+    asset_dict["additional_fields"] = {}
+
     # Define field list
-    fields = [
+    additional = [
         "pe_ratio", "dividend_yield", "earnings_per_share", "book_value",
         "yield_to_maturity", "coupon_rate", "maturity_date", "credit_rating",
         "contract_size", "delivery_date", "volatility",
@@ -344,10 +470,10 @@ def serialize_asset(asset: Any, include_issuer: bool = False) -> Dict[str, Any]:
     ]
     
     if include_issuer:
-        fields.append("issuer_id")
+        additional.append("issuer_id")
 
     # Add asset-specific fields
-    for field in fields:
+    for field in additional:
         value = getattr(asset, field, None)
         if value is not None:
             asset_dict["additional_fields"][field] = value
@@ -355,7 +481,6 @@ def serialize_asset(asset: Any, include_issuer: bool = False) -> Dict[str, Any]:
     return asset_dict
 
 
-
 # Pydantic models for API responses
 class AssetResponse(BaseModel):
     id: str
@@ -376,6 +501,13 @@ class RelationshipResponse(BaseModel):
     strength: float
 
 
+class CentralityResponse(BaseModel):
+    pagerank: Dict[str, float]
+    eigenvector: Dict[str, float]
+    betweenness: Dict[str, float]
+    betweenness_samples: int
+
+
 class MetricsResponse(BaseModel):
     total_assets: int
     total_relationships: int
@@ -384,6 +516,7 @@ class MetricsResponse(BaseModel):
     max_degree: int
     network_density: float
     relationship_density: float = 0.0
+    centrality: Optional[CentralityResponse] = None
 
 
 class VisualizationDataResponse(BaseModel):
@@ -391,6 +524,181 @@ class VisualizationDataResponse(BaseModel):
     edges: List[Dict[str, Any]]
 
 
+class VisualizationColumnarResponse(BaseModel):
+    format: str
+    nodes: Dict[str, List[Any]]
+    edges: Dict[str, List[Any]]
+    relationship_types: List[str]
+
+
+class AssetPageResponse(BaseModel):
+    items: List[Dict[str, Any]]
+    total: int
+    limit: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class RelationshipPageResponse(BaseModel):
+    items: List[Dict[str, Any]]
+    total: int
+    limit: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+_ASSET_LIST_ADAPTER = TypeAdapter(List[AssetResponse])
+_RELATIONSHIP_LIST_ADAPTER = TypeAdapter(List[RelationshipResponse])
+_DICT_LIST_ADAPTER = TypeAdapter(List[Dict[str, Any]])
+
+ASSET_FIELDS = tuple(AssetResponse.model_fields)
+RELATIONSHIP_FIELDS = tuple(RelationshipResponse.model_fields)
+
+
+def _parse_fields(fields: Optional[str], allowed: Tuple[str, ...]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a comma-separated `fields=` selector into a tuple of known field names.
+
+    Parameters:
+        fields (Optional[str]): Raw query parameter value, e.g. "id,symbol,price".
+        allowed (Tuple[str, ...]): Field names the resource exposes.
+
+    Returns:
+        Optional[Tuple[str, ...]]: Requested fields in the resource's canonical order, or `None` when not given.
+
+    Raises:
+        HTTPException: 400 if the selector is empty or names an unknown field.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - set(allowed))
+    if not requested or unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid fields selector; unknown fields: {', '.join(unknown)}" if unknown else "Empty fields selector",
+        )
+    return tuple(name for name in allowed if name in requested)
+
+
+def _validate_cursor(cursor: Optional[str], key_types: Tuple[type, ...]) -> None:
+    """Raise a 400 HTTPException if `cursor` is not a well-formed pagination cursor."""
+    if cursor is None:
+        return
+    try:
+        decode_cursor(cursor, key_types)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def _get_asset_index(g: AssetRelationshipGraph, version: int) -> AssetIndex:
+    """Return the asset index for the graph snapshot, building it once per snapshot."""
+    return index_cache.get_or_build(g, version, "assets", lambda: AssetIndex.build(g.assets))
+
+
+def _get_relationship_index(g: AssetRelationshipGraph, version: int) -> RelationshipIndex:
+    """Return the relationship index for the graph snapshot, building it once per snapshot."""
+    return index_cache.get_or_build(g, version, "relationships", lambda: RelationshipIndex.build(g.relationships))
+
+
+def _get_layout_index(g: AssetRelationshipGraph, version: int) -> LayoutIndex:
+    """Return the layout index (positions, edge arrays, spatial index) for the graph snapshot, building it once."""
+
+    def build() -> LayoutIndex:
+        positions, asset_ids, asset_colors = g.get_3d_visualization_data()[:3]
+        return LayoutIndex.build(positions, asset_ids, asset_colors, g.relationships)
+
+    return index_cache.get_or_build(g, version, "layout", build)
+
+
+def _parse_bbox(bbox: Optional[str]) -> Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]]:
+    """
+    Parse a `min_x,min_y,max_x,max_y` or `min_x,min_y,min_z,max_x,max_y,max_z` bounding box.
+
+    Raises:
+        HTTPException: 400 if the box is malformed or empty.
+    """
+    if bbox is None:
+        return None
+    try:
+        values = [float(part) for part in bbox.split(",")]
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid bbox") from exc
+    if len(values) == 4:
+        lower, upper = (values[0], values[1], float("-inf")), (values[2], values[3], float("inf"))
+    elif len(values) == 6:
+        lower, upper = tuple(values[:3]), tuple(values[3:])
+    else:
+        raise HTTPException(status_code=400, detail="bbox must have 4 or 6 comma-separated numbers")
+    if any(lo > hi for lo, hi in zip(lower, upper)):
+        raise HTTPException(status_code=400, detail="bbox minimum exceeds maximum")
+    return lower, upper
+
+
+async def _run_compute(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a CPU-heavy callable on the compute executor, translating saturation and timeouts into HTTP errors.
+
+    Raises:
+        HTTPException: 503 if too many computations are queued; 504 if the computation times out.
+    """
+    try:
+        return await compute_executor.run(func, *args)
+    except ComputeBusyError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Server busy, retry later") from exc
+    except ComputeTimeoutError as exc:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail="Computation timed out") from exc
+
+
+async def _cached_response(
+    request: Request,
+    g: AssetRelationshipGraph,
+    version: int,
+    key: Tuple,
+    build: Callable[[], bytes],
+    media_type: str = "application/json",
+) -> Response:
+    """
+    Serve an encoded body from the response cache, building it on a miss.
+
+    Responses carry a strong `ETag` and `Cache-Control` header. When the request's `If-None-Match` header matches
+    the current tag, an empty `304 Not Modified` response is returned instead of the body. Bodies above the
+    compression threshold are sent in the client's preferred content coding, using the compressed bytes stored on
+    the cache entry. Building and compressing run on the compute executor so the event loop stays responsive;
+    cache hits are answered without leaving it.
+
+    Parameters:
+        request (Request): Incoming request, consulted for `If-None-Match` and `Accept-Encoding`.
+        g (AssetRelationshipGraph): Graph snapshot the body is derived from.
+        version (int): Version of the graph snapshot.
+        key (Tuple): Endpoint name followed by the query parameters that shape the body.
+        build (Callable[[], bytes]): Zero-argument callable returning the encoded body.
+        media_type (str): Content type of the body; JSON unless stated otherwise.
+
+    Returns:
+        Response: A raw response carrying the cached bytes, or a 304 response without a body.
+
+    Raises:
+        HTTPException: 503 if the compute executor is saturated; 504 if building the body times out.
+    """
+    entry: Optional[CachedResponse] = response_cache.get(g, version, key)
+    if entry is None:
+        entry = await _run_compute(response_cache.get_or_create, g, version, key, build, media_type)
+    headers = {"ETag": entry.etag, "Cache-Control": DEFAULT_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if len(entry.body) >= COMPRESSION_MIN_SIZE and is_compressible(entry.media_type):
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        if encoding is not None:
+            # A compressed representation is not byte-identical to the raw body, so its tag is weak
+            headers["ETag"] = "W/" + entry.etag
+            headers["Content-Encoding"] = encoding
+            if entry.has_compressed(encoding):
+                body = entry.compressed(encoding)
+            else:
+                body = await _run_compute(entry.compressed, encoding)
+            return Response(content=body, media_type=entry.media_type, headers=headers)
+    return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+
+
 @app.get("/")
 async def root():
     """
@@ -409,8 +717,13 @@ async def root():
             "assets": "/api/assets",
             "asset_detail": "/api/assets/{asset_id}",
             "relationships": "/api/relationships",
+            "paths": "/api/paths",
             "metrics": "/api/metrics",
             "visualization": "/api/visualization",
+            "visualization_subgraph": "/api/visualization/subgraph",
+            "visualization_snapshot": "/api/visualization/snapshot",
+            "export_relationships": "/api/export/relationships",
+            "export_columnar": "/api/export/{assets|relationships}.{arrow|parquet}",
         },
     }
 
@@ -421,37 +734,93 @@ async def health_check():
     return {"status": "healthy", "graph_initialized": True}
 
 
-@app.get("/api/assets", response_model=List[AssetResponse])
-async def get_assets(asset_class: Optional[str] = None, sector: Optional[str] = None):
+@app.get("/api/refresh/status")
+async def get_refresh_status():
+    """
+    Report background graph refresh metrics.
+
+    Returns:
+        Dict[str, Any]: The scheduler status (refresh count, failures, last duration, staleness in seconds, whether a refresh is in progress) plus the current `graph_version`.
+    """
+    status_data = refresh_scheduler.status()
+    status_data["graph_version"] = graph_version
+    return status_data
+
+
+@app.post("/api/refresh", status_code=status.HTTP_202_ACCEPTED)
+async def trigger_refresh(current_user: User = Depends(get_current_active_user)):
     """
-    List assets, optionally filtered by asset class and sector.
+    Schedule an immediate background rebuild of the graph.
+
+    The request returns at once; the current graph keeps being served until the rebuilt one is published.
 
     Parameters:
+        current_user (User): Active user injected by the authentication dependency.
+
+    Returns:
+        Dict[str, str]: `{"status": "scheduled"}`.
+    """
+    logger.info("Graph refresh requested by %s", current_user.username)
+    refresh_scheduler.trigger()
+    return {"status": "scheduled"}
+
+
+@app.get("/api/assets", response_model=Union[List[AssetResponse], AssetPageResponse])
+async def get_assets(
+    request: Request,
+    asset_class: Optional[str] = None,
+    sector: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT),
+    fields: Optional[str] = None,
+):
+    """
+    List assets ordered by id, optionally filtered by asset class and sector.
+
+    Filters are answered from per-snapshot indexes rather than a scan of every asset. The encoded body is cached per graph snapshot and query, so repeated requests skip model validation and serialization.
+
+    Parameters:
+        request (Request): Incoming request, used for conditional `If-None-Match` handling.
         asset_class (Optional[str]): Filter to include only assets whose `asset_class.value` equals this string.
         sector (Optional[str]): Filter to include only assets whose `sector` equals this string.
+        cursor (Optional[str]): Opaque cursor from a previous page's `next_cursor`; resumes after that asset.
+        limit (Optional[int]): Maximum number of assets to return.
+        fields (Optional[str]): Comma-separated subset of asset fields to return, e.g. "id,symbol,price". `additional_fields` is only serialized when selected.
 
     Returns:
-        List[AssetResponse]: AssetResponse objects matching the filters. Each object's `additional_fields` contains any non-null, asset-type-specific attributes as defined in the respective asset model classes.
+        List[AssetResponse] | AssetPageResponse: AssetResponse objects matching the filters. Each object's `additional_fields` contains any non-null, asset-type-specific attributes as defined in the respective asset model classes. When `cursor` or `limit` is given the list is wrapped in a page object with `items`, `total`, `limit` and `next_cursor` (null on the last page).
+
+    Raises:
+        HTTPException: 400 for an invalid cursor or fields selector; 500 for unexpected errors.
     """
     try:
-        g = get_graph()
-        assets = []
-
-        for asset_id, asset in g.assets.items():
-            # Apply filters
-            if asset_class and asset.asset_class.value != asset_class:
-                continue
-            if sector and asset.sector != sector:
-                continue
-
-            # Build response using serialization utility
-            asset_dict = serialize_asset(asset)
-            assets.append(AssetResponse(**asset_dict))
+        selected_fields = _parse_fields(fields, ASSET_FIELDS)
+        _validate_cursor(cursor, ASSET_CURSOR_TYPES)
+        g, version = get_graph_snapshot()
+        paginated = cursor is not None or limit is not None
+
+        def build() -> bytes:
+            page = _get_asset_index(g, version).page(asset_class, sector, cursor, limit)
+            assets = g.assets
+
+            if not paginated and selected_fields is None:
+                # Build response using serialization utility
+                return _ASSET_LIST_ADAPTER.dump_json([AssetResponse(**serialize_asset(assets[i])) for i in page.items])
+
+            items = [serialize_asset(assets[asset_id], fields=selected_fields) for asset_id in page.items]
+            if not paginated:
+                return _DICT_LIST_ADAPTER.dump_json(items)
+            return AssetPageResponse(
+                items=items, total=page.total, limit=limit, next_cursor=page.next_cursor
+            ).model_dump_json().encode()
+
+        key = ("assets", asset_class, sector, cursor, limit, selected_fields)
+        return await _cached_response(request, g, version, key, build)
     except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
         logger.exception("Error getting assets:")
         raise HTTPException(status_code=500, detail=str(e)) from e
-    else:
-        return assets
 
 
 @app.get("/api/assets/{asset_id}", response_model=AssetResponse)
@@ -524,37 +893,216 @@ async def get_asset_relationships(asset_id: str):
         return relationships
 
 
-@app.get("/api/relationships", response_model=List[RelationshipResponse])
-async def get_all_relationships():
+@app.get("/api/assets/{asset_id}/neighborhood")
+async def get_asset_neighborhood(
+    request: Request,
+    asset_id: str,
+    hops: int = Query(1, ge=0, le=MAX_NEIGHBORHOOD_HOPS),
+    relationship_types: Optional[str] = None,
+    min_strength: float = Query(0.0, ge=0.0),
+    direction: str = Query("both"),
+):
     """
-    List all directed relationships in the initialized asset graph.
+    Return the k-hop neighborhood of an asset as an induced subgraph.
+
+    Traverses outgoing and/or incoming relationships breadth-first over the graph's compact adjacency. The encoded body is cached per graph snapshot and query.
+
+    Parameters:
+        request (Request): Incoming request, used for conditional `If-None-Match` handling.
+        asset_id (str): Asset to start from.
+        hops (int): Maximum number of hops.
+        relationship_types (Optional[str]): Comma-separated relationship types to follow; all types when omitted.
+        min_strength (float): Only follow relationships at least this strong.
+        direction (str): "out", "in" or "both" (default).
 
     Returns:
-        List[RelationshipResponse]: List of relationships where each item contains `source_id`, `target_id`, `relationship_type`, and `strength`.
+        Response: JSON with `center`, `nodes` (each with `id` and `hop`) and `edges` (each with `source`, `target`, `relationship_type` and `strength`).
+
+    Raises:
+        HTTPException: 400 for an invalid direction; 404 if the asset is not found; 500 for unexpected errors.
     """
     try:
-        g = get_graph()
-        relationships = []
+        if direction not in ("out", "in", "both"):
+            raise HTTPException(status_code=400, detail="direction must be one of: out, in, both")
+        rel_types = (
+            tuple(sorted({t.strip() for t in relationship_types.split(",") if t.strip()}))
+            if relationship_types
+            else None
+        )
+        g, version = get_graph_snapshot()
+        if asset_id not in g.assets:
+            raise_asset_not_found(asset_id)
 
-        for source_id, rels in g.relationships.items():
-            for target_id, rel_type, strength in rels:
-                relationships.append(
-                    RelationshipResponse(
-                        source_id=source_id, target_id=target_id, relationship_type=rel_type, strength=strength
-                    )
+        def build() -> bytes:
+            subgraph = g.neighborhood(asset_id, hops, rel_types, min_strength, direction)
+            return dumps(
+                {
+                    "center": subgraph.center,
+                    "nodes": [{"id": node_id, "hop": hop} for node_id, hop in zip(subgraph.nodes, subgraph.hops)],
+                    "edges": [
+                        {"source": source_id, "target": target_id, "relationship_type": rel_type, "strength": strength}
+                        for source_id, target_id, rel_type, strength in subgraph.edges
+                    ],
+                }
+            )
+
+        key = ("neighborhood", asset_id, hops, rel_types, min_strength, direction)
+        return await _cached_response(request, g, version, key, build)
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
+        logger.exception("Error getting asset neighborhood:")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.get("/api/paths")
+async def get_paths(
+    request: Request,
+    source: str,
+    target: str,
+    k: int = Query(1, ge=1, le=MAX_PATHS),
+    relationship_types: Optional[str] = None,
+    min_strength: float = Query(0.0, ge=0.0),
+    direction: str = Query("both"),
+):
+    """
+    Explain how two assets are connected by their strongest relationship paths.
+
+    Paths are ranked by the product of relationship strengths (shortest paths over `-log(strength)`); alternatives beyond the first are loopless and distinct. The encoded body is cached per graph snapshot and query.
+
+    Parameters:
+        request (Request): Incoming request, used for conditional `If-None-Match` handling.
+        source (str): Asset the paths start from.
+        target (str): Asset the paths end at.
+        k (int): Number of paths to return.
+        relationship_types (Optional[str]): Comma-separated relationship types to follow; all types when omitted.
+        min_strength (float): Only follow relationships at least this strong.
+        direction (str): "out" follows relationships forwards, "in" backwards, "both" (default) either way.
+
+    Returns:
+        Response: JSON with `source`, `target` and `paths`, each path having `nodes`, `edges` (`source`, `target`, `relationship_type`, `strength`), `hops`, `cost` and `strength`. `paths` is empty when the assets are not connected.
+
+    Raises:
+        HTTPException: 400 for an invalid direction; 404 if either asset is not found; 500 for unexpected errors.
+    """
+    try:
+        if direction not in ("out", "in", "both"):
+            raise HTTPException(status_code=400, detail="direction must be one of: out, in, both")
+        rel_types = (
+            tuple(sorted({t.strip() for t in relationship_types.split(",") if t.strip()}))
+            if relationship_types
+            else None
+        )
+        g, version = get_graph_snapshot()
+        for asset_id in (source, target):
+            if asset_id not in g.assets:
+                raise_asset_not_found(asset_id)
+
+        def build() -> bytes:
+            paths = g.shortest_paths(source, target, k, rel_types, min_strength, direction)
+            return dumps(
+                {
+                    "source": source,
+                    "target": target,
+                    "paths": [
+                        {
+                            "nodes": path.nodes,
+                            "edges": [
+                                {"source": s, "target": t, "relationship_type": rel_type, "strength": strength}
+                                for s, t, rel_type, strength in path.edges
+                            ],
+                            "hops": path.hops,
+                            "cost": path.cost,
+                            "strength": path.strength,
+                        }
+                        for path in paths
+                    ],
+                }
+            )
+
+        key = ("paths", source, target, k, rel_types, min_strength, direction)
+        return await _cached_response(request, g, version, key, build)
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
+        logger.exception("Error finding paths:")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.get("/api/relationships", response_model=Union[List[RelationshipResponse], RelationshipPageResponse])
+async def get_all_relationships(
+    request: Request,
+    relationship_type: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT),
+    fields: Optional[str] = None,
+):
+    """
+    List directed relationships in the initialized asset graph, ordered by source, target and type.
+
+    The encoded body is cached per graph snapshot and query.
+
+    Parameters:
+        request (Request): Incoming request, used for conditional `If-None-Match` handling.
+        relationship_type (Optional[str]): Filter to include only relationships of this type.
+        cursor (Optional[str]): Opaque cursor from a previous page's `next_cursor`; resumes after that relationship.
+        limit (Optional[int]): Maximum number of relationships to return.
+        fields (Optional[str]): Comma-separated subset of relationship fields to return.
+
+    Returns:
+        List[RelationshipResponse] | RelationshipPageResponse: List of relationships where each item contains `source_id`, `target_id`, `relationship_type`, and `strength`. When `cursor` or `limit` is given the list is wrapped in a page object with `items`, `total`, `limit` and `next_cursor`.
+
+    Raises:
+        HTTPException: 400 for an invalid cursor or fields selector; 500 for unexpected errors.
+    """
+    try:
+        selected_fields = _parse_fields(fields, RELATIONSHIP_FIELDS)
+        _validate_cursor(cursor, RELATIONSHIP_CURSOR_TYPES)
+        g, version = get_graph_snapshot()
+        paginated = cursor is not None or limit is not None
+
+        def build() -> bytes:
+            page = _get_relationship_index(g, version).page(relationship_type, cursor, limit)
+
+            if not paginated and selected_fields is None:
+                return _RELATIONSHIP_LIST_ADAPTER.dump_json(
+                    [
+                        RelationshipResponse(
+                            source_id=source_id, target_id=target_id, relationship_type=rel_type, strength=strength
+                        )
+                        for source_id, target_id, rel_type, strength in page.items
+                    ]
                 )
+
+            items = [dict(zip(RELATIONSHIP_FIELDS, edge)) for edge in page.items]
+            if selected_fields is not None:
+                items = [{name: item[name] for name in selected_fields} for item in items]
+            if not paginated:
+                return _DICT_LIST_ADAPTER.dump_json(items)
+            return RelationshipPageResponse(
+                items=items, total=page.total, limit=limit, next_cursor=page.next_cursor
+            ).model_dump_json().encode()
+
+        key = ("relationships", relationship_type, cursor, limit, selected_fields)
+        return await _cached_response(request, g, version, key, build)
     except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
         logger.exception("Error getting relationships:")
         raise HTTPException(status_code=500, detail=str(e)) from e
-    else:
-        return relationships
 
 
 @app.get("/api/metrics", response_model=MetricsResponse)
-async def get_metrics():
+async def get_metrics(request: Request, include_centrality: bool = False):
     """
     Aggregate network metrics and counts of assets by asset class.
 
+    The encoded body is cached per graph snapshot and served with an `ETag` for conditional requests. Centrality scores are computed once per graph snapshot.
+
+    Parameters:
+        request (Request): Incoming request, used for conditional `If-None-Match` handling.
+        include_centrality (bool): Add per-asset PageRank, eigenvector and sampled betweenness centrality.
+
     Returns:
         MetricsResponse: Aggregated metrics including:
             - total_assets: total number of assets.
@@ -564,90 +1112,444 @@ async def get_metrics():
             - max_degree: maximum node degree (int).
             - network_density: network density (float).
             - relationship_density: relationship density (float).
+            - centrality: per-asset `pagerank`, `eigenvector` and `betweenness` scores plus `betweenness_samples`, when requested.
 
     Raises:
         HTTPException: with status code 500 if metrics cannot be obtained.
     """
     try:
-        g = get_graph()
-        metrics = g.calculate_metrics()
-
-        # Count assets by class
-        asset_classes = {}
-        for asset in g.assets.values():
-            class_name = asset.asset_class.value
-            asset_classes[class_name] = asset_classes.get(class_name, 0) + 1
-
-        return MetricsResponse(
-            total_assets=metrics.get("total_assets", 0),
-            total_relationships=metrics.get("total_relationships", 0),
-            asset_classes=asset_classes,
-            avg_degree=metrics.get("avg_degree", 0.0),
-            max_degree=metrics.get("max_degree", 0),
-            network_density=metrics.get("network_density", 0.0),
-            relationship_density=metrics.get("relationship_density", 0.0),
-        )
+        g, version = get_graph_snapshot()
+
+        def build() -> bytes:
+            metrics = g.calculate_metrics()
+
+            # Count assets by class
+            asset_classes = {}
+            for asset in g.assets.values():
+                class_name = asset.asset_class.value
+                asset_classes[class_name] = asset_classes.get(class_name, 0) + 1
+
+            return MetricsResponse(
+                total_assets=metrics.get("total_assets", 0),
+                total_relationships=metrics.get("total_relationships", 0),
+                asset_classes=asset_classes,
+                avg_degree=metrics.get("avg_degree", 0.0),
+                max_degree=metrics.get("max_degree", 0),
+                network_density=metrics.get("network_density", 0.0),
+                relationship_density=metrics.get("relationship_density", 0.0),
+                centrality=_centrality_response(g.centrality()) if include_centrality else None,
+            ).model_dump_json(exclude_none=True).encode()
+
+        return await _cached_response(request, g, version, ("metrics", include_centrality), build)
     except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
         logger.exception("Error getting metrics:")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@app.get("/api/visualization", response_model=VisualizationDataResponse)
-async def get_visualization_data():
+def _centrality_response(scores: CentralityScores) -> CentralityResponse:
+    """Convert centrality arrays into per-asset score mappings."""
+    per_asset = scores.as_dict()
+    return CentralityResponse(
+        pagerank=per_asset["pagerank"],
+        eigenvector=per_asset["eigenvector"],
+        betweenness=per_asset["betweenness"],
+        betweenness_samples=scores.betweenness_samples,
+    )
+
+
+def _encode_visualization_rows(g: AssetRelationshipGraph, positions, asset_ids, asset_colors) -> bytes:
+    """Encode visualization data as lists of node and edge objects."""
+    # Convert the whole position matrix in one pass instead of boxing each coordinate with float()
+    coordinates = np.asarray(positions, dtype=np.float64).reshape(-1, 3).tolist()
+    assets = g.assets
+    nodes = []
+    for asset_id, (x, y, z), color in zip(asset_ids, coordinates, asset_colors):
+        asset = assets[asset_id]
+        nodes.append(
+            {
+                "id": asset_id,
+                "name": asset.name,
+                "symbol": asset.symbol,
+                "asset_class": asset.asset_class.value,
+                "x": x,
+                "y": y,
+                "z": z,
+                "color": color,
+                "size": 5,
+            }
+        )
+
+    edges = []
+    # Build edges directly from graph.relationships to avoid rebuilding from intermediate data structures
+    # Only include edges where both source and target are in the asset_ids list
+    asset_id_set = set(asset_ids)
+    for source_id in g.relationships:
+        if source_id not in asset_id_set:
+            continue
+        for target_id, rel_type, strength in g.relationships[source_id]:
+            if target_id in asset_id_set:
+                edges.append(
+                    {
+                        "source": source_id,
+                        "target": target_id,
+                        "relationship_type": rel_type,
+                        "strength": float(strength),
+                    }
+                )
+
+    # The payload is assembled from trusted graph data, so encode it directly instead of validating the model
+    return dumps({"nodes": nodes, "edges": edges})
+
+
+def _encode_visualization_columnar(g: AssetRelationshipGraph, positions, asset_ids, asset_colors) -> bytes:
+    """Encode visualization data as parallel arrays with index-based edges and a relationship-type table."""
+    coordinates = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    assets = g.assets
+    ordered = [assets[asset_id] for asset_id in asset_ids]
+    node_index = {asset_id: i for i, asset_id in enumerate(asset_ids)}
+
+    type_codes: Dict[str, int] = {}
+    sources: List[int] = []
+    targets: List[int] = []
+    types: List[int] = []
+    strengths: List[float] = []
+    for source_id, rels in g.relationships.items():
+        source_index = node_index.get(source_id)
+        if source_index is None:
+            continue
+        for target_id, rel_type, strength in rels:
+            target_index = node_index.get(target_id)
+            if target_index is None:
+                continue
+            sources.append(source_index)
+            targets.append(target_index)
+            types.append(type_codes.setdefault(rel_type, len(type_codes)))
+            strengths.append(strength)
+
+    return dumps(
+        {
+            "format": "columnar",
+            "nodes": {
+                "id": list(asset_ids),
+                "name": [asset.name for asset in ordered],
+                "symbol": [asset.symbol for asset in ordered],
+                "asset_class": [asset.asset_class.value for asset in ordered],
+                "x": np.ascontiguousarray(coordinates[:, 0]),
+                "y": np.ascontiguousarray(coordinates[:, 1]),
+                "z": np.ascontiguousarray(coordinates[:, 2]),
+                "color": list(asset_colors),
+                "size": [5] * len(ordered),
+                "cluster": np.ascontiguousarray(g.communities().labels_for(asset_ids), dtype=np.int32),
+            },
+            "edges": {
+                "source": np.asarray(sources, dtype=np.int32),
+                "target": np.asarray(targets, dtype=np.int32),
+                "relationship_type": np.asarray(types, dtype=np.int32),
+                "strength": np.asarray(strengths, dtype=np.float64),
+            },
+            "relationship_types": list(type_codes),
+        }
+    )
+
+
+VISUALIZATION_ENCODERS = {
+    "rows": _encode_visualization_rows,
+    "columnar": _encode_visualization_columnar,
+}
+
+
+@app.get("/api/visualization", response_model=Union[VisualizationDataResponse, VisualizationColumnarResponse])
+async def get_visualization_data(request: Request, payload_format: str = Query("rows", alias="format")):
     """
     Provide nodes and edges prepared for 3D visualization of the asset graph.
 
-    Builds a list of node dictionaries (each with id, name, symbol, asset_class, x, y, z, color, size) and a list of edge dictionaries (each with source, target, relationship_type, strength) suitable for the API response.
+    The default `rows` format returns a list of node dictionaries (each with id, name, symbol, asset_class, x, y, z, color, size) and a list of edge dictionaries (each with source, target, relationship_type, strength). The `columnar` format returns the same data as parallel arrays: node attributes keyed by name, edges as integer node indices, and relationship types as codes into the `relationship_types` table. The encoded body is cached per graph snapshot and format.
+
+    Parameters:
+        request (Request): Incoming request, used for conditional `If-None-Match` handling.
+        payload_format (str): "rows" (default) or "columnar"; passed as the `format` query parameter.
 
     Returns:
-        VisualizationDataResponse: An object with `nodes` (list of node dicts) and `edges` (list of edge dicts).
+        VisualizationDataResponse | VisualizationColumnarResponse: Node and edge data in the requested layout.
 
     Raises:
-        HTTPException: If visualization data cannot be retrieved or processed; results in a 500 status with the error detail.
+        HTTPException: 400 for an unsupported format; 500 if visualization data cannot be retrieved or processed.
     """
     try:
-        g = get_graph()
-        # get_3d_visualization_data returns: (positions, asset_ids, asset_colors, asset_text, (edges_x, edges_y, edges_z)), but edge coordinates are not used in this endpoint
-        positions, asset_ids, asset_colors, asset_text = g.get_3d_visualization_data()[:4]
+        encode = VISUALIZATION_ENCODERS.get(payload_format)
+        if encode is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported format '{payload_format}'. Supported: {', '.join(VISUALIZATION_ENCODERS)}",
+            )
+        g, version = get_graph_snapshot()
+
+        def build() -> bytes:
+            # get_3d_visualization_data returns: (positions, asset_ids, asset_colors, asset_text, (edges_x, edges_y, edges_z)), but edge coordinates are not used in this endpoint
+            positions, asset_ids, asset_colors, asset_text = g.get_3d_visualization_data()[:4]
+            return encode(g, positions, asset_ids, asset_colors)
+
+        return await _cached_response(request, g, version, ("visualization", payload_format), build)
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
+        logger.exception("Error getting visualization data:")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
 
-        nodes = []
-        for i, asset_id in enumerate(asset_ids):
-            asset = g.assets[asset_id]
-            nodes.append(
+@app.get("/api/visualization/subgraph")
+async def get_visualization_subgraph(
+    request: Request,
+    bbox: Optional[str] = None,
+    min_strength: float = Query(0.0, ge=0.0),
+    top_k: Optional[int] = Query(None, ge=1, le=1000),
+    max_nodes: int = Query(LOD_MAX_NODES, ge=1, le=MAX_PAGE_LIMIT),
+    level: str = Query("auto"),
+):
+    """
+    Serve the part of the visualization visible in a viewport, at a level of detail that bounds the payload size.
+
+    Nodes are selected with a spatial index over the cached layout, and edges are thinned by strength and per-node rank. When more than `max_nodes` nodes are visible (or `level=clusters`), nodes are merged into at most `max_nodes` spatial clusters and parallel edges between clusters are merged. The payload uses the columnar layout of `/api/visualization?format=columnar` and is cached per graph snapshot and query.
+
+    Parameters:
+        request (Request): Incoming request, used for conditional `If-None-Match` handling.
+        bbox (Optional[str]): Viewport as `min_x,min_y,max_x,max_y` or `min_x,min_y,min_z,max_x,max_y,max_z`; the whole layout when omitted.
+        min_strength (float): Drop edges weaker than this.
+        top_k (Optional[int]): Keep at most this many of the strongest outgoing edges per node or cluster.
+        max_nodes (int): Largest number of nodes served individually.
+        level (str): "auto" (default), "nodes" or "clusters".
+
+    Returns:
+        Response: A columnar payload with `level` ("nodes" or "clusters"), `visible_nodes`, `nodes`, `edges` and `relationship_types`. Cluster nodes carry `count` instead of asset attributes, and cluster edges carry `weight` and `count`.
+
+    Raises:
+        HTTPException: 400 for an invalid bbox or level; 500 for unexpected errors.
+    """
+    try:
+        if level not in ("auto", "nodes", "clusters"):
+            raise HTTPException(status_code=400, detail="level must be one of: auto, nodes, clusters")
+        bounds = _parse_bbox(bbox)
+        g, version = get_graph_snapshot()
+
+        def build() -> bytes:
+            layout = _get_layout_index(g, version)
+            nodes = layout.query_bbox(*bounds) if bounds else np.arange(layout.node_count)
+            clustered = level == "clusters" or (level == "auto" and nodes.size > max_nodes)
+
+            if not clustered:
+                edges = layout.select_edges(nodes, min_strength, top_k)
+                node_position = np.full(layout.node_count, -1, dtype=np.int32)
+                node_position[nodes] = np.arange(nodes.size, dtype=np.int32)
+                ids = [layout.asset_ids[i] for i in nodes]
+                assets = [g.assets[asset_id] for asset_id in ids]
+                coordinates = layout.positions[nodes]
+                return dumps(
+                    {
+                        "level": "nodes",
+                        "visible_nodes": int(nodes.size),
+                        "nodes": {
+                            "id": ids,
+                            "name": [asset.name for asset in assets],
+                            "symbol": [asset.symbol for asset in assets],
+                            "asset_class": [asset.asset_class.value for asset in assets],
+                            "x": np.ascontiguousarray(coordinates[:, 0]),
+                            "y": np.ascontiguousarray(coordinates[:, 1]),
+                            "z": np.ascontiguousarray(coordinates[:, 2]),
+                            "color": [layout.colors[i] for i in nodes],
+                            "size": [5] * len(ids),
+                        },
+                        "edges": {
+                            "source": node_position[layout.edge_source[edges]],
+                            "target": node_position[layout.edge_target[edges]],
+                            "relationship_type": layout.edge_type[edges],
+                            "strength": layout.edge_strength[edges],
+                        },
+                        "relationship_types": layout.relationship_types,
+                    }
+                )
+
+            edges = layout.select_edges(nodes, min_strength)
+            clusters = layout.aggregate(nodes, edges, max_nodes)
+            kept = top_k_per_source(clusters.edge_source, clusters.edge_weight, top_k or LOD_CLUSTER_TOP_K)
+            return dumps(
                 {
-                    "id": asset_id,
-                    "name": asset.name,
-                    "symbol": asset.symbol,
-                    "asset_class": asset.asset_class.value,
-                    "x": float(positions[i, 0]),
-                    "y": float(positions[i, 1]),
-                    "z": float(positions[i, 2]),
-                    "color": asset_colors[i],
-                    "size": 5,
+                    "level": "clusters",
+                    "visible_nodes": int(nodes.size),
+                    "nodes": {
+                        "id": [f"cluster-{i}" for i in range(clusters.counts.size)],
+                        "x": np.ascontiguousarray(clusters.centroids[:, 0]),
+                        "y": np.ascontiguousarray(clusters.centroids[:, 1]),
+                        "z": np.ascontiguousarray(clusters.centroids[:, 2]),
+                        "color": clusters.colors,
+                        "count": clusters.counts,
+                    },
+                    "edges": {
+                        "source": clusters.edge_source[kept],
+                        "target": clusters.edge_target[kept],
+                        "weight": clusters.edge_weight[kept],
+                        "count": clusters.edge_count[kept],
+                    },
+                    "relationship_types": layout.relationship_types,
                 }
             )
 
-        edges = []
-        # Build edges directly from graph.relationships to avoid rebuilding from intermediate data structures
-        # Only include edges where both source and target are in the asset_ids list
-        asset_id_set = set(asset_ids)
-        for source_id in g.relationships:
-            if source_id not in asset_id_set:
-                continue
-            for target_id, rel_type, strength in g.relationships[source_id]:
-                if target_id in asset_id_set:
-                    edges.append(
-                        {
-                            "source": source_id,
-                            "target": target_id,
-                            "relationship_type": rel_type,
-                            "strength": float(strength),
-                        }
-                    )
+        key = ("visualization_subgraph", bounds, min_strength, top_k, max_nodes, level)
+        return await _cached_response(request, g, version, key, build)
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
+        logger.exception("Error getting visualization subgraph:")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.get("/api/visualization/snapshot")
+async def get_visualization_snapshot(
+    request: Request,
+    image_format: str = Query("png", alias="format"),
+    width: int = Query(800, ge=64, le=4096),
+    height: int = Query(600, ge=64, le=4096),
+    relationship_types: Optional[str] = None,
+    min_strength: float = Query(0.0, ge=0.0),
+):
+    """
+    Render a static PNG or SVG picture of the network from the cached layout and edge arrays.
+
+    Rendering runs headless in NumPy without a browser or external service. The image is cached per graph snapshot, size and filter set, so repeated requests for the same picture are served from the response cache.
+
+    Parameters:
+        request (Request): Incoming request, used for conditional `If-None-Match` handling.
+        image_format (str): "png" (default) or "svg"; passed as the `format` query parameter.
+        width (int): Image width in pixels.
+        height (int): Image height in pixels.
+        relationship_types (Optional[str]): Comma-separated relationship types to draw; every type when omitted.
+        min_strength (float): Drop edges weaker than this.
+
+    Returns:
+        Response: The image with content type `image/png` or `image/svg+xml`.
 
-        return VisualizationDataResponse(nodes=nodes, edges=edges)
+    Raises:
+        HTTPException: 400 for an unsupported format; 500 for unexpected errors.
+    """
+    try:
+        render = SNAPSHOT_RENDERERS.get(image_format)
+        if render is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported format '{image_format}'. Supported: {', '.join(SNAPSHOT_RENDERERS)}",
+            )
+        types = None
+        if relationship_types is not None:
+            types = tuple(sorted({part.strip() for part in relationship_types.split(",") if part.strip()}))
+        g, version = get_graph_snapshot()
+
+        def build() -> bytes:
+            layout = _get_layout_index(g, version)
+            edges = layout.select_edges(min_strength=min_strength)
+            if types is not None:
+                codes = [code for code, rel_type in enumerate(layout.relationship_types) if rel_type in types]
+                edges = edges[np.isin(layout.edge_type[edges], codes)]
+            return render(layout, edges, width=width, height=height)
+
+        key = ("visualization_snapshot", image_format, width, height, types, min_strength)
+        return await _cached_response(request, g, version, key, build, SNAPSHOT_FORMATS[image_format])
     except Exception as e:
-        logger.exception("Error getting visualization data:")
+        if isinstance(e, HTTPException):
+            raise
+        logger.exception("Error rendering visualization snapshot:")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.get("/api/export/relationships")
+async def export_relationships(
+    export_format: str = Query("ndjson", alias="format"),
+    relationship_type: Optional[str] = None,
+):
+    """
+    Stream every directed relationship as NDJSON or CSV.
+
+    Rows are generated directly from the graph's adjacency lists and written in fixed-size chunks, so the full export is never held in memory. The stream is bound to the graph snapshot current when the request arrived.
+
+    Parameters:
+        export_format (str): Output format, "ndjson" (default) or "csv"; passed as the `format` query parameter.
+        relationship_type (Optional[str]): Only export relationships of this type.
+
+    Returns:
+        StreamingResponse: Chunked body with one relationship (`source_id`, `target_id`, `relationship_type`, `strength`) per line.
+
+    Raises:
+        HTTPException: 400 for an unsupported format; 500 for unexpected errors.
+    """
+    try:
+        media_type = EXPORT_MEDIA_TYPES.get(export_format)
+        if media_type is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported format '{export_format}'. Supported: {', '.join(EXPORT_MEDIA_TYPES)}",
+            )
+        g = get_graph()
+        chunks = stream_relationships(g.relationships, export_format, relationship_type)
+        return StreamingResponse(
+            chunks,
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="relationships.{export_format}"'},
+        )
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
+        logger.exception("Error exporting relationships:")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.get("/api/export/{dataset}.{export_format}")
+async def export_columnar(
+    request: Request, dataset: str, export_format: str, relationship_type: Optional[str] = None
+):
+    """
+    Export the asset table or the edge list as an Arrow IPC stream or a Parquet file.
+
+    Columns are built from the graph in one pass and serialized without a JSON round trip, so clients can load them
+    straight into a DataFrame. The encoded file is cached per graph snapshot and served with an `ETag`.
+
+    Parameters:
+        request (Request): Incoming request, used for conditional `If-None-Match` handling.
+        dataset (str): "assets" or "relationships".
+        export_format (str): "arrow" or "parquet".
+        relationship_type (Optional[str]): For the relationships dataset, only export edges of this type.
+
+    Returns:
+        Response: The encoded table with an Arrow or Parquet content type.
+
+    Raises:
+        HTTPException: 404 for an unknown dataset or format; 501 if pyarrow is not installed; 500 for unexpected errors.
+    """
+    try:
+        media_type = COLUMNAR_MEDIA_TYPES.get(export_format)
+        if dataset not in ("assets", "relationships") or media_type is None:
+            raise HTTPException(status_code=404, detail=f"Unknown export '{dataset}.{export_format}'")
+        if not columnar_export_available():
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="Arrow and Parquet exports require the optional 'pyarrow' package",
+            )
+        g, version = get_graph_snapshot()
+
+        def build() -> bytes:
+            if dataset == "assets":
+                table = assets_table(g.assets, g.communities().as_dict())
+            else:
+                table = relationships_table(g.relationships, relationship_type)
+            return encode_table(table, export_format)
+
+        key = ("export", dataset, export_format, relationship_type if dataset == "relationships" else None)
+        response = await _cached_response(request, g, version, key, build, media_type)
+        response.headers["Content-Disposition"] = f'attachment; filename="{dataset}.{export_format}"'
+        return response
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
+        logger.exception("Error exporting %s:", dataset)
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
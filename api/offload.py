@@ -0,0 +1,116 @@
+"""Bounded thread-pool offload for CPU-heavy request work, keeping the event loop responsive."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+# Worker threads dedicated to graph computations
+COMPUTE_WORKERS = int(os.getenv("API_COMPUTE_WORKERS", "4"))
+
+# Seconds a request waits for its computation (including time queued) before giving up
+COMPUTE_TIMEOUT_SECONDS = float(os.getenv("API_COMPUTE_TIMEOUT_SECONDS", "30"))
+
+# Computations allowed to wait for a worker before new ones are rejected
+COMPUTE_MAX_PENDING = int(os.getenv("API_COMPUTE_MAX_PENDING", str(COMPUTE_WORKERS * 8)))
+
+
+class ComputeTimeoutError(TimeoutError):
+    """Raised when an offloaded computation does not finish within the request timeout."""
+
+
+class ComputeBusyError(RuntimeError):
+    """Raised when too many computations are already queued."""
+
+
+class ComputeExecutor:
+    """
+    Run blocking callables on a dedicated thread pool with admission control and a per-call timeout.
+
+    A timed-out computation keeps running to completion on its worker (threads cannot be interrupted); only the
+    waiting request gives up. Its result still lands in any cache the callable writes to.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = COMPUTE_WORKERS,
+        timeout_seconds: float = COMPUTE_TIMEOUT_SECONDS,
+        max_pending: int = COMPUTE_MAX_PENDING,
+    ) -> None:
+        """
+        Create an executor; worker threads are started lazily.
+
+        Parameters:
+            max_workers (int): Maximum computations running at once.
+            timeout_seconds (float): Default seconds to wait for a result.
+            max_pending (int): Maximum computations admitted but not yet finished beyond `max_workers`.
+        """
+        self.max_workers = max(1, max_workers)
+        self.timeout_seconds = timeout_seconds
+        self.max_pending = max(0, max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._active = 0
+
+    @property
+    def active(self) -> int:
+        """Number of computations admitted and not yet finished."""
+        with self._lock:
+            return self._active
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="api-compute")
+            return self._executor
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self._active >= self.max_workers + self.max_pending:
+                raise ComputeBusyError("Too many concurrent computations")
+            self._active += 1
+
+    def _release(self, _future: Any = None) -> None:
+        with self._lock:
+            self._active -= 1
+
+    async def run(self, func: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Run `func(*args)` on a worker thread and await its result.
+
+        Parameters:
+            func (Callable[..., Any]): Blocking callable to run.
+            *args (Any): Positional arguments for `func`.
+            timeout (Optional[float]): Seconds to wait; defaults to the executor's timeout.
+
+        Returns:
+            Any: The callable's return value.
+
+        Raises:
+            ComputeBusyError: If the executor is saturated.
+            ComputeTimeoutError: If the result is not ready in time.
+        """
+        self._admit()
+        try:
+            future = self._get_executor().submit(functools.partial(func, *args))
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self.timeout_seconds if timeout is None else timeout
+            )
+        except asyncio.TimeoutError as exc:
+            raise ComputeTimeoutError("Computation timed out") from exc
+
+    def shutdown(self) -> None:
+        """Stop accepting work and release the worker threads once running computations finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,228 @@
+"""Version-keyed cache of encoded API response bodies."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .compression import compress
+
+# Cache-Control sent with cacheable graph responses; clients may store them but must revalidate with the ETag
+DEFAULT_CACHE_CONTROL = os.getenv("RESPONSE_CACHE_CONTROL", "no-cache")
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Compute a strong entity tag for an encoded body.
+
+    The tag is a digest of the exact bytes, so every worker serving the same graph snapshot emits the same tag.
+
+    Parameters:
+        body (bytes): Encoded response body.
+
+    Returns:
+        str: Quoted entity tag suitable for the `ETag` header.
+    """
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Decide whether an `If-None-Match` header value matches `etag`.
+
+    Uses the weak comparison mandated for `If-None-Match`, so a `W/` prefix on either side is ignored.
+
+    Parameters:
+        if_none_match (Optional[str]): Raw header value, possibly a comma-separated list or `*`.
+        etag (str): Current entity tag of the resource.
+
+    Returns:
+        bool: True if the client's cached representation is still current, False otherwise.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == current:
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    Encoded response body ready to be written to the wire, with its entity tag.
+
+    Compressed variants are produced on first use and kept alongside the raw body, so each graph snapshot is
+    compressed at most once per content coding.
+    """
+
+    body: bytes
+    media_type: str = "application/json"
+    etag: str = field(default="")
+    _compressed: Dict[str, bytes] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.etag:
+            object.__setattr__(self, "etag", compute_etag(self.body))
+
+    def has_compressed(self, encoding: str) -> bool:
+        """Return True if the body has already been compressed with `encoding`."""
+        return encoding in self._compressed
+
+    def compressed(self, encoding: str) -> bytes:
+        """
+        Return the body encoded with `encoding`, compressing it on the first request for that coding.
+
+        Parameters:
+            encoding (str): Content coding, "br" or "gzip".
+
+        Returns:
+            bytes: The compressed body.
+        """
+        body = self._compressed.get(encoding)
+        if body is None:
+            # Concurrent first requests may both compress; the results are identical so either may win
+            body = self._compressed.setdefault(encoding, compress(self.body, encoding))
+        return body
+
+
+class SnapshotCache:
+    """
+    Thread-safe LRU cache bound to a single graph snapshot.
+
+    The cache remembers which graph object and version its entries were built from; as soon as a newer
+    snapshot is seen every entry is discarded, so a value derived from a previous snapshot is never returned.
+    Requests still running against an older snapshot neither read nor replace the newer snapshot's entries.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None) -> None:
+        """
+        Create an empty cache.
+
+        Parameters:
+            max_entries (Optional[int]): Maximum number of entries kept per snapshot. Defaults to the
+                `RESPONSE_CACHE_MAX_ENTRIES` environment variable, or 256 when unset.
+        """
+        if max_entries is None:
+            max_entries = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._owner: Any = None
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _is_stale(self, version: int) -> bool:
+        """Return True if `version` is older than the snapshot the entries belong to."""
+        return self._version is not None and version < self._version
+
+    def _sync_snapshot(self, owner: Any, version: int) -> None:
+        """Drop all entries when the graph object or its version differs from the cached snapshot."""
+        if owner is not self._owner or version != self._version:
+            self._entries.clear()
+            self._owner = owner
+            self._version = version
+
+    def get(self, owner: Any, version: int, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for `key` if it was built from the given graph snapshot.
+
+        Parameters:
+            owner (Any): Graph object the value is derived from.
+            version (int): Version of the graph snapshot.
+            key (Hashable): Endpoint name and normalised query parameters.
+
+        Returns:
+            Optional[Any]: The cached value, or `None` on a miss.
+        """
+        with self._lock:
+            if self._is_stale(version):
+                return None
+            self._sync_snapshot(owner, version)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, owner: Any, version: int, key: Hashable, entry: Any) -> Any:
+        """
+        Store `entry` for `key` under the given graph snapshot, evicting the least recently used entry if full.
+
+        An entry built from a snapshot older than the cached one is not stored.
+
+        Returns:
+            Any: The value passed in, whether stored or not.
+        """
+        with self._lock:
+            if self._is_stale(version):
+                return entry
+            self._sync_snapshot(owner, version)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return entry
+
+    def get_or_build(self, owner: Any, version: int, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for `key`, building and storing it with `factory` on a miss.
+
+        The factory runs outside the cache lock so a slow build never blocks readers of other keys.
+        """
+        entry = self.get(owner, version, key)
+        if entry is not None:
+            return entry
+        return self.put(owner, version, key, factory())
+
+    def clear(self) -> None:
+        """Remove every entry and forget the current snapshot."""
+        with self._lock:
+            self._entries.clear()
+            self._owner = None
+            self._version = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class ResponseCache(SnapshotCache):
+    """
+    Snapshot-bound LRU cache of encoded response bodies.
+
+    Entries are keyed by endpoint name and query parameters and hold `CachedResponse` objects.
+    """
+
+    def get_or_create(
+        self,
+        owner: Any,
+        version: int,
+        key: Hashable,
+        factory: Callable[[], bytes],
+        media_type: str = "application/json",
+    ) -> CachedResponse:
+        """
+        Return the cached entry for `key`, building and storing it with `factory` on a miss.
+
+        The factory runs outside the cache lock so a slow build never blocks readers of other keys.
+
+        Parameters:
+            owner (Any): Graph object the response is derived from.
+            version (int): Version of the graph snapshot.
+            key (Hashable): Endpoint name and normalised query parameters.
+            factory (Callable[[], bytes]): Zero-argument callable producing the encoded body.
+            media_type (str): Content type stored with a freshly built entry.
+
+        Returns:
+            CachedResponse: The cached or freshly built entry.
+        """
+        return self.get_or_build(owner, version, key, lambda: CachedResponse(body=factory(), media_type=media_type))
@@ -11,15 +11,23 @@ from src.data.real_data_fetcher import create_real_database
 from src.logic.asset_graph import AssetRelationshipGraph
 from src.models.financial_models import Asset
 from src.reports.schema_report import generate_schema_report
+from src.visualizations.figure_cache import FigureCache
 from src.visualizations.formulaic_visuals import FormulaicVisualizer
 from src.visualizations.graph_2d_visuals import visualize_2d_graph
-from src.visualizations.graph_visuals import visualize_3d_graph, visualize_3d_graph_with_filters
+from src.visualizations.graph_visuals import (
+    validate_graph_snapshot,
+    visualize_3d_graph,
+    visualize_3d_graph_with_filters,
+)
 from src.visualizations.metric_visuals import visualize_metrics
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Rendered figures and reports per graph version, shared by every session
+figure_cache = FigureCache()
+
 
 # ------------- Constants -------------
 class AppConstants:
@@ -131,12 +139,25 @@ class FinancialAssetApp:
             self.graph = create_real_database()
             logger.info(f"Database initialized with {len(self.graph.assets)} real assets")
             logger.info(f"Initialized sample database with {len(self.graph.assets)} assets")
+            self._validate_graph_snapshot(self.graph)
         except Exception as e:
             logger.error(f"{AppConstants.INITIAL_GRAPH_ERROR}: {e}")
             # Depending on desired behavior, could set self.graph to an empty graph
             # or re-raise the exception to prevent the app from starting.
             raise
 
+    @staticmethod
+    def _validate_graph_snapshot(graph: AssetRelationshipGraph) -> None:
+        """Validate a newly built graph once so renders can skip per-call validation.
+
+        A graph that fails validation is still served; the visualizers then validate on every call and report
+        the problem there.
+        """
+        try:
+            validate_graph_snapshot(graph)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Graph failed visualization validation; renders will revalidate: {e}")
+
     def ensure_graph(self) -> AssetRelationshipGraph:
         """Ensures the graph is initialized, re-creating sample data if it's None."""
         if self.graph is None:
@@ -160,9 +181,9 @@ class FinancialAssetApp:
         return text
 
     def update_all_metrics_outputs(self, graph: AssetRelationshipGraph):
-        """Updates all metric-related visualizations and text."""
-        f1, f2, f3 = visualize_metrics(graph)
-        text = self._update_metrics_text(graph)
+        """Updates all metric-related visualizations and text, served from the figure cache."""
+        f1, f2, f3 = figure_cache.figures(graph, ("metrics",), lambda: visualize_metrics(graph))
+        text = figure_cache.text(graph, ("metrics_text",), lambda: self._update_metrics_text(graph))
         return f1, f2, f3, text
 
     def update_asset_info(self, selected_asset: Optional[str], graph: AssetRelationshipGraph) -> Tuple[Dict, Dict]:
@@ -189,9 +210,9 @@ class FinancialAssetApp:
         try:
             graph = self.ensure_graph()  # Use self.ensure_graph to get the latest graph state
             logger.info("Refreshing all visualization outputs")
-            viz_3d = visualize_3d_graph(graph)
+            viz_3d = figure_cache.figure(graph, ("3d",), lambda: visualize_3d_graph(graph))
             f1, f2, f3, metrics_txt = self.update_all_metrics_outputs(graph)
-            schema_rpt = generate_schema_report(graph)
+            schema_rpt = figure_cache.text(graph, ("schema_report",), lambda: generate_schema_report(graph))
             asset_choices = list(graph.assets.keys())
             logger.info(f"Successfully refreshed outputs for {len(asset_choices)} assets")
             return (
@@ -236,31 +257,50 @@ class FinancialAssetApp:
         try:
             graph = self.ensure_graph()
 
+            filters = (
+                show_same_sector,
+                show_market_cap,
+                show_correlation,
+                show_corporate_bond,
+                show_commodity_currency,
+                show_income_comparison,
+                show_regulatory,
+                show_all_relationships,
+            )
+
             if view_mode == "2D":
-                graph_viz = visualize_2d_graph(
+                graph_viz = figure_cache.figure(
                     graph,
-                    show_same_sector=show_same_sector,
-                    show_market_cap=show_market_cap,
-                    show_correlation=show_correlation,
-                    show_corporate_bond=show_corporate_bond,
-                    show_commodity_currency=show_commodity_currency,
-                    show_income_comparison=show_income_comparison,
-                    show_regulatory=show_regulatory,
-                    show_all_relationships=show_all_relationships,
-                    layout_type=layout_type,
+                    ("2d", layout_type, filters),
+                    lambda: visualize_2d_graph(
+                        graph,
+                        show_same_sector=show_same_sector,
+                        show_market_cap=show_market_cap,
+                        show_correlation=show_correlation,
+                        show_corporate_bond=show_corporate_bond,
+                        show_commodity_currency=show_commodity_currency,
+                        show_income_comparison=show_income_comparison,
+                        show_regulatory=show_regulatory,
+                        show_all_relationships=show_all_relationships,
+                        layout_type=layout_type,
+                    ),
                 )
             else:  # 3D mode
-                graph_viz = visualize_3d_graph_with_filters(
+                graph_viz = figure_cache.figure(
                     graph,
-                    show_same_sector=show_same_sector,
-                    show_market_cap=show_market_cap,
-                    show_correlation=show_correlation,
-                    show_corporate_bond=show_corporate_bond,
-                    show_commodity_currency=show_commodity_currency,
-                    show_income_comparison=show_income_comparison,
-                    show_regulatory=show_regulatory,
-                    show_all_relationships=show_all_relationships,
-                    toggle_arrows=toggle_arrows,
+                    ("3d_filtered", toggle_arrows, filters),
+                    lambda: visualize_3d_graph_with_filters(
+                        graph,
+                        show_same_sector=show_same_sector,
+                        show_market_cap=show_market_cap,
+                        show_correlation=show_correlation,
+                        show_corporate_bond=show_corporate_bond,
+                        show_commodity_currency=show_commodity_currency,
+                        show_income_comparison=show_income_comparison,
+                        show_regulatory=show_regulatory,
+                        show_all_relationships=show_all_relationships,
+                        toggle_arrows=toggle_arrows,
+                    ),
                 )
 
             return graph_viz, gr.update(visible=False)
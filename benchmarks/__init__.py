@@ -0,0 +1,5 @@
+"""Performance benchmarks for graph building, analysis, visualization, persistence and the API.
+
+Run the suite with `python -m benchmarks run` and compare two result files with `python -m benchmarks compare`;
+see `benchmarks/__main__.py` for the options.
+"""
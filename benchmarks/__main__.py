@@ -0,0 +1,121 @@
+"""Command-line entry point of the benchmark suite.
+
+Usage:
+    python -m benchmarks run [--sizes 1000,10000] [--filter api.] [--repeat 5] [--output PATH]
+    python -m benchmarks compare BASELINE.json CURRENT.json [--threshold 0.2]
+
+`run` writes `.benchmarks/<commit>.json` unless `--output` is given. `compare` prints a table and exits with
+status 1 when any benchmark regressed by more than the threshold or failed, so it can gate a deployment.
+The API cases run the API in process; `SECRET_KEY`, `DATABASE_URL`, `ADMIN_USERNAME` and `ADMIN_PASSWORD` are
+taken from the environment when set and otherwise default to a random secret and a throwaway SQLite user database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from benchmarks.harness import (
+    DEFAULT_THRESHOLD,
+    Measurement,
+    compare_results,
+    format_comparisons,
+    format_seconds,
+    load_results,
+    run_suite,
+    save_results,
+)
+
+# Directory result files are written to by default
+RESULTS_DIR = Path(".benchmarks")
+
+
+def _parse_sizes(value: str) -> List[int]:
+    try:
+        sizes = [int(size) for size in value.split(",") if size.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"sizes must be comma-separated integers, got {value!r}")
+    if not sizes or any(size < 1 for size in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive")
+    return sizes
+
+
+def _print_measurement(measurement: Measurement) -> None:
+    if measurement.error is not None:
+        print(f"{measurement.name:<40} {measurement.size:>9}  failed: {measurement.error}", flush=True)
+        return
+    print(
+        f"{measurement.name:<40} {measurement.size:>9}  min {format_seconds(measurement.min):>9}  "
+        f"median {format_seconds(measurement.median):>9}  ({measurement.repeat}x{measurement.number})",
+        flush=True,
+    )
+
+
+def _run(args: argparse.Namespace) -> int:
+    # The database module refuses to import without a URL; the repository cases use their own SQLite files
+    os.environ.setdefault("ASSET_GRAPH_DATABASE_URL", "sqlite:///:memory:")
+    from benchmarks.suite import CASES, api_environment
+
+    for name, value in api_environment().items():
+        os.environ.setdefault(name, value)
+
+    cases = [case for case in CASES if any(pattern in case.name for pattern in args.filter or [""])]
+    if not cases:
+        print("No benchmarks match the filter", file=sys.stderr)
+        return 2
+    results = run_suite(cases, args.sizes, repeat=args.repeat, min_time=args.min_time, report=_print_measurement)
+    output = args.output or RESULTS_DIR / f"{(results['commit']['sha'] or 'unknown')[:12]}.json"
+    save_results(results, output)
+    print(f"Results written to {output}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    comparisons = compare_results(load_results(args.baseline), load_results(args.current), args.threshold)
+    print(format_comparisons(comparisons))
+    return 1 if any(comparison.status in ("regressed", "failed") for comparison in comparisons) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark command line and return the process exit status."""
+    from benchmarks.suite import DEFAULT_SIZES
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("-v", "--verbose", action="store_true", help="log tracebacks of failing benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="time the suite and store the results as JSON")
+    run.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        default=list(DEFAULT_SIZES),
+        help="comma-separated universe sizes (default: %(default)s)",
+    )
+    run.add_argument("--filter", action="append", help="only run benchmarks whose name contains this; repeatable")
+    run.add_argument("--repeat", type=int, default=5, help="timed samples per benchmark and size")
+    run.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per sample of batched calls")
+    run.add_argument("--output", type=Path, help="result file (default: .benchmarks/<commit>.json)")
+    run.set_defaults(handler=_run)
+
+    compare = commands.add_parser("compare", help="compare two result files")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative slowdown reported as a regression (default: %(default)s)",
+    )
+    compare.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+"""Timing harness for the benchmark suite.
+
+A `BenchmarkCase` separates untimed preparation from the timed call, in the style of asv:
+
+- `setup(size)` runs once per universe size and returns the state the case works on.
+- `prepare(state)`, when given, runs untimed before every timed call and returns its argument. Cases whose
+  call mutates state or warms a cache use it to start each call from the same cold state.
+- `run(argument)` is the timed call.
+
+Cases without `prepare` are repeated in batches of `number` calls long enough to time reliably; cases with it
+are timed one call at a time. Results carry the minimum, median, mean and standard deviation per call and are
+stored as JSON together with the commit and machine they were measured on, so runs of two commits can be
+compared with `compare_results`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Version of the result file layout; bumped when fields change meaning
+RESULTS_SCHEMA = 1
+
+# Relative slowdown of the minimum time above which a benchmark counts as regressed
+DEFAULT_THRESHOLD = 0.2
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One timed operation, measured at every universe size up to `max_size`."""
+
+    name: str
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+    prepare: Optional[Callable[[Any], Any]] = None
+    max_size: Optional[int] = None
+
+
+@dataclass
+class Measurement:
+    """Per-call timings of one case at one size, or the error that stopped it."""
+
+    name: str
+    size: int
+    number: int = 0
+    repeat: int = 0
+    min: Optional[float] = None
+    median: Optional[float] = None
+    mean: Optional[float] = None
+    stdev: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Outcome of comparing one case and size between a baseline run and a current run."""
+
+    name: str
+    size: int
+    baseline: Optional[float]
+    current: Optional[float]
+    ratio: Optional[float]
+    status: str
+
+
+def time_case(case: BenchmarkCase, size: int, repeat: int = 5, min_time: float = 0.2) -> Measurement:
+    """
+    Time a benchmark case at one universe size.
+
+    Parameters:
+        case (BenchmarkCase): Case to time.
+        size (int): Universe size passed to the case's setup.
+        repeat (int): Number of timed samples.
+        min_time (float): Seconds a sample should last at least; calls are batched to reach it unless the case
+            has a `prepare` step.
+
+    Returns:
+        Measurement: Per-call statistics, or the error message if setup or a call raised.
+    """
+    measurement = Measurement(name=case.name, size=size)
+    try:
+        state = case.setup(size)
+        argument = case.prepare(state) if case.prepare else state
+        # The first call warms imports and lazily built structures and calibrates the batch size
+        start = time.perf_counter()
+        case.run(argument)
+        first = time.perf_counter() - start
+        number = 1 if case.prepare else max(1, math.ceil(min_time / max(first, 1e-9)))
+
+        samples: List[float] = []
+        for _ in range(max(repeat, 1)):
+            argument = case.prepare(state) if case.prepare else argument
+            start = time.perf_counter()
+            for _ in range(number):
+                case.run(argument)
+            samples.append((time.perf_counter() - start) / number)
+    except Exception as e:
+        logger.debug(f"Benchmark {case.name} failed at size {size}", exc_info=True)
+        # Keep the first line only; HTTP and SQL errors append multi-line details
+        message = str(e).splitlines()[0] if str(e) else ""
+        measurement.error = f"{type(e).__name__}: {message}"
+        return measurement
+
+    measurement.number = number
+    measurement.repeat = len(samples)
+    measurement.min = min(samples)
+    measurement.median = statistics.median(samples)
+    measurement.mean = statistics.fmean(samples)
+    measurement.stdev = statistics.stdev(samples) if len(samples) > 1 else 0.0
+    return measurement
+
+
+def run_suite(
+    cases: Sequence[BenchmarkCase],
+    sizes: Sequence[int],
+    repeat: int = 5,
+    min_time: float = 0.2,
+    report: Optional[Callable[[Measurement], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Time every case at every size and collect the results with the run's metadata.
+
+    Sizes are the outer loop, so state shared between cases of one size (such as a generated universe) can be
+    cached for one size at a time.
+
+    Parameters:
+        cases (Sequence[BenchmarkCase]): Cases to time.
+        sizes (Sequence[int]): Universe sizes, typically ascending.
+        repeat (int): Timed samples per case and size.
+        min_time (float): Minimum seconds per sample for batched cases.
+        report (Optional[Callable[[Measurement], None]]): Called with each measurement as soon as it is taken.
+
+    Returns:
+        Dict[str, Any]: JSON-serializable results, as written by `save_results`.
+    """
+    measurements = []
+    for size in sizes:
+        for case in cases:
+            if case.max_size is not None and size > case.max_size:
+                continue
+            measurement = time_case(case, size, repeat=repeat, min_time=min_time)
+            measurements.append(measurement)
+            if report is not None:
+                report(measurement)
+    return {
+        "schema": RESULTS_SCHEMA,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "machine": _machine_info(),
+        "sizes": list(sizes),
+        "repeat": repeat,
+        "results": [asdict(measurement) for measurement in measurements],
+    }
+
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    """Write run results as JSON, creating parent directories as needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fp:
+        json.dump(results, fp, indent=2)
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """
+    Read run results written by `save_results`.
+
+    Raises:
+        ValueError: If the file was written with a different results schema.
+    """
+    with path.open("r", encoding="utf-8") as fp:
+        results = json.load(fp)
+    if results.get("schema") != RESULTS_SCHEMA:
+        raise ValueError(f"{path} has results schema {results.get('schema')}, expected {RESULTS_SCHEMA}")
+    return results
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> List[Comparison]:
+    """
+    Compare the minimum per-call time of every case and size measured in two runs.
+
+    The minimum is the sample least disturbed by other work on the machine, which makes it the steadiest
+    statistic to compare between runs.
+
+    Parameters:
+        baseline (Dict[str, Any]): Results of the reference run.
+        current (Dict[str, Any]): Results of the run under test.
+        threshold (float): Relative change beyond which a case counts as regressed or improved.
+
+    Returns:
+        List[Comparison]: One entry per case and size found in either run, in the current run's order. Status
+        is "regressed", "improved", "unchanged", "failed" (the current run raised), "new" or "missing".
+    """
+    before = _minimum_times(baseline["results"])
+    after = _minimum_times(current["results"])
+    comparisons = []
+    for key in list(after) + [key for key in before if key not in after]:
+        old, new = before.get(key, _ABSENT), after.get(key, _ABSENT)
+        ratio = None
+        if new is _ABSENT:
+            status = "missing"
+        elif new is None:
+            status = "failed"
+        elif old is _ABSENT or old is None:
+            status = "new"
+        else:
+            ratio = new / old if old > 0 else math.inf
+            if ratio > 1.0 + threshold:
+                status = "regressed"
+            elif ratio < 1.0 / (1.0 + threshold):
+                status = "improved"
+            else:
+                status = "unchanged"
+        comparisons.append(
+            Comparison(
+                name=key[0],
+                size=key[1],
+                baseline=None if old is _ABSENT else old,
+                current=None if new is _ABSENT else new,
+                ratio=ratio,
+                status=status,
+            )
+        )
+    return comparisons
+
+
+def format_comparisons(comparisons: Iterable[Comparison]) -> str:
+    """Render comparisons as an aligned plain-text table."""
+    lines = [f"{'benchmark':<40} {'size':>9} {'baseline':>11} {'current':>11} {'ratio':>7}  status"]
+    for comparison in comparisons:
+        ratio = "" if comparison.ratio is None else f"{comparison.ratio:.2f}"
+        lines.append(
+            f"{comparison.name:<40} {comparison.size:>9} {format_seconds(comparison.baseline):>11} "
+            f"{format_seconds(comparison.current):>11} {ratio:>7}  {comparison.status}"
+        )
+    return "\n".join(lines)
+
+
+def format_seconds(seconds: Optional[float]) -> str:
+    """Format a duration with a unit suited to its magnitude."""
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+_ABSENT = object()
+
+
+def _minimum_times(results: Iterable[Dict[str, Any]]) -> Dict[Tuple[str, int], Optional[float]]:
+    return {(result["name"], result["size"]): result.get("min") for result in results}
+
+
+def _git_commit() -> Dict[str, Any]:
+    """Return the checked-out commit and whether the working tree has uncommitted changes."""
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=30
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=60,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return {"sha": None, "dirty": None}
+    return {"sha": sha, "dirty": bool(status.strip())}
+
+
+def _machine_info() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
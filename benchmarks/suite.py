@@ -0,0 +1,266 @@
+"""Benchmark cases over synthetic universes.
+
+Every case runs against the universe `iter_synthetic_assets(size)` generates, so a size means the same data in
+every run and results of two commits are comparable. Graphs are filled through the attributes the application's
+`AssetRelationshipGraph` exposes, with the relationships `synthetic_relationships` derives. Cases that would
+otherwise hit a cache keyed by graph version (the graph's derived structures, the trace cache of the filtered 3D
+figure, the API response caches) start each call from a cold state: their `prepare` step hands over a fresh graph
+holding the same data or publishes the graph as a new API snapshot.
+
+Modules needing optional configuration (the database layer, the API) are imported inside the cases, so a missing
+dependency or setting fails only the cases that need it. `api_environment()` lists the settings the API cases use
+when the environment does not provide them.
+"""
+
+from __future__ import annotations
+
+import secrets
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.harness import BenchmarkCase
+from src.data.synthetic_data import equity_id, iter_synthetic_assets, iter_synthetic_events, synthetic_relationships
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import Asset, RegulatoryEvent
+
+# Universe sizes measured when none are given
+DEFAULT_SIZES = (1_000, 10_000)
+
+# Largest universe the repository cases store; rows are written one statement at a time
+REPOSITORY_MAX_SIZE = 10_000
+
+# Directory for cache files and databases written by the cases; removed when the process exits
+_scratch = tempfile.TemporaryDirectory(prefix="asset-graph-bench-")
+
+
+@lru_cache(maxsize=1)
+def _universe(size: int) -> Tuple[Tuple[Asset, ...], Tuple[RegulatoryEvent, ...]]:
+    return tuple(iter_synthetic_assets(size)), tuple(iter_synthetic_events(size))
+
+
+def _load_graph(universe: Tuple[Tuple[Asset, ...], Tuple[RegulatoryEvent, ...]]) -> AssetRelationshipGraph:
+    """Return a new graph holding the universe's assets and events, without relationships."""
+    assets, events = universe
+    graph = AssetRelationshipGraph()
+    for asset in assets:
+        graph.add_asset(asset)
+    for event in events:
+        graph.add_regulatory_event(event)
+    return graph
+
+
+def _incoming(relationships: Dict[str, List[Tuple[str, str, float]]]) -> Dict[str, List[Tuple[str, str, float]]]:
+    incoming: Dict[str, List[Tuple[str, str, float]]] = {}
+    for source_id, edges in relationships.items():
+        for target_id, rel_type, strength in edges:
+            incoming.setdefault(target_id, []).append((source_id, rel_type, strength))
+    return incoming
+
+
+@lru_cache(maxsize=1)
+def _built_graph(size: int) -> AssetRelationshipGraph:
+    assets, events = universe = _universe(size)
+    graph = _load_graph(universe)
+    for source_id, edges in synthetic_relationships(assets, events).items():
+        for target_id, rel_type, strength in edges:
+            graph.add_relationship(source_id, target_id, rel_type, strength)
+    # The cache serializer also stores the inverse mapping
+    graph.incoming_relationships = _incoming(graph.relationships)
+    return graph
+
+
+def _fresh_graph(graph: AssetRelationshipGraph) -> AssetRelationshipGraph:
+    """Return a new graph sharing `graph`'s data, so no structure derived from it and no cache keyed by it exists."""
+    fresh = AssetRelationshipGraph()
+    fresh.assets = graph.assets
+    fresh.regulatory_events = graph.regulatory_events
+    fresh.relationships = graph.relationships
+    fresh.incoming_relationships = graph.incoming_relationships
+    return fresh
+
+
+def _visualize_filtered(graph: AssetRelationshipGraph) -> Any:
+    from src.visualizations.graph_visuals import visualize_3d_graph_with_filters
+
+    return visualize_3d_graph_with_filters(graph)
+
+
+def _analyze(graph: AssetRelationshipGraph) -> Any:
+    from src.analysis.formulaic_analysis import FormulaicdAnalyzer
+
+    return FormulaicdAnalyzer().analyze_graph(graph)
+
+
+def _cache_path(size: int) -> Path:
+    return Path(_scratch.name) / f"graph-{size}.json"
+
+
+def _saved_cache(size: int) -> Path:
+    from src.data.real_data_fetcher import _save_to_cache
+
+    path = _cache_path(size)
+    _save_to_cache(_built_graph(size), path)
+    return path
+
+
+def _save_cache(state: Tuple[AssetRelationshipGraph, Path]) -> None:
+    from src.data.real_data_fetcher import _save_to_cache
+
+    _save_to_cache(*state)
+
+
+def _load_cache(path: Path) -> AssetRelationshipGraph:
+    from src.data.real_data_fetcher import _load_from_cache
+
+    return _load_from_cache(path)
+
+
+def _empty_database(size: int) -> Any:
+    """Return a session factory bound to a new SQLite database file with the schema created."""
+    from src.data import db_models  # noqa: F401  # registers the tables init_db creates
+    from src.data.database import create_engine_from_url, create_session_factory, init_db
+
+    path = Path(tempfile.mkstemp(suffix=f"-{size}.db", dir=_scratch.name)[1])
+    engine = create_engine_from_url(f"sqlite:///{path}")
+    init_db(engine)
+    return create_session_factory(engine)
+
+
+def _store_graph(state: Tuple[Any, AssetRelationshipGraph]) -> None:
+    from src.data.database import session_scope
+    from src.data.repository import AssetGraphRepository
+
+    session_factory, graph = state
+    with session_scope(session_factory) as session:
+        repository = AssetGraphRepository(session)
+        for asset in graph.assets.values():
+            repository.upsert_asset(asset)
+        # Assets must exist before rows referencing them are written
+        session.flush()
+        for source_id, relationships in graph.relationships.items():
+            for target_id, rel_type, strength in relationships:
+                repository.add_or_update_relationship(source_id, target_id, rel_type, strength, bidirectional=False)
+        for event in graph.regulatory_events:
+            repository.upsert_regulatory_event(event)
+
+
+def _stored_database(size: int) -> Any:
+    session_factory = _empty_database(size)
+    _store_graph((session_factory, _built_graph(size)))
+    return session_factory
+
+
+def _load_database(session_factory: Any) -> None:
+    from src.data.database import session_scope
+    from src.data.repository import AssetGraphRepository
+
+    with session_scope(session_factory) as session:
+        repository = AssetGraphRepository(session)
+        repository.list_assets()
+        repository.list_relationships()
+        repository.list_regulatory_events()
+
+
+def api_environment() -> Dict[str, str]:
+    """Return the settings the API needs at import, for an in-process API with a throwaway user database.
+
+    The secret and the admin password are random per process; values already in the environment take precedence.
+    """
+    return {
+        "SECRET_KEY": secrets.token_urlsafe(32),
+        "DATABASE_URL": f"sqlite:///{Path(_scratch.name) / 'api-users.db'}",
+        "ADMIN_USERNAME": "benchmark",
+        "ADMIN_PASSWORD": secrets.token_urlsafe(16),
+    }
+
+
+def _api_client(size: int) -> Tuple[Any, AssetRelationshipGraph]:
+    from fastapi.testclient import TestClient
+
+    from api.main import app, set_graph
+
+    graph = _built_graph(size)
+    set_graph(graph)
+    return TestClient(app), graph
+
+
+def _cold_api_client(state: Tuple[Any, AssetRelationshipGraph]) -> Any:
+    """Publish the graph as a new snapshot, so every version-keyed response cache misses."""
+    from api.main import set_graph
+
+    client, graph = state
+    set_graph(graph)
+    return client
+
+
+def _endpoint_case(name: str, url: str, cached: bool = False) -> BenchmarkCase:
+    """Time a GET request, served from a cold snapshot unless `cached` measures the cache-hit path."""
+
+    def request(client: Any) -> None:
+        client.get(url).raise_for_status()
+
+    if cached:
+        return BenchmarkCase(name, setup=lambda size: _api_client(size)[0], run=request)
+    return BenchmarkCase(name, setup=_api_client, run=request, prepare=_cold_api_client)
+
+
+# Endpoints built on graph methods `AssetRelationshipGraph` does not provide (`calculate_metrics`,
+# `get_3d_visualization_data`), the metrics and visualization endpoints, are not measured.
+CASES: List[BenchmarkCase] = [
+    BenchmarkCase(
+        "graph.synthetic_relationships",
+        setup=_universe,
+        run=lambda universe: synthetic_relationships(*universe),
+    ),
+    BenchmarkCase(
+        "graph.centrality",
+        setup=_built_graph,
+        prepare=_fresh_graph,
+        run=lambda graph: graph.centrality(),
+    ),
+    BenchmarkCase(
+        "graph.communities",
+        setup=_built_graph,
+        prepare=_fresh_graph,
+        run=lambda graph: graph.communities(),
+    ),
+    BenchmarkCase(
+        "graph.get_3d_visualization_data_enhanced",
+        setup=_built_graph,
+        run=lambda graph: graph.get_3d_visualization_data_enhanced(),
+    ),
+    BenchmarkCase(
+        "visuals.visualize_3d_graph_with_filters",
+        setup=_built_graph,
+        prepare=_fresh_graph,
+        run=_visualize_filtered,
+    ),
+    BenchmarkCase("analysis.analyze_graph", setup=_built_graph, run=_analyze),
+    BenchmarkCase(
+        "cache.json_save",
+        setup=lambda size: (_built_graph(size), _cache_path(size)),
+        run=_save_cache,
+    ),
+    BenchmarkCase("cache.json_load", setup=_saved_cache, run=_load_cache),
+    BenchmarkCase(
+        "repository.store",
+        setup=_built_graph,
+        prepare=lambda graph: (_empty_database(len(graph.assets)), graph),
+        run=_store_graph,
+        max_size=REPOSITORY_MAX_SIZE,
+    ),
+    BenchmarkCase(
+        "repository.load",
+        setup=_stored_database,
+        run=_load_database,
+        max_size=REPOSITORY_MAX_SIZE,
+    ),
+    _endpoint_case("api.assets", "/api/assets?limit=1000"),
+    _endpoint_case("api.assets.cached", "/api/assets?limit=1000", cached=True),
+    _endpoint_case("api.relationships", "/api/relationships?limit=1000"),
+    _endpoint_case("api.neighborhood", f"/api/assets/{equity_id(0)}/neighborhood?hops=2"),
+    _endpoint_case("api.paths", f"/api/paths?source={equity_id(0)}&target={equity_id(1)}&k=3"),
+    _endpoint_case("api.export_relationships", "/api/export/relationships?format=csv"),
+]
@@ -10,7 +10,13 @@
  */
 
 import axios from 'axios';
-import type { Asset, Relationship, Metrics, VisualizationData } from '../../app/types/api';
+import type {
+  Asset,
+  ColumnarVisualizationData,
+  Relationship,
+  Metrics,
+  VisualizationData,
+} from '../../app/types/api';
 
 // Mock axios
 jest.mock('axios');
@@ -441,6 +447,39 @@ describe('API Client', () => {
     });
   });
 
+  describe('getColumnarVisualizationData', () => {
+    const mockColumnar: ColumnarVisualizationData = {
+      format: 'columnar',
+      nodes: {
+        id: ['ASSET_1', 'ASSET_2'],
+        name: ['Apple Inc.', 'Gold'],
+        symbol: ['AAPL', 'GOLD'],
+        asset_class: ['EQUITY', 'COMMODITY'],
+        x: [1.5, -1.2],
+        y: [2.3, 0.5],
+        z: [0.8, 1.9],
+        color: ['#1f77b4', '#ff7f0e'],
+        size: [5, 5],
+        cluster: [0, 0],
+      },
+      edges: { source: [0], target: [1], relationship_type: [0], strength: [0.5] },
+      relationship_types: ['correlation'],
+    };
+
+    it('should request the columnar format', async () => {
+      mockAxiosInstance.get.mockResolvedValue({ data: mockColumnar });
+
+      const result = await api.getColumnarVisualizationData();
+
+      expect(mockAxiosInstance.get).toHaveBeenCalledWith('/api/visualization', {
+        params: { format: 'columnar' },
+      });
+      expect(result.relationship_types[result.edges.relationship_type[0]]).toBe('correlation');
+      expect(result.nodes.id[result.edges.target[0]]).toBe('ASSET_2');
+      expect(result.nodes.cluster).toEqual([0, 0]);
+    });
+  });
+
   describe('getAssetClasses', () => {
     const mockAssetClasses = {
       asset_classes: ['EQUITY', 'FIXED_INCOME', 'COMMODITY', 'CURRENCY'],
@@ -1,5 +1,11 @@
 import axios from 'axios';
-import type { Asset, Relationship, Metrics, VisualizationData } from '../types/api';
+import type {
+  Asset,
+  ColumnarVisualizationData,
+  Relationship,
+  Metrics,
+  VisualizationData,
+} from '../types/api';
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
@@ -53,6 +59,11 @@ export const api = {
     return response.data;
   },
 
+  getColumnarVisualizationData: async (): Promise<ColumnarVisualizationData> => {
+    const response = await apiClient.get('/api/visualization', { params: { format: 'columnar' } });
+    return response.data;
+  },
+
   // Metadata
   getAssetClasses: async (): Promise<{ asset_classes: string[] }> => {
     const response = await apiClient.get('/api/asset-classes');
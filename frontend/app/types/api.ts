@@ -19,6 +19,13 @@ export interface Relationship {
   strength: number;
 }
 
+export interface Centrality {
+  pagerank: Record<string, number>;
+  eigenvector: Record<string, number>;
+  betweenness: Record<string, number>;
+  betweenness_samples: number;
+}
+
 export interface Metrics {
   total_assets: number;
   total_relationships: number;
@@ -26,6 +33,7 @@ export interface Metrics {
   avg_degree: number;
   max_degree: number;
   network_density: number;
+  centrality?: Centrality;
 }
 
 export interface VisualizationNode {
@@ -51,3 +59,28 @@ export interface VisualizationData {
   nodes: VisualizationNode[];
   edges: VisualizationEdge[];
 }
+
+// Parallel-array layout returned by /api/visualization?format=columnar.
+// Edge endpoints are indices into the node arrays; relationship types are indices into relationship_types.
+export interface ColumnarVisualizationData {
+  format: 'columnar';
+  nodes: {
+    id: string[];
+    name: string[];
+    symbol: string[];
+    asset_class: string[];
+    x: number[];
+    y: number[];
+    z: number[];
+    color: string[];
+    size: number[];
+    cluster: number[];
+  };
+  edges: {
+    source: number[];
+    target: number[];
+    relationship_type: number[];
+    strength: number[];
+  };
+  relationship_types: string[];
+}
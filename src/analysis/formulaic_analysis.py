@@ -1,6 +1,9 @@
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
 
 from src.logic.asset_graph import AssetRelationshipGraph
 from src.models.financial_models import Bond, Commodity, Currency, Equity
@@ -22,6 +25,37 @@ class Formula:
     r_squared: float = 0.0  # Correlation strength if applicable
 
 
+class CorrelationPairs(Mapping):
+    """Read-only "asset1-asset2" view of a dense correlation matrix, covering the upper triangle and diagonal.
+
+    It behaves like the pair dictionary the analyzer used to build, but pairs are only formatted when iterated,
+    so producing it costs nothing for callers that read the dense array instead.
+    """
+
+    def __init__(self, asset_ids: List[str], correlations: np.ndarray):
+        self.asset_ids = asset_ids
+        self.correlations = correlations
+        self._index = {asset_id: i for i, asset_id in enumerate(asset_ids)}
+
+    def __getitem__(self, pair: str) -> float:
+        # Ids may contain "-", so every split point is tried
+        position = pair.find("-")
+        while position != -1:
+            i, j = self._index.get(pair[:position]), self._index.get(pair[position + 1 :])
+            if i is not None and j is not None and i <= j:
+                return float(self.correlations[i, j])
+            position = pair.find("-", position + 1)
+        raise KeyError(pair)
+
+    def __iter__(self) -> Iterator[str]:
+        rows, cols = np.triu_indices(len(self.asset_ids))
+        return (f"{self.asset_ids[i]}-{self.asset_ids[j]}" for i, j in zip(rows.tolist(), cols.tolist()))
+
+    def __len__(self) -> int:
+        count = len(self.asset_ids)
+        return count * (count + 1) // 2
+
+
 class FormulaicdAnalyzer:
     """Analyzes financial data to extract and render mathematical relationships"""
 
@@ -365,8 +399,11 @@ class FormulaicdAnalyzer:
         assets_data = self._extract_asset_data(graph)
 
         if len(assets_data) >= 2:
-            # Calculate correlation matrix
-            correlation_matrix = self._calculate_correlation_matrix(assets_data)
+            # Calculate correlation matrix, dense with an id index and as a lazy pair mapping
+            asset_ids, correlation_array = self._calculate_correlation_array(assets_data)
+            correlation_matrix = CorrelationPairs(asset_ids, correlation_array)
+            relationships["correlation_asset_ids"] = asset_ids
+            relationships["correlation_array"] = correlation_array
             relationships["correlation_matrix"] = correlation_matrix
 
             # Find strongest correlations
@@ -525,28 +562,36 @@ class FormulaicdAnalyzer:
     def _calculate_commodity_currency_examples(self, _graph: AssetRelationshipGraph) -> str:
         return "Gold price vs USD: Higher gold prices often correlate with weaker USD"
 
-    def _calculate_correlation_matrix(self, assets_data: Dict) -> Dict:
-        """Calculate correlation matrix from asset price data"""
+    def _calculate_correlation_array(self, assets_data: Dict) -> Tuple[List[str], np.ndarray]:
+        """Calculate the dense correlation matrix from asset price data, with the asset id of each row"""
         # Simplified correlation based on asset characteristics
-        correlations = {}
         asset_ids = list(assets_data.keys())
+        class_codes: Dict[Any, int] = {}
+        codes = np.array(
+            [class_codes.setdefault(assets_data[asset_id]["asset_class"], len(class_codes)) for asset_id in asset_ids],
+            dtype=np.int64,
+        )
+        # Same asset class 0.7, different asset classes 0.3
+        correlations = np.where(codes[:, None] == codes[None, :], 0.7, 0.3)
+        np.fill_diagonal(correlations, 1.0)
+        return asset_ids, correlations
+
+    def _correlation_pairs(self, asset_ids: List[str], correlations: np.ndarray) -> Dict[str, float]:
+        """Map "asset1-asset2" to the correlation of every pair in the upper triangle, diagonal included"""
+        rows, cols = np.triu_indices(len(asset_ids))
+        return {
+            f"{asset_ids[i]}-{asset_ids[j]}": corr
+            for i, j, corr in zip(rows.tolist(), cols.tolist(), correlations[rows, cols].tolist())
+        }
 
-        for i, asset1 in enumerate(asset_ids):
-            for j, asset2 in enumerate(asset_ids):
-                if i <= j:
-                    if asset1 == asset2:
-                        corr = 1.0
-                    elif assets_data[asset1]["asset_class"] == assets_data[asset2]["asset_class"]:
-                        corr = 0.7  # Same asset class
-                    else:
-                        corr = 0.3  # Different asset classes
-
-                    correlations[f"{asset1}-{asset2}"] = corr
-
-        return correlations
+    def _calculate_correlation_matrix(self, assets_data: Dict) -> Dict:
+        """Calculate correlation matrix from asset price data"""
+        return self._correlation_pairs(*self._calculate_correlation_array(assets_data))
 
-    def _find_strongest_correlations(self, correlation_matrix: Dict, _assets_data: Dict) -> List[Dict]:
+    def _find_strongest_correlations(self, correlation_matrix: Dict, _assets_data: Dict, limit: int = 5) -> List[Dict]:
         """Find the strongest correlations in the matrix"""
+        if isinstance(correlation_matrix, CorrelationPairs):
+            return self._strongest_in_array(correlation_matrix.asset_ids, correlation_matrix.correlations, limit)
         correlations = []
         for pair, corr in correlation_matrix.items():
             if corr < 1.0:  # Exclude self-correlations
@@ -561,7 +606,32 @@ class FormulaicdAnalyzer:
                     }
                 )
 
-        return sorted(correlations, key=lambda x: x["correlation"], reverse=True)[:5]
+        return sorted(correlations, key=lambda x: x["correlation"], reverse=True)[:limit]
+
+    @staticmethod
+    def _strongest_in_array(asset_ids: List[str], correlations: np.ndarray, limit: int) -> List[Dict]:
+        """Find the strongest correlations of a dense matrix, ordered as `_find_strongest_correlations` orders pairs"""
+        rows, cols = np.triu_indices(len(asset_ids))
+        values = correlations[rows, cols]
+        candidates = np.flatnonzero(values < 1.0)  # Exclude self-correlations
+        if candidates.size > limit:
+            # Keep every pair tied with the limit-th strongest, so ties resolve in pair order like a stable sort
+            threshold = np.partition(values[candidates], candidates.size - limit)[candidates.size - limit]
+            candidates = candidates[values[candidates] >= threshold]
+        candidates = candidates[np.lexsort((candidates, -values[candidates]))][:limit]
+        strongest = []
+        for i, j, corr in zip(rows[candidates].tolist(), cols[candidates].tolist(), values[candidates].tolist()):
+            asset1, asset2 = asset_ids[i], asset_ids[j]
+            strongest.append(
+                {
+                    "pair": f"{asset1}-{asset2}",
+                    "correlation": corr,
+                    "asset1": asset1,
+                    "asset2": asset2,
+                    "strength": "Strong" if corr > 0.7 else "Moderate" if corr > 0.4 else "Weak",
+                }
+            )
+        return strongest
 
     def _calculate_sector_relationships(self, graph: AssetRelationshipGraph) -> Dict:
         """Calculate relationships within sectors"""
@@ -636,6 +706,11 @@ class FormulaicdAnalyzer:
 
     def _calculate_avg_correlation_strength_from_empirical(self, empirical_relationships: Dict) -> float:
         """Calculate average correlation from empirical data"""
+        correlation_array = empirical_relationships.get("correlation_array")
+        if correlation_array is not None:
+            values = np.asarray(correlation_array)[np.triu_indices(len(correlation_array))]
+            valid_correlations = values[values < 1.0]
+            return float(valid_correlations.mean()) if valid_correlations.size else 0.5
         correlations = empirical_relationships.get("correlation_matrix", {})
         if correlations:
             valid_correlations = [v for v in correlations.values() if v < 1.0]
@@ -482,6 +482,7 @@ def _deserialize_event(data: Dict[str, Any]) -> RegulatoryEvent:
         RegulatoryEvent: A RegulatoryEvent instance constructed from the provided data.
     """
     data = dict(data)
+    data.pop("__type__", None)
     data["event_type"] = RegulatoryActivity(data["event_type"])
     return RegulatoryEvent(**data)
 
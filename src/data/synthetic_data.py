@@ -0,0 +1,528 @@
+"""Deterministic synthetic asset universes for load and performance testing.
+
+`create_sample_database` builds a hand-picked universe of about twenty assets. This module generates universes of
+any size, from a hundred to millions of assets, without network access:
+
+- Equities are generated in market-cap rank order with a Zipf-like size distribution, sectors drawn from
+  realistic weights and listing currencies dominated by USD.
+- Bonds are corporate bonds linked to an issuer (larger companies issue more often) or government bonds.
+- Commodities and currencies fill the remaining classes; regulatory events link an asset to same-sector peers.
+- Price histories are optional geometric random walks ending at each asset's price.
+- Relationships link bonds to issuers, equities to sector peers and event subjects to the assets they affect.
+
+Assets and events are produced by generators in fixed-size chunks, so memory use stays flat however large the
+universe is. Attributes other assets refer to (an equity's sector) are computed from the asset's index with a
+stateless hash, which is what lets bonds and events reference issuers without keeping earlier chunks around.
+The output depends only on the asset count and the seed.
+"""
+
+import logging
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import (
+    Asset,
+    AssetClass,
+    Bond,
+    Commodity,
+    Currency,
+    Equity,
+    RegulatoryActivity,
+    RegulatoryEvent,
+)
+
+logger = logging.getLogger(__name__)
+
+# Assets generated per batch of vectorized draws; fixed so the output does not depend on how it is consumed
+_CHUNK_SIZE = 10_000
+
+# Share of the universe per asset class
+CLASS_WEIGHTS: Dict[AssetClass, float] = {
+    AssetClass.EQUITY: 0.60,
+    AssetClass.FIXED_INCOME: 0.30,
+    AssetClass.COMMODITY: 0.05,
+    AssetClass.CURRENCY: 0.05,
+}
+
+# Equity sectors and their share of listed companies
+EQUITY_SECTORS: Dict[str, float] = {
+    "Technology": 0.18,
+    "Financial Services": 0.14,
+    "Healthcare": 0.13,
+    "Consumer Cyclical": 0.10,
+    "Industrials": 0.11,
+    "Communication Services": 0.07,
+    "Consumer Defensive": 0.06,
+    "Energy": 0.06,
+    "Basic Materials": 0.05,
+    "Real Estate": 0.05,
+    "Utilities": 0.05,
+}
+
+# Listing currencies of equities and their share
+LISTING_CURRENCIES: Dict[str, float] = {
+    "USD": 0.55,
+    "EUR": 0.15,
+    "JPY": 0.10,
+    "GBP": 0.06,
+    "CNY": 0.05,
+    "CAD": 0.03,
+    "CHF": 0.03,
+    "AUD": 0.03,
+}
+
+COMMODITY_SECTORS = ("Energy", "Precious Metals", "Industrial Metals", "Agricultural", "Livestock")
+CREDIT_RATINGS = ("AAA", "AA", "A", "BBB", "BB", "B")
+_CREDIT_RATING_WEIGHTS = (0.04, 0.12, 0.30, 0.34, 0.13, 0.07)
+_CREDIT_SPREADS = (0.002, 0.004, 0.008, 0.015, 0.030, 0.050)
+
+# Largest company's market cap; the company of rank r is worth about LARGEST_MARKET_CAP / r
+LARGEST_MARKET_CAP = 3.0e12
+_MIN_MARKET_CAP = 5.0e6
+
+# Share of bonds issued by companies rather than governments
+CORPORATE_BOND_SHARE = 0.75
+
+# Annualized volatility of simulated price histories per asset class
+_HISTORY_VOLATILITY = {
+    AssetClass.EQUITY: 0.30,
+    AssetClass.FIXED_INCOME: 0.06,
+    AssetClass.COMMODITY: 0.35,
+    AssetClass.CURRENCY: 0.10,
+}
+
+_EQUITY_SECTOR_STREAM = 1
+
+_MASK64 = (1 << 64) - 1
+
+
+def class_counts(asset_count: int) -> Dict[AssetClass, int]:
+    """
+    Split a universe size into per-class counts following `CLASS_WEIGHTS`.
+
+    Every class gets at least one asset once the universe has room for it; equities absorb rounding.
+
+    Parameters:
+        asset_count (int): Total number of assets.
+
+    Returns:
+        Dict[AssetClass, int]: Number of assets per class, summing to `asset_count`.
+
+    Raises:
+        ValueError: If `asset_count` is negative.
+    """
+    if asset_count < 0:
+        raise ValueError("asset_count must be non-negative")
+    counts = {asset_class: int(asset_count * weight) for asset_class, weight in CLASS_WEIGHTS.items()}
+    if asset_count >= len(CLASS_WEIGHTS):
+        counts = {asset_class: max(count, 1) for asset_class, count in counts.items()}
+    others = sum(count for asset_class, count in counts.items() if asset_class != AssetClass.EQUITY)
+    counts[AssetClass.EQUITY] = asset_count - min(others, asset_count)
+    return counts
+
+
+def _hash_uniform(seed: int, stream: int, index: np.ndarray) -> np.ndarray:
+    """Stateless uniform draws in [0, 1) per index (splitmix64), independent across seeds and streams."""
+    offset = np.uint64((seed * 0x9E3779B97F4A7C15 + stream * 0xD1B54A32D192ED03) & _MASK64)
+    with np.errstate(over="ignore"):
+        z = np.asarray(index, dtype=np.uint64) + offset + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)).astype(np.float64) * 2.0**-53
+
+
+def _weighted_choice(weights: Iterable[float], uniform: np.ndarray) -> np.ndarray:
+    """Map uniform draws to category indices with the given weights."""
+    cumulative = np.cumsum(np.asarray(list(weights), dtype=np.float64))
+    return np.minimum(np.searchsorted(cumulative / cumulative[-1], uniform, side="right"), cumulative.size - 1)
+
+
+def equity_sector_codes(seed: int, index: np.ndarray) -> np.ndarray:
+    """Return the `EQUITY_SECTORS` position of the equities at `index`, without generating them."""
+    return _weighted_choice(EQUITY_SECTORS.values(), _hash_uniform(seed, _EQUITY_SECTOR_STREAM, index))
+
+
+def _chunk_rng(seed: int, asset_class: AssetClass, chunk: int) -> np.random.Generator:
+    class_code = list(CLASS_WEIGHTS).index(asset_class)
+    return np.random.default_rng([seed, class_code, chunk])
+
+
+def _chunks(count: int) -> Iterator[Tuple[int, np.ndarray]]:
+    for chunk, start in enumerate(range(0, count, _CHUNK_SIZE)):
+        yield chunk, np.arange(start, min(start + _CHUNK_SIZE, count))
+
+
+def equity_id(index: int) -> str:
+    """Id of the equity of market-cap rank `index` (0 is the largest)."""
+    return f"EQ{index:07d}"
+
+
+def _symbol(prefix: str, index: int) -> str:
+    """Unique uppercase ticker per index, e.g. 0 -> "BAA", 1 -> "BAB", after the prefix."""
+    letters = []
+    index += 26 * 26
+    while index:
+        index, digit = divmod(index, 26)
+        letters.append(chr(ord("A") + digit))
+    return prefix + "".join(reversed(letters))
+
+
+def _iter_equities(count: int, seed: int) -> Iterator[Equity]:
+    sector_names = list(EQUITY_SECTORS)
+    currencies = list(LISTING_CURRENCIES)
+    for chunk, index in _chunks(count):
+        rng = _chunk_rng(seed, AssetClass.EQUITY, chunk)
+        size = index.size
+        # Zipf-like size by rank with lognormal noise
+        market_cap = np.maximum(LARGEST_MARKET_CAP / (index + 1.0) * rng.lognormal(0.0, 0.25, size), _MIN_MARKET_CAP)
+        price = rng.lognormal(np.log(60.0), 0.9, size)
+        pe_ratio = rng.lognormal(np.log(18.0), 0.45, size)
+        dividend_yield = np.where(rng.random(size) < 0.6, rng.beta(2.0, 60.0, size), 0.0)
+        book_value = price / rng.lognormal(np.log(3.0), 0.6, size)
+        sectors = equity_sector_codes(seed, index)
+        listing = _weighted_choice(LISTING_CURRENCIES.values(), rng.random(size))
+        # Convert whole columns at once; indexing NumPy arrays per asset dominates the loop otherwise
+        rows = zip(
+            index.tolist(),
+            sectors.tolist(),
+            listing.tolist(),
+            price.round(2).tolist(),
+            market_cap.tolist(),
+            pe_ratio.round(2).tolist(),
+            dividend_yield.round(4).tolist(),
+            (price / pe_ratio).round(2).tolist(),
+            book_value.round(2).tolist(),
+        )
+        for asset_index, sector, listed_in, asset_price, cap, pe, dividend, eps, book in rows:
+            yield Equity(
+                id=equity_id(asset_index),
+                symbol=_symbol("", asset_index),
+                name=f"Synthetic Company {asset_index}",
+                asset_class=AssetClass.EQUITY,
+                sector=sector_names[sector],
+                price=asset_price,
+                market_cap=cap,
+                currency=currencies[listed_in],
+                pe_ratio=pe,
+                dividend_yield=dividend,
+                earnings_per_share=eps,
+                book_value=book,
+            )
+
+
+def _iter_bonds(count: int, equity_count: int, seed: int) -> Iterator[Bond]:
+    sector_names = list(EQUITY_SECTORS)
+    for chunk, index in _chunks(count):
+        rng = _chunk_rng(seed, AssetClass.FIXED_INCOME, chunk)
+        size = index.size
+        corporate = (rng.random(size) < CORPORATE_BOND_SHARE) & (equity_count > 0)
+        # Cubing the draw favors low ranks, so the largest companies issue the most bonds
+        issuer = np.minimum((rng.random(size) ** 3 * equity_count).astype(np.int64), max(equity_count - 1, 0))
+        issuer_sector = equity_sector_codes(seed, issuer)
+        rating = _weighted_choice(_CREDIT_RATING_WEIGHTS, rng.random(size))
+        rating = np.where(corporate, rating, 0)
+        coupon = np.round(rng.uniform(0.005, 0.07, size), 4)
+        ytm = np.round(np.clip(0.035 + np.take(_CREDIT_SPREADS, rating) + rng.normal(0.0, 0.004, size), 0.0, None), 4)
+        maturity_year = rng.integers(2026, 2056, size)
+        maturity_month = rng.integers(1, 13, size)
+        price = np.round(100.0 * (1.0 + (coupon - ytm) * np.minimum(maturity_year - 2025, 10) / 2.0), 2)
+        price = np.maximum(price, 1.0)
+        rows = zip(
+            index.tolist(),
+            corporate.tolist(),
+            issuer.tolist(),
+            issuer_sector.tolist(),
+            rating.tolist(),
+            price.tolist(),
+            ytm.tolist(),
+            coupon.tolist(),
+            maturity_year.tolist(),
+            maturity_month.tolist(),
+        )
+        for asset_index, is_corporate, issuer_index, sector, grade, bond_price, bond_yield, rate, year, month in rows:
+            yield Bond(
+                id=f"BD{asset_index:07d}",
+                symbol=_symbol("B", asset_index),
+                name=f"Synthetic {'Corporate' if is_corporate else 'Government'} Bond {asset_index}",
+                asset_class=AssetClass.FIXED_INCOME,
+                sector=sector_names[sector] if is_corporate else "Government",
+                price=bond_price,
+                yield_to_maturity=bond_yield,
+                coupon_rate=rate,
+                maturity_date=f"{year}-{month:02d}-15",
+                credit_rating=CREDIT_RATINGS[grade],
+                issuer_id=equity_id(issuer_index) if is_corporate else None,
+            )
+
+
+def _iter_commodities(count: int, seed: int) -> Iterator[Commodity]:
+    for chunk, index in _chunks(count):
+        rng = _chunk_rng(seed, AssetClass.COMMODITY, chunk)
+        size = index.size
+        sectors = rng.integers(0, len(COMMODITY_SECTORS), size)
+        price = rng.lognormal(np.log(50.0), 1.5, size)
+        contract_size = np.take([100, 1000, 5000, 10000], rng.integers(0, 4, size))
+        volatility = rng.uniform(0.12, 0.5, size)
+        rows = zip(
+            index.tolist(),
+            sectors.tolist(),
+            price.round(2).tolist(),
+            contract_size.tolist(),
+            volatility.round(3).tolist(),
+        )
+        for asset_index, sector, asset_price, contract, vol in rows:
+            yield Commodity(
+                id=f"CM{asset_index:07d}",
+                symbol=_symbol("C", asset_index),
+                name=f"Synthetic Commodity {asset_index}",
+                asset_class=AssetClass.COMMODITY,
+                sector=COMMODITY_SECTORS[sector],
+                price=asset_price,
+                contract_size=float(contract),
+                volatility=vol,
+            )
+
+
+def _iter_currencies(count: int, seed: int) -> Iterator[Currency]:
+    for chunk, index in _chunks(count):
+        rng = _chunk_rng(seed, AssetClass.CURRENCY, chunk)
+        size = index.size
+        exchange_rate = rng.lognormal(0.0, 1.5, size)
+        central_bank_rate = rng.uniform(0.0, 0.08, size)
+        for asset_index, rate, policy_rate in zip(
+            index.tolist(), exchange_rate.round(4).tolist(), central_bank_rate.round(4).tolist()
+        ):
+            yield Currency(
+                id=f"FX{asset_index:07d}",
+                symbol=_symbol("X", asset_index),
+                name=f"Synthetic Currency {asset_index}",
+                asset_class=AssetClass.CURRENCY,
+                sector="Forex",
+                price=rate,
+                exchange_rate=rate,
+                country=f"Country {asset_index}",
+                central_bank_rate=policy_rate,
+            )
+
+
+def iter_synthetic_assets(asset_count: int, seed: int = 0) -> Iterator[Asset]:
+    """
+    Generate a synthetic universe one asset at a time.
+
+    Assets come class by class: equities in market-cap rank order (ids `EQ0000000`...), then bonds (`BD...`),
+    commodities (`CM...`) and currencies (`FX...`).
+
+    Parameters:
+        asset_count (int): Total number of assets, split across classes by `CLASS_WEIGHTS`.
+        seed (int): Seed; the same count and seed always produce the same assets.
+
+    Returns:
+        Iterator[Asset]: The assets, generated lazily.
+
+    Raises:
+        ValueError: If `asset_count` is negative.
+    """
+    counts = class_counts(asset_count)
+    yield from _iter_equities(counts[AssetClass.EQUITY], seed)
+    yield from _iter_bonds(counts[AssetClass.FIXED_INCOME], counts[AssetClass.EQUITY], seed)
+    yield from _iter_commodities(counts[AssetClass.COMMODITY], seed)
+    yield from _iter_currencies(counts[AssetClass.CURRENCY], seed)
+
+
+_EVENT_DESCRIPTIONS = {
+    RegulatoryActivity.EARNINGS_REPORT: "Quarterly earnings report",
+    RegulatoryActivity.SEC_FILING: "Periodic regulatory filing",
+    RegulatoryActivity.DIVIDEND_ANNOUNCEMENT: "Dividend announcement",
+    RegulatoryActivity.BOND_ISSUANCE: "New bond issuance",
+    RegulatoryActivity.ACQUISITION: "Acquisition announcement",
+    RegulatoryActivity.BANKRUPTCY: "Bankruptcy filing",
+}
+_EVENT_WEIGHTS = (0.45, 0.25, 0.15, 0.10, 0.04, 0.01)
+
+
+def iter_synthetic_events(
+    asset_count: int, seed: int = 0, event_rate: float = 0.02, max_related: int = 3
+) -> Iterator[RegulatoryEvent]:
+    """
+    Generate regulatory events for the universe of `iter_synthetic_assets(asset_count, seed)`.
+
+    Events concern equities, favoring large companies, and relate to up to `max_related` companies of the same
+    sector.
+
+    Parameters:
+        asset_count (int): Size of the universe the events belong to.
+        seed (int): Seed of that universe.
+        event_rate (float): Events per asset.
+        max_related (int): Largest number of related assets per event.
+
+    Returns:
+        Iterator[RegulatoryEvent]: The events, generated lazily.
+
+    Raises:
+        ValueError: If `asset_count` or `event_rate` is negative.
+    """
+    if event_rate < 0:
+        raise ValueError("event_rate must be non-negative")
+    equity_count = class_counts(asset_count)[AssetClass.EQUITY]
+    if equity_count == 0:
+        return
+    event_types = list(_EVENT_DESCRIPTIONS)
+    # Peer candidates drawn per event; those outside the event's sector are dropped
+    candidates = max(max_related, 0) * 4
+    for chunk, index in _chunks(int(asset_count * event_rate)):
+        rng = np.random.default_rng([seed, len(CLASS_WEIGHTS), chunk])
+        size = index.size
+        subject = np.minimum((rng.random(size) ** 2 * equity_count).astype(np.int64), equity_count - 1)
+        kinds = _weighted_choice(_EVENT_WEIGHTS, rng.random(size))
+        impact = np.round(np.clip(rng.normal(0.0, 0.25, size), -1.0, 1.0), 3)
+        day = rng.integers(0, 365, size)
+        dates = (np.datetime64("2024-01-01") + day).astype(str)
+        peers = rng.integers(0, equity_count, (size, candidates))
+        same_sector = equity_sector_codes(seed, peers) == equity_sector_codes(seed, subject)[:, None]
+        same_sector &= peers != subject[:, None]
+        rows = zip(
+            index.tolist(),
+            subject.tolist(),
+            kinds.tolist(),
+            dates.tolist(),
+            impact.tolist(),
+            peers.tolist(),
+            same_sector.tolist(),
+        )
+        for event_index, subject_index, kind_code, date, impact_score, candidate_peers, matches in rows:
+            kind = event_types[kind_code]
+            related = [peer for peer, match in zip(candidate_peers, matches) if match]
+            yield RegulatoryEvent(
+                id=f"EV{event_index:08d}",
+                asset_id=equity_id(subject_index),
+                event_type=kind,
+                date=date,
+                description=_EVENT_DESCRIPTIONS[kind],
+                impact_score=impact_score,
+                related_assets=[equity_id(peer) for peer in list(dict.fromkeys(related))[:max_related]],
+            )
+
+
+def iter_price_histories(
+    assets: Iterable[Asset], days: int = 252, seed: int = 0
+) -> Iterator[Tuple[str, np.ndarray]]:
+    """
+    Simulate daily closing prices for each asset as a geometric random walk ending at the asset's price.
+
+    Parameters:
+        assets (Iterable[Asset]): Assets to simulate, consumed lazily.
+        days (int): Number of daily prices per asset.
+        seed (int): Seed; the same assets in the same order always get the same histories.
+
+    Returns:
+        Iterator[Tuple[str, np.ndarray]]: `(asset_id, prices)` pairs, oldest price first.
+    """
+    assets = iter(assets)
+    chunk = 0
+    while True:
+        batch: List[Asset] = []
+        for asset in assets:
+            batch.append(asset)
+            if len(batch) == _CHUNK_SIZE:
+                break
+        if not batch:
+            return
+        rng = np.random.default_rng([seed, len(CLASS_WEIGHTS) + 1, chunk])
+        volatility = np.array([_HISTORY_VOLATILITY.get(asset.asset_class, 0.2) for asset in batch]) / np.sqrt(252.0)
+        steps = rng.normal(0.0, 1.0, (len(batch), days)) * volatility[:, None]
+        # Walk backwards from today's price so every history ends exactly at it
+        log_path = np.cumsum(steps[:, ::-1], axis=1)[:, ::-1] - steps
+        prices = np.array([asset.price for asset in batch])[:, None] * np.exp(-log_path)
+        for asset, history in zip(batch, prices):
+            yield asset.id, history
+        chunk += 1
+
+
+# Strength of each derived relationship type; regulatory impacts use the event's absolute impact score instead
+SYNTHETIC_RELATIONSHIP_STRENGTHS: Dict[str, float] = {
+    "corporate_bond_to_equity": 0.9,
+    "same_sector": 0.7,
+}
+
+
+def synthetic_relationships(
+    assets: Iterable[Asset], events: Iterable[RegulatoryEvent] = ()
+) -> Dict[str, List[Tuple[str, str, float]]]:
+    """
+    Derive the relationships of a synthetic universe in a single pass over its assets and events.
+
+    Corporate bonds link to their issuer, each equity links both ways to the next equity of its sector, so sector
+    peers form a chain rather than a clique and the edge count stays linear in the universe size, and each event
+    links its subject to its related assets with the event's absolute impact score. A repeated link keeps its
+    strongest strength.
+
+    Parameters:
+        assets (Iterable[Asset]): Assets of the universe, in generation order.
+        events (Iterable[RegulatoryEvent]): Regulatory events of the universe.
+
+    Returns:
+        Dict[str, List[Tuple[str, str, float]]]: `(target_id, rel_type, strength)` lists per source id, in the
+            layout of `AssetRelationshipGraph.relationships`.
+    """
+    edges: Dict[str, Dict[Tuple[str, str], float]] = {}
+
+    def link(source_id: str, target_id: str, rel_type: str, strength: float) -> None:
+        targets = edges.setdefault(source_id, {})
+        key = (target_id, rel_type)
+        targets[key] = max(strength, targets.get(key, strength))
+
+    previous_in_sector: Dict[str, str] = {}
+    issuer_strength = SYNTHETIC_RELATIONSHIP_STRENGTHS["corporate_bond_to_equity"]
+    sector_strength = SYNTHETIC_RELATIONSHIP_STRENGTHS["same_sector"]
+    for asset in assets:
+        if isinstance(asset, Bond) and asset.issuer_id:
+            link(asset.id, asset.issuer_id, "corporate_bond_to_equity", issuer_strength)
+        elif isinstance(asset, Equity):
+            peer_id = previous_in_sector.get(asset.sector)
+            if peer_id is not None:
+                link(peer_id, asset.id, "same_sector", sector_strength)
+                link(asset.id, peer_id, "same_sector", sector_strength)
+            previous_in_sector[asset.sector] = asset.id
+    for event in events:
+        for related_id in event.related_assets:
+            link(event.asset_id, related_id, "regulatory_impact", abs(event.impact_score))
+    return {
+        source_id: [(target_id, rel_type, strength) for (target_id, rel_type), strength in targets.items()]
+        for source_id, targets in edges.items()
+    }
+
+
+def create_synthetic_database(
+    asset_count: int, seed: int = 0, event_rate: float = 0.02, build_relationships: bool = True
+) -> AssetRelationshipGraph:
+    """
+    Build a graph over a synthetic universe, the scalable counterpart of `create_sample_database`.
+
+    Parameters:
+        asset_count (int): Total number of assets.
+        seed (int): Seed of the universe.
+        event_rate (float): Regulatory events per asset.
+        build_relationships (bool): Add the relationships `synthetic_relationships` derives.
+
+    Returns:
+        AssetRelationshipGraph: Graph holding the generated assets and events.
+    """
+    try:
+        logger.info(f"Creating synthetic database with {asset_count} assets (seed {seed})")
+        graph = AssetRelationshipGraph()
+        for asset in iter_synthetic_assets(asset_count, seed):
+            graph.add_asset(asset)
+        for event in iter_synthetic_events(asset_count, seed, event_rate):
+            graph.add_regulatory_event(event)
+        if build_relationships:
+            relationships = synthetic_relationships(graph.assets.values(), graph.regulatory_events)
+            for source_id, edges in relationships.items():
+                for target_id, rel_type, strength in edges:
+                    graph.add_relationship(source_id, target_id, rel_type, strength)
+        return graph
+    except Exception as e:
+        logger.error(f"Failed to create synthetic database: {e}")
+        raise
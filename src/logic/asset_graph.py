@@ -1,19 +1,206 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
+from .graph_adjacency import CompactAdjacency, Subgraph
+from .graph_centrality import CentralityScores, compute_centrality
+from .graph_communities import CommunityAssignment, detect_communities
+from .graph_paths import Path, shortest_paths
+
 
 class AssetRelationshipGraph:
     """Minimal interface used by visualization code.
 
     Attributes:
         relationships: Dict[source_id, List[(target_id, rel_type, strength)]]
+        assets: Dict[asset_id, Asset]
+        regulatory_events: List[RegulatoryEvent]
+
+    Derived structures and caches key on `version`, which changes only through `add_asset`,
+    `add_regulatory_event`, `add_relationship`, assigning one of the attributes above and `invalidate_caches()`.
+    Code editing the containers in place calls `invalidate_caches()` afterwards.
     """
 
     def __init__(self) -> None:
-        self.relationships: Dict[str, List[Tuple[str, str, float]]] = {}
+        self._relationships: Dict[str, List[Tuple[str, str, float]]] = {}
+        self._assets: Dict[str, Any] = {}
+        self._regulatory_events: List[Any] = []
+        self._version = 0
+        self._adjacency: Optional[CompactAdjacency] = None
+        self._adjacency_version: Optional[int] = None
+        self._centrality: Optional[CentralityScores] = None
+        self._centrality_version: Optional[int] = None
+        self._communities: Optional[CommunityAssignment] = None
+        self._communities_version: Optional[int] = None
+        self._validated_version: Optional[int] = None
+
+    @property
+    def version(self) -> int:
+        """Counter identifying the graph's current data; it increases with every mutation."""
+        return getattr(self, "_version", 0)
+
+    def _bump_version(self) -> None:
+        self._version = self.version + 1
+
+    @property
+    def relationships(self) -> Dict[str, List[Tuple[str, str, float]]]:
+        return self._relationships
+
+    @relationships.setter
+    def relationships(self, relationships: Dict[str, List[Tuple[str, str, float]]]) -> None:
+        self._relationships = relationships
+        self._bump_version()
+
+    @property
+    def assets(self) -> Dict[str, Any]:
+        # Subclasses may skip __init__, so the containers below are created on first use
+        return self.__dict__.setdefault("_assets", {})
+
+    @assets.setter
+    def assets(self, assets: Dict[str, Any]) -> None:
+        self._assets = assets
+        self._bump_version()
+
+    @property
+    def regulatory_events(self) -> List[Any]:
+        return self.__dict__.setdefault("_regulatory_events", [])
+
+    @regulatory_events.setter
+    def regulatory_events(self, events: List[Any]) -> None:
+        self._regulatory_events = events
+        self._bump_version()
+
+    def add_asset(self, asset: Any) -> None:
+        """Add `asset`, replacing any asset with the same id."""
+        self.assets[asset.id] = asset
+        self._bump_version()
+
+    def add_regulatory_event(self, event: Any) -> None:
+        """Append a regulatory event."""
+        self.regulatory_events.append(event)
+        self._bump_version()
+
+    def add_relationship(
+        self, source_id: str, target_id: str, rel_type: str, strength: float, bidirectional: bool = False
+    ) -> None:
+        """Add a `rel_type` edge from `source_id` to `target_id`, or update its strength if it exists.
+
+        With `bidirectional`, the reverse edge is added or updated as well.
+        """
+        edges = self.__dict__.setdefault("_relationships", {}).setdefault(source_id, [])
+        for position, (existing_target, existing_type, _) in enumerate(edges):
+            if existing_target == target_id and existing_type == rel_type:
+                edges[position] = (target_id, rel_type, strength)
+                break
+        else:
+            edges.append((target_id, rel_type, strength))
+        self._bump_version()
+        if bidirectional:
+            self.add_relationship(target_id, source_id, rel_type, strength)
+
+    def compact_adjacency(self) -> CompactAdjacency:
+        """Return the CSR form of `relationships`, rebuilt whenever the graph's `version` changes."""
+        version = self.version
+        if getattr(self, "_adjacency", None) is None or self._adjacency_version != version:
+            self._adjacency = CompactAdjacency.build(self.relationships, extra_nodes=self.assets)
+            self._adjacency_version = version
+        return self._adjacency
+
+    def mark_validated(self) -> None:
+        """Record that the current relationships and visualization data passed validation.
+
+        The flag belongs to the current `version`, so it lapses with the next mutation or `invalidate_caches()`.
+        """
+        self._validated_version = self.version
+
+    @property
+    def is_validated(self) -> bool:
+        """Whether the graph's current data was validated by `mark_validated()`."""
+        return getattr(self, "_validated_version", None) == self.version
+
+    def invalidate_caches(self) -> None:
+        """Start a new `version` after in-place edits and drop the structures derived from the previous one.
+
+        The last community assignment is kept to seed the next detection.
+        """
+        self._bump_version()
+        self._adjacency = None
+        self._adjacency_version = None
+        self._centrality = None
+        self._centrality_version = None
+        self._communities_version = None
+
+    def neighborhood(
+        self,
+        asset_id: str,
+        hops: int = 1,
+        rel_types: Optional[Iterable[str]] = None,
+        min_strength: float = 0.0,
+        direction: str = "both",
+    ) -> Subgraph:
+        """Return the k-hop neighborhood of `asset_id` as an induced subgraph.
+
+        Traversal follows outgoing edges, incoming edges or both, restricted to the given relationship types and
+        minimum strength; the returned edges are every edge among the reached nodes that passes the same filters.
+
+        Raises:
+            KeyError: If `asset_id` is not in the graph.
+            ValueError: If `direction` is not "out", "in" or "both", or `hops` is negative.
+        """
+        return self.compact_adjacency().neighborhood(asset_id, hops, rel_types, min_strength, direction)
+
+    def shortest_paths(
+        self,
+        source: str,
+        target: str,
+        k: int = 1,
+        rel_types: Optional[Iterable[str]] = None,
+        min_strength: float = 0.0,
+        direction: str = "both",
+    ) -> List[Path]:
+        """Return up to `k` strongest loopless paths from `source` to `target`.
+
+        Edges are weighted by `-log(strength)`, so the first path maximises the product of strengths along it.
+
+        Raises:
+            KeyError: If either asset is not in the graph.
+            ValueError: If `k` is less than 1 or `direction` is invalid.
+        """
+        return shortest_paths(self.compact_adjacency(), source, target, k, rel_types, min_strength, direction)
+
+    def centrality(self) -> CentralityScores:
+        """Return PageRank, eigenvector and sampled betweenness centrality for every node.
+
+        Scores are computed once per `version`, so they are reused until the graph changes.
+        """
+        adjacency = self.compact_adjacency()
+        if getattr(self, "_centrality", None) is None or self._centrality_version != self._adjacency_version:
+            self._centrality = compute_centrality(adjacency)
+            self._centrality_version = self._adjacency_version
+        return self._centrality
+
+    def communities(self) -> CommunityAssignment:
+        """Return a community id for every node from Louvain-style modularity optimization.
+
+        The assignment is computed once per `version`. When the graph changes, the previous assignment seeds the new
+        detection, so only affected nodes move and unchanged communities keep their ids.
+        """
+        adjacency = self.compact_adjacency()
+        previous = getattr(self, "_communities", None)
+        if previous is None or self._communities_version != self._adjacency_version:
+            initial = previous.labels_for(adjacency.node_ids) if previous is not None else None
+            self._communities = detect_communities(adjacency, initial_labels=initial)
+            self._communities_version = self._adjacency_version
+        return self._communities
+
+    def seed_communities(self, other: "AssetRelationshipGraph") -> None:
+        """Start this graph's next community detection from `other`'s last assignment, if it has one."""
+        previous = getattr(other, "_communities", None)
+        if previous is not None:
+            self._communities = previous
+            self._communities_version = None
 
     def get_3d_visualization_data_enhanced(self) -> Tuple[np.ndarray, List[str], List[str], List[str]]:
         """Return positions, asset_ids, colors, hover_texts for visualization.
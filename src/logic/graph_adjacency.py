@@ -0,0 +1,279 @@
+"""Compact array-based adjacency for graph traversal and analytics.
+
+The graph's `relationships` mapping (source id to a list of `(target_id, relationship_type, strength)` tuples) is
+convenient to build but slow to traverse. `CompactAdjacency` stores the same edges in compressed sparse row (CSR)
+form, indexed both by source and by target, so queries run as NumPy operations over contiguous arrays.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+DIRECTIONS = ("out", "in", "both")
+
+
+def gather_ranges(indptr: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """
+    Concatenate the CSR ranges `indptr[r]:indptr[r + 1]` of every row in `rows` without a Python loop.
+
+    Parameters:
+        indptr (np.ndarray): CSR row pointer array.
+        rows (np.ndarray): Row indices to gather.
+
+    Returns:
+        np.ndarray: Positions into the CSR column arrays, row by row.
+    """
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return np.arange(total, dtype=np.int64) + offsets
+
+
+@dataclass
+class Subgraph:
+    """
+    Result of a neighborhood query.
+
+    Attributes:
+        center: Asset the query started from.
+        nodes: Reached asset ids, ordered by hop distance then id.
+        hops: Hop distance of each node in `nodes`.
+        edges: Induced `(source_id, target_id, relationship_type, strength)` edges among `nodes` that pass the filters.
+    """
+
+    center: str
+    nodes: List[str] = field(default_factory=list)
+    hops: List[int] = field(default_factory=list)
+    edges: List[Tuple[str, str, str, float]] = field(default_factory=list)
+
+
+@dataclass
+class CompactAdjacency:
+    """
+    Directed, typed, weighted edges in CSR form.
+
+    Attributes:
+        node_ids: Node ids in index order (sorted).
+        node_index: Node id to index.
+        source: Source index of each edge; edges are ordered by source.
+        target: Target index of each edge.
+        strength: Strength of each edge (float64).
+        edge_type: Code of each edge's relationship type into `relationship_types`.
+        relationship_types: Relationship type table.
+        out_indptr: CSR row pointer over edges grouped by source.
+        in_order: Edge positions grouped by target.
+        in_indptr: CSR row pointer over `in_order`.
+    """
+
+    node_ids: List[str]
+    node_index: Dict[str, int]
+    source: np.ndarray
+    target: np.ndarray
+    strength: np.ndarray
+    edge_type: np.ndarray
+    relationship_types: List[str]
+    out_indptr: np.ndarray
+    in_order: np.ndarray
+    in_indptr: np.ndarray
+
+    @classmethod
+    def build(
+        cls, relationships: Dict[str, List[Tuple[str, str, float]]], extra_nodes: Iterable[str] = ()
+    ) -> "CompactAdjacency":
+        """
+        Build the adjacency from a relationships mapping.
+
+        Parameters:
+            relationships (Dict[str, List[Tuple[str, str, float]]]): Source id to outgoing `(target, type, strength)`.
+            extra_nodes (Iterable[str]): Ids of nodes to include even if they have no edges.
+
+        Returns:
+            CompactAdjacency: The compact representation.
+        """
+        ids = set(extra_nodes)
+        ids.update(relationships)
+        for rels in relationships.values():
+            ids.update(target_id for target_id, _, _ in rels)
+        node_ids = sorted(ids)
+        node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+
+        type_codes: Dict[str, int] = {}
+        sources: List[int] = []
+        targets: List[int] = []
+        types: List[int] = []
+        strengths: List[float] = []
+        for source_id, rels in relationships.items():
+            source_index = node_index[source_id]
+            for target_id, rel_type, strength in rels:
+                sources.append(source_index)
+                targets.append(node_index[target_id])
+                types.append(type_codes.setdefault(rel_type, len(type_codes)))
+                strengths.append(strength)
+
+        source = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(source, kind="stable")
+        source = source[order]
+        target = np.asarray(targets, dtype=np.int64)[order]
+        node_count = len(node_ids)
+        out_indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(source, minlength=node_count), out=out_indptr[1:])
+        in_order = np.argsort(target, kind="stable")
+        in_indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(target, minlength=node_count), out=in_indptr[1:])
+
+        return cls(
+            node_ids=node_ids,
+            node_index=node_index,
+            source=source,
+            target=target,
+            strength=np.asarray(strengths, dtype=np.float64)[order],
+            edge_type=np.asarray(types, dtype=np.int64)[order],
+            relationship_types=list(type_codes),
+            out_indptr=out_indptr,
+            in_order=in_order,
+            in_indptr=in_indptr,
+        )
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return int(self.source.size)
+
+    @cached_property
+    def edge_cost(self) -> np.ndarray:
+        """
+        Path cost of each edge, `-log(strength)`, so that the cheapest path is the one with the largest strength product.
+
+        Strengths above 1 cost 0; edges with non-positive strength cost infinity and are never traversed.
+        """
+        with np.errstate(divide="ignore"):
+            cost = -np.log(np.clip(self.strength, 0.0, 1.0))
+        return np.maximum(cost, 0.0)
+
+    @cached_property
+    def undirected(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Symmetric view of the graph without self-loops: every connected pair appears once in each direction.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: `(first, second, weight)` sorted by `first`, then `second`;
+            `weight` sums the strengths of all edges between the pair in either direction.
+        """
+        n = self.node_count
+        first = np.concatenate([self.source, self.target])
+        second = np.concatenate([self.target, self.source])
+        keep = first != second
+        codes, inverse = np.unique(first[keep] * n + second[keep], return_inverse=True)
+        weight = np.bincount(inverse, weights=np.concatenate([self.strength, self.strength])[keep])
+        return codes // n, codes % n, weight
+
+    def edge_mask(self, rel_types: Optional[Iterable[str]] = None, min_strength: float = 0.0) -> np.ndarray:
+        """
+        Return a boolean mask of the edges matching a relationship-type and strength filter.
+
+        Parameters:
+            rel_types (Optional[Iterable[str]]): Relationship types to keep; all types when omitted.
+            min_strength (float): Minimum edge strength.
+
+        Returns:
+            np.ndarray: One flag per edge.
+        """
+        mask = self.strength >= min_strength
+        if rel_types is not None:
+            wanted = [self.relationship_types.index(t) for t in set(rel_types) if t in self.relationship_types]
+            mask &= np.isin(self.edge_type, wanted)
+        return mask
+
+    def expand(self, frontier: np.ndarray, direction: str, edge_mask: np.ndarray) -> np.ndarray:
+        """
+        Return the neighbors of the frontier nodes reachable over edges allowed by `edge_mask`.
+
+        Parameters:
+            frontier (np.ndarray): Node indices to expand.
+            direction (str): "out" follows edges forwards, "in" backwards, "both" either way.
+            edge_mask (np.ndarray): Edge filter from `edge_mask`.
+
+        Returns:
+            np.ndarray: Neighbor node indices, possibly with duplicates.
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"direction must be one of {DIRECTIONS}")
+        parts = []
+        if direction in ("out", "both"):
+            edges = gather_ranges(self.out_indptr, frontier)
+            parts.append(self.target[edges[edge_mask[edges]]])
+        if direction in ("in", "both"):
+            edges = self.in_order[gather_ranges(self.in_indptr, frontier)]
+            parts.append(self.source[edges[edge_mask[edges]]])
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    def neighborhood(
+        self,
+        asset_id: str,
+        hops: int = 1,
+        rel_types: Optional[Iterable[str]] = None,
+        min_strength: float = 0.0,
+        direction: str = "both",
+    ) -> Subgraph:
+        """
+        Breadth-first search from `asset_id` using a visited bitset, returning the induced subgraph.
+
+        Parameters:
+            asset_id (str): Node to start from.
+            hops (int): Maximum number of hops.
+            rel_types (Optional[Iterable[str]]): Only traverse and return edges of these types.
+            min_strength (float): Only traverse and return edges at least this strong.
+            direction (str): "out", "in" or "both".
+
+        Returns:
+            Subgraph: Reached nodes with their hop distance and the filtered edges among them.
+
+        Raises:
+            KeyError: If `asset_id` is not in the graph.
+            ValueError: If `direction` is invalid or `hops` is negative.
+        """
+        if asset_id not in self.node_index:
+            raise KeyError(asset_id)
+        if hops < 0:
+            raise ValueError("hops must be non-negative")
+        mask = self.edge_mask(rel_types, min_strength)
+        distance = np.full(self.node_count, -1, dtype=np.int64)
+        start = self.node_index[asset_id]
+        distance[start] = 0
+        frontier = np.array([start], dtype=np.int64)
+        for hop in range(1, hops + 1):
+            reached = self.expand(frontier, direction, mask)
+            reached = np.unique(reached[distance[reached] < 0])
+            if reached.size == 0:
+                break
+            distance[reached] = hop
+            frontier = reached
+
+        visited = distance >= 0
+        members = np.flatnonzero(visited)
+        members = members[np.lexsort((members, distance[members]))]
+        induced = np.flatnonzero(mask & visited[self.source] & visited[self.target])
+        return Subgraph(
+            center=asset_id,
+            nodes=[self.node_ids[i] for i in members],
+            hops=distance[members].tolist(),
+            edges=[
+                (
+                    self.node_ids[self.source[e]],
+                    self.node_ids[self.target[e]],
+                    self.relationship_types[self.edge_type[e]],
+                    float(self.strength[e]),
+                )
+                for e in induced
+            ],
+        )
@@ -0,0 +1,263 @@
+"""Louvain-style community detection over the compact adjacency.
+
+Communities are found on the undirected, strength-weighted graph by alternating two phases until nothing changes:
+
+- Local moving: every node's modularity gain for joining each neighboring community is computed at once from the
+  edge arrays, and a random subset of the nodes with a positive best gain moves. Moving all of them together can
+  oscillate, so a pass that lowers modularity is rolled back and retried with a smaller subset.
+- Aggregation: each community becomes a single node whose edges are the summed weights between communities.
+
+A previous partition can seed the first level, which makes refreshing after a small graph change cheap, and the
+resulting ids are aligned with the previous ones so colors and cached layouts stay stable.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .graph_adjacency import CompactAdjacency
+
+# Share of the improving nodes moved per pass before any rollback
+_MOVE_FRACTION = 0.5
+
+# Smallest modularity gain treated as an improvement
+_MIN_GAIN = 1e-12
+
+
+@dataclass
+class CommunityAssignment:
+    """
+    Community id per node, aligned with `node_ids`.
+
+    Attributes:
+        node_ids: Node ids in index order.
+        labels: Community id of each node; ids are non-negative but not necessarily contiguous after alignment.
+        modularity: Modularity of the partition at the resolution used.
+        levels: Number of aggregation levels the detection ran.
+    """
+
+    node_ids: List[str]
+    labels: np.ndarray
+    modularity: float
+    levels: int
+
+    @property
+    def community_count(self) -> int:
+        return int(np.unique(self.labels).size)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return `{node_id: community_id}`."""
+        return dict(zip(self.node_ids, self.labels.tolist()))
+
+    def labels_for(self, asset_ids: Sequence[str]) -> np.ndarray:
+        """Return the community id of each of `asset_ids`, or -1 for ids not in the assignment."""
+        index = dict(zip(self.node_ids, self.labels.tolist()))
+        return np.array([index.get(asset_id, -1) for asset_id in asset_ids], dtype=np.int64)
+
+
+def modularity(
+    first: np.ndarray, second: np.ndarray, weight: np.ndarray, labels: np.ndarray, resolution: float = 1.0
+) -> float:
+    """
+    Modularity of a partition of a symmetric weighted edge list.
+
+    Parameters:
+        first (np.ndarray): First endpoint of each directed half-edge; every pair must appear in both directions.
+        second (np.ndarray): Second endpoint of each half-edge; `first == second` marks a self-loop.
+        weight (np.ndarray): Weight of each half-edge.
+        labels (np.ndarray): Community of each node.
+        resolution (float): Resolution parameter; larger values favor smaller communities.
+
+    Returns:
+        float: Modularity in [-0.5, 1]; 0 for a graph without weight.
+    """
+    total = weight.sum()
+    if total <= 0:
+        return 0.0
+    inside = weight[labels[first] == labels[second]].sum()
+    degree_sums = np.bincount(labels[first], weights=weight, minlength=labels.size)
+    return float(inside / total - resolution * np.square(degree_sums / total).sum())
+
+
+def _local_moves(
+    first: np.ndarray,
+    second: np.ndarray,
+    weight: np.ndarray,
+    labels: np.ndarray,
+    resolution: float,
+    rng: np.random.Generator,
+    max_passes: int,
+) -> Tuple[np.ndarray, bool]:
+    """Move nodes between communities while modularity improves; return the labels and whether any node moved."""
+    n = labels.size
+    total = weight.sum()
+    degree = np.bincount(first, weights=weight, minlength=n)
+    links = first != second
+    link_first, link_second, link_weight = first[links], second[links], weight[links]
+    current = modularity(first, second, weight, labels, resolution)
+    fraction = _MOVE_FRACTION
+    moved = False
+
+    for _ in range(max_passes):
+        if link_weight.size == 0:
+            break
+        community_degree = np.bincount(labels, weights=degree, minlength=n)
+        # Weight from each node to each neighboring community
+        codes, inverse = np.unique(link_first * n + labels[link_second], return_inverse=True)
+        to_community = np.bincount(inverse, weights=link_weight)
+        node, community = codes // n, codes % n
+        own = labels[node] == community
+
+        own_links = np.zeros(n)
+        own_links[node[own]] = to_community[own]
+        stay = own_links - resolution * degree * (community_degree[labels] - degree) / total
+        join = to_community - resolution * degree[node] * community_degree[community] / total
+        improvement = np.where(own, 0.0, join - stay[node])
+
+        # Codes are sorted, so each node's options are contiguous: keep the first best option per node
+        starts = np.flatnonzero(np.r_[True, node[1:] != node[:-1]])
+        best = np.maximum.reduceat(improvement, starts)
+        group = np.cumsum(np.r_[False, node[1:] != node[:-1]])
+        candidates = np.flatnonzero((improvement == best[group]) & (improvement > _MIN_GAIN))
+        candidates = candidates[np.r_[True, node[candidates][1:] != node[candidates][:-1]]] if candidates.size else candidates
+        if candidates.size == 0:
+            break
+
+        while True:
+            chosen = candidates[rng.random(candidates.size) < fraction]
+            if chosen.size == 0:
+                chosen = candidates[rng.integers(candidates.size, size=1)]
+            trial = labels.copy()
+            trial[node[chosen]] = community[chosen]
+            score = modularity(first, second, weight, trial, resolution)
+            if score > current + _MIN_GAIN or chosen.size == 1:
+                break
+            fraction /= 2.0
+
+        if score <= current + _MIN_GAIN:
+            break
+        labels, current, moved = trial, score, True
+        fraction = min(_MOVE_FRACTION, fraction * 2.0)
+    return labels, moved
+
+
+def _compact(labels: np.ndarray) -> np.ndarray:
+    """Renumber labels to 0..k-1."""
+    return np.unique(labels, return_inverse=True)[1].astype(np.int64)
+
+
+def _canonical(labels: np.ndarray) -> np.ndarray:
+    """Renumber communities by decreasing size, ties broken by their smallest member."""
+    labels = _compact(labels)
+    sizes = np.bincount(labels)
+    first_member = np.full(sizes.size, labels.size, dtype=np.int64)
+    np.minimum.at(first_member, labels, np.arange(labels.size))
+    rank = np.empty(sizes.size, dtype=np.int64)
+    rank[np.lexsort((first_member, -sizes))] = np.arange(sizes.size)
+    return rank[labels]
+
+
+def _align(labels: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    """
+    Reuse previous community ids: each new community takes the previous id it overlaps most, largest overlaps first.
+
+    Communities that share no unclaimed previous id get fresh ids above every previous one.
+    """
+    known = previous >= 0
+    if not known.any():
+        return labels
+    pairs, overlap = np.unique(np.stack([labels[known], previous[known]]), axis=1, return_counts=True)
+    mapping: Dict[int, int] = {}
+    claimed = set()
+    for i in np.lexsort((pairs[1], pairs[0], -overlap)):
+        new_id, old_id = int(pairs[0, i]), int(pairs[1, i])
+        if new_id not in mapping and old_id not in claimed:
+            mapping[new_id] = old_id
+            claimed.add(old_id)
+    next_id = int(previous.max()) + 1
+    lookup = np.empty(int(labels.max()) + 1, dtype=np.int64)
+    for new_id in range(lookup.size):
+        if new_id in mapping:
+            lookup[new_id] = mapping[new_id]
+        else:
+            lookup[new_id] = next_id
+            next_id += 1
+    return lookup[labels]
+
+
+def detect_communities(
+    adjacency: CompactAdjacency,
+    resolution: float = 1.0,
+    initial_labels: Optional[np.ndarray] = None,
+    seed: int = 0,
+    max_levels: int = 10,
+    max_passes: int = 50,
+) -> CommunityAssignment:
+    """
+    Partition the graph into communities by multi-level modularity optimization.
+
+    Parameters:
+        adjacency (CompactAdjacency): Graph to partition; edge direction is ignored and strengths are weights.
+        resolution (float): Resolution parameter; larger values favor smaller communities.
+        initial_labels (Optional[np.ndarray]): Previous community id per node (-1 for new nodes) to start from and
+            align the result with.
+        seed (int): Seed for choosing which nodes move in each pass.
+        max_levels (int): Aggregation level limit.
+        max_passes (int): Local moving pass limit per level.
+
+    Returns:
+        CommunityAssignment: Community ids aligned with `adjacency.node_ids`.
+
+    Raises:
+        ValueError: If `initial_labels` does not have one entry per node.
+    """
+    n = adjacency.node_count
+    first, second, weight = adjacency.undirected
+    weight = np.clip(weight, 0.0, None)
+    if initial_labels is not None:
+        initial_labels = np.asarray(initial_labels, dtype=np.int64)
+        if initial_labels.shape != (n,):
+            raise ValueError(f"initial_labels must have one entry per node ({n}), got shape {initial_labels.shape}")
+    if n == 0:
+        return CommunityAssignment(adjacency.node_ids, np.empty(0, dtype=np.int64), 0.0, 0)
+
+    rng = np.random.default_rng(seed)
+    if initial_labels is None:
+        labels = np.arange(n, dtype=np.int64)
+    else:
+        # Seed with the previous communities; new nodes start alone
+        fresh = initial_labels < 0
+        labels = initial_labels.copy()
+        labels[fresh] = initial_labels.max(initial=-1) + 1 + np.arange(int(fresh.sum()))
+        labels = _compact(labels)
+
+    membership = np.arange(n, dtype=np.int64)
+    level_first, level_second, level_weight = first, second, weight
+    level_labels = labels
+    levels = 0
+    for _ in range(max_levels):
+        level_labels, moved = _local_moves(
+            level_first, level_second, level_weight, level_labels, resolution, rng, max_passes
+        )
+        level_labels = _compact(level_labels)
+        levels += 1
+        membership = level_labels[membership]
+        if (not moved and levels > 1) or level_labels.max() + 1 == level_labels.size:
+            break
+        # Collapse each community into one node, keeping internal weight as a self-loop
+        size = int(level_labels.max()) + 1
+        codes, inverse = np.unique(
+            level_labels[level_first] * size + level_labels[level_second], return_inverse=True
+        )
+        level_weight = np.bincount(inverse, weights=level_weight)
+        level_first, level_second = codes // size, codes % size
+        level_labels = np.arange(size, dtype=np.int64)
+
+    labels = _canonical(membership)
+    score = modularity(first, second, weight, labels, resolution)
+    if initial_labels is not None:
+        labels = _align(labels, initial_labels)
+    return CommunityAssignment(adjacency.node_ids, labels, score, levels)
@@ -0,0 +1,233 @@
+"""Weighted shortest-path queries over the compact adjacency.
+
+Edges cost `-log(strength)`, so the cheapest path between two assets is the one whose strengths multiply to the
+largest value: a chain of strong relationships beats a single weak one. The best path is found with bidirectional
+Dijkstra; further alternatives come from Yen's algorithm, which reruns the same search from each node of the
+previous path with the already-used continuations removed.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .graph_adjacency import DIRECTIONS, CompactAdjacency
+
+_INF = float("inf")
+
+
+@dataclass
+class Path:
+    """
+    One path between two assets.
+
+    Attributes:
+        nodes: Asset ids from source to target.
+        edges: `(source_id, target_id, relationship_type, strength)` of each traversed relationship, in path order.
+            With direction "in" or "both" an edge may be traversed against its orientation.
+        cost: Sum of `-log(strength)` over the edges.
+    """
+
+    nodes: List[str] = field(default_factory=list)
+    edges: List[Tuple[str, str, str, float]] = field(default_factory=list)
+    cost: float = 0.0
+
+    @property
+    def strength(self) -> float:
+        """Product of the edge strengths along the path."""
+        return math.exp(-self.cost)
+
+    @property
+    def hops(self) -> int:
+        return len(self.edges)
+
+
+class _PathSearch:
+    """Dijkstra machinery for one query: the filtered edge costs and the traversal direction."""
+
+    def __init__(self, adjacency: CompactAdjacency, cost: np.ndarray, direction: str) -> None:
+        self.adjacency = adjacency
+        self.cost = cost
+        self.follow_out = direction in ("out", "both")
+        self.follow_in = direction in ("in", "both")
+
+    def arcs(self, node: int, forward: bool) -> List[Tuple[int, int, float]]:
+        """
+        Return `(neighbor, edge, cost)` for every traversable edge leaving `node` in the search direction.
+
+        The backward search of a bidirectional query walks the same arcs in reverse, so "out" and "in" swap.
+        """
+        adj = self.adjacency
+        use_out, use_in = (self.follow_out, self.follow_in) if forward else (self.follow_in, self.follow_out)
+        arcs: List[Tuple[int, int, float]] = []
+        if use_out:
+            start, stop = int(adj.out_indptr[node]), int(adj.out_indptr[node + 1])
+            arcs.extend(zip(adj.target[start:stop].tolist(), range(start, stop), self.cost[start:stop].tolist()))
+        if use_in:
+            edges = adj.in_order[adj.in_indptr[node] : adj.in_indptr[node + 1]]
+            arcs.extend(zip(adj.source[edges].tolist(), edges.tolist(), self.cost[edges].tolist()))
+        return arcs
+
+    def search(
+        self,
+        source: int,
+        target: int,
+        banned_nodes: FrozenSet[int] = frozenset(),
+        banned_steps: FrozenSet[Tuple[int, int]] = frozenset(),
+    ) -> Optional[Tuple[float, List[int], List[int]]]:
+        """
+        Bidirectional Dijkstra from `source` to `target`.
+
+        Parameters:
+            source (int): Start node index.
+            target (int): End node index.
+            banned_nodes (FrozenSet[int]): Nodes the path may not visit.
+            banned_steps (FrozenSet[Tuple[int, int]]): `(from, to)` node steps the path may not take.
+
+        Returns:
+            Optional[Tuple[float, List[int], List[int]]]: Cost, node indices and edge positions of the cheapest path,
+            or None if `target` is unreachable.
+        """
+        if source == target:
+            return 0.0, [source], []
+        dist: List[Dict[int, float]] = [{source: 0.0}, {target: 0.0}]
+        pred: List[Dict[int, Tuple[int, int]]] = [{}, {}]
+        settled: List[Set[int]] = [set(), set()]
+        heaps: List[List[Tuple[float, int]]] = [[(0.0, source)], [(0.0, target)]]
+        best, meet = _INF, -1
+
+        while heaps[0] and heaps[1] and heaps[0][0][0] + heaps[1][0][0] < best:
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            d, node = heapq.heappop(heaps[side])
+            if node in settled[side]:
+                continue
+            settled[side].add(node)
+            forward = side == 0
+            near, far = dist[side], dist[1 - side]
+            for neighbor, edge, weight in self.arcs(node, forward):
+                if weight == _INF or neighbor in banned_nodes:
+                    continue
+                step = (node, neighbor) if forward else (neighbor, node)
+                if step in banned_steps:
+                    continue
+                candidate = d + weight
+                if candidate < near.get(neighbor, _INF):
+                    near[neighbor] = candidate
+                    pred[side][neighbor] = (node, edge)
+                    heapq.heappush(heaps[side], (candidate, neighbor))
+                other = far.get(neighbor)
+                if other is not None and candidate + other < best:
+                    best, meet = candidate + other, neighbor
+
+        if meet < 0:
+            return None
+        nodes, edges = [meet], []
+        node = meet
+        while node in pred[0]:
+            node, edge = pred[0][node]
+            nodes.append(node)
+            edges.append(edge)
+        nodes.reverse()
+        edges.reverse()
+        node = meet
+        while node in pred[1]:
+            node, edge = pred[1][node]
+            nodes.append(node)
+            edges.append(edge)
+        return best, nodes, edges
+
+
+def shortest_paths(
+    adjacency: CompactAdjacency,
+    source_id: str,
+    target_id: str,
+    k: int = 1,
+    rel_types: Optional[Iterable[str]] = None,
+    min_strength: float = 0.0,
+    direction: str = "both",
+) -> List[Path]:
+    """
+    Return up to `k` loopless paths from `source_id` to `target_id`, cheapest (strongest) first.
+
+    Paths are distinct as node sequences; between two consecutive nodes the strongest matching edge is used.
+
+    Parameters:
+        adjacency (CompactAdjacency): Graph to search.
+        source_id (str): Start asset.
+        target_id (str): End asset.
+        k (int): Number of paths to return.
+        rel_types (Optional[Iterable[str]]): Only traverse edges of these types.
+        min_strength (float): Only traverse edges at least this strong.
+        direction (str): "out" follows edges forwards, "in" backwards, "both" either way.
+
+    Returns:
+        List[Path]: Fewer than `k` paths if no more exist; empty if the assets are not connected.
+
+    Raises:
+        KeyError: If either asset is not in the graph.
+        ValueError: If `k` is less than 1 or `direction` is invalid.
+    """
+    for asset_id in (source_id, target_id):
+        if asset_id not in adjacency.node_index:
+            raise KeyError(asset_id)
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    if direction not in DIRECTIONS:
+        raise ValueError(f"direction must be one of {DIRECTIONS}")
+
+    cost = adjacency.edge_cost
+    if rel_types is not None or min_strength > 0:
+        cost = np.where(adjacency.edge_mask(rel_types, min_strength), cost, _INF)
+    search = _PathSearch(adjacency, cost, direction)
+    source, target = adjacency.node_index[source_id], adjacency.node_index[target_id]
+
+    first = search.search(source, target)
+    if first is None:
+        return []
+    found = [first]
+    candidates: List[Tuple[float, int, List[int], List[int]]] = []
+    seen = {tuple(first[1])}
+    while len(found) < k:
+        _, previous_nodes, previous_edges = found[-1]
+        for i in range(len(previous_nodes) - 1):
+            spur = previous_nodes[i]
+            root = previous_nodes[: i + 1]
+            banned_steps = frozenset(
+                (spur, nodes[i + 1]) for _, nodes, _ in found if len(nodes) > i + 1 and nodes[: i + 1] == root
+            )
+            spur_path = search.search(spur, target, frozenset(root[:-1]), banned_steps)
+            if spur_path is None:
+                continue
+            nodes = root[:-1] + spur_path[1]
+            if tuple(nodes) in seen:
+                continue
+            seen.add(tuple(nodes))
+            edges = previous_edges[:i] + spur_path[2]
+            total = float(cost[previous_edges[:i]].sum()) + spur_path[0]
+            heapq.heappush(candidates, (total, len(seen), nodes, edges))
+        if not candidates:
+            break
+        total, _, nodes, edges = heapq.heappop(candidates)
+        found.append((total, nodes, edges))
+
+    ids, types = adjacency.node_ids, adjacency.relationship_types
+    return [
+        Path(
+            nodes=[ids[n] for n in nodes],
+            edges=[
+                (
+                    ids[adjacency.source[e]],
+                    ids[adjacency.target[e]],
+                    types[adjacency.edge_type[e]],
+                    float(adjacency.strength[e]),
+                )
+                for e in edges
+            ],
+            cost=float(total),
+        )
+        for total, nodes, edges in found
+    ]
@@ -0,0 +1,254 @@
+"""Level-of-detail helpers for serving large graph layouts.
+
+A `LayoutIndex` captures a computed 3D layout together with the edge list as NumPy arrays, so viewport queries,
+edge thinning and cluster aggregation run as vectorised operations instead of Python loops over every node.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def top_k_per_source(source: np.ndarray, strength: np.ndarray, k: int) -> np.ndarray:
+    """
+    Select, for every source node, the `k` strongest of its edges.
+
+    Parameters:
+        source (np.ndarray): Source node index of each edge.
+        strength (np.ndarray): Strength of each edge.
+        k (int): Number of edges to keep per source.
+
+    Returns:
+        np.ndarray: Positions of the kept edges, in ascending order.
+    """
+    if source.size == 0:
+        return np.empty(0, dtype=np.int64)
+    order = np.lexsort((-strength, source))
+    grouped = source[order]
+    group_start = np.searchsorted(grouped, grouped, side="left")
+    rank = np.arange(order.size) - group_start
+    return np.sort(order[rank < k])
+
+
+@dataclass
+class ClusterLevel:
+    """
+    Graph aggregated into spatial clusters.
+
+    Attributes:
+        centroids: Mean position of the members of each cluster, shape (c, 3).
+        counts: Number of member nodes per cluster.
+        colors: Most common member color per cluster.
+        labels: Cluster of every selected node, aligned with the node selection that was aggregated.
+        edge_source: Source cluster of each aggregated edge.
+        edge_target: Target cluster of each aggregated edge.
+        edge_weight: Sum of the strengths of the edges merged into each aggregated edge.
+        edge_count: Number of edges merged into each aggregated edge.
+    """
+
+    centroids: np.ndarray
+    counts: np.ndarray
+    colors: List[str]
+    labels: np.ndarray
+    edge_source: np.ndarray
+    edge_target: np.ndarray
+    edge_weight: np.ndarray
+    edge_count: np.ndarray
+
+
+@dataclass
+class LayoutIndex:
+    """
+    A graph layout and its edges stored as arrays, with a spatial index over node positions.
+
+    Node positions are kept sorted along the x axis so a bounding-box query only inspects the slab of nodes whose
+    x coordinate falls inside the box.
+
+    Attributes:
+        asset_ids: Node ids in layout order.
+        positions: Node coordinates, shape (n, 3).
+        colors: Node colors in layout order.
+        edge_source: Source node index of each edge (int32).
+        edge_target: Target node index of each edge (int32).
+        edge_type: Code of each edge's relationship type into `relationship_types` (int32).
+        edge_strength: Strength of each edge (float64).
+        relationship_types: Relationship type table.
+        x_order: Node indices sorted by x coordinate.
+        x_sorted: Node x coordinates in `x_order`.
+    """
+
+    asset_ids: List[str]
+    positions: np.ndarray
+    colors: List[str]
+    edge_source: np.ndarray
+    edge_target: np.ndarray
+    edge_type: np.ndarray
+    edge_strength: np.ndarray
+    relationship_types: List[str]
+    x_order: np.ndarray
+    x_sorted: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        positions: np.ndarray,
+        asset_ids: Sequence[str],
+        colors: Sequence[str],
+        relationships: Dict[str, List[Tuple[str, str, float]]],
+    ) -> "LayoutIndex":
+        """
+        Build the index from a computed layout and the graph's adjacency mapping.
+
+        Edges whose source or target is not part of the layout are dropped.
+
+        Parameters:
+            positions (np.ndarray): Node coordinates, shape (n, 3).
+            asset_ids (Sequence[str]): Node ids aligned with `positions`.
+            colors (Sequence[str]): Node colors aligned with `positions`.
+            relationships (Dict[str, List[Tuple[str, str, float]]]): Source id to outgoing `(target, type, strength)`.
+
+        Returns:
+            LayoutIndex: Index over the supplied layout.
+        """
+        coordinates = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        node_index = {asset_id: i for i, asset_id in enumerate(asset_ids)}
+
+        type_codes: Dict[str, int] = {}
+        sources: List[int] = []
+        targets: List[int] = []
+        types: List[int] = []
+        strengths: List[float] = []
+        for source_id, rels in relationships.items():
+            source_index = node_index.get(source_id)
+            if source_index is None:
+                continue
+            for target_id, rel_type, strength in rels:
+                target_index = node_index.get(target_id)
+                if target_index is None:
+                    continue
+                sources.append(source_index)
+                targets.append(target_index)
+                types.append(type_codes.setdefault(rel_type, len(type_codes)))
+                strengths.append(strength)
+
+        x_order = np.argsort(coordinates[:, 0], kind="stable")
+        return cls(
+            asset_ids=list(asset_ids),
+            positions=coordinates,
+            colors=list(colors),
+            edge_source=np.asarray(sources, dtype=np.int32),
+            edge_target=np.asarray(targets, dtype=np.int32),
+            edge_type=np.asarray(types, dtype=np.int32),
+            edge_strength=np.asarray(strengths, dtype=np.float64),
+            relationship_types=list(type_codes),
+            x_order=x_order,
+            x_sorted=coordinates[x_order, 0],
+        )
+
+    @property
+    def node_count(self) -> int:
+        return len(self.asset_ids)
+
+    def query_bbox(self, lower: Sequence[float], upper: Sequence[float]) -> np.ndarray:
+        """
+        Return the nodes whose position lies inside an axis-aligned box (bounds inclusive).
+
+        Parameters:
+            lower (Sequence[float]): Minimum x, y, z.
+            upper (Sequence[float]): Maximum x, y, z.
+
+        Returns:
+            np.ndarray: Indices of the nodes inside the box, in ascending order.
+        """
+        lo = np.searchsorted(self.x_sorted, lower[0], side="left")
+        hi = np.searchsorted(self.x_sorted, upper[0], side="right")
+        candidates = self.x_order[lo:hi]
+        points = self.positions[candidates]
+        inside = np.all((points[:, 1:] >= lower[1:]) & (points[:, 1:] <= upper[1:]), axis=1)
+        return np.sort(candidates[inside])
+
+    def select_edges(
+        self, nodes: Optional[np.ndarray] = None, min_strength: float = 0.0, top_k: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Select the edges between the given nodes, optionally thinned by strength and per-node rank.
+
+        Parameters:
+            nodes (Optional[np.ndarray]): Node indices to keep; every node when omitted.
+            min_strength (float): Drop edges weaker than this.
+            top_k (Optional[int]): Keep at most this many of the strongest outgoing edges per node.
+
+        Returns:
+            np.ndarray: Positions of the selected edges in the edge arrays.
+        """
+        keep = self.edge_strength >= min_strength
+        if nodes is not None:
+            member = np.zeros(self.node_count, dtype=bool)
+            member[nodes] = True
+            keep &= member[self.edge_source] & member[self.edge_target]
+        selected = np.flatnonzero(keep)
+        if top_k is not None:
+            selected = selected[top_k_per_source(self.edge_source[selected], self.edge_strength[selected], top_k)]
+        return selected
+
+    def aggregate(self, nodes: np.ndarray, edges: np.ndarray, max_clusters: int) -> ClusterLevel:
+        """
+        Merge nodes into at most `max_clusters` spatial clusters using a uniform voxel grid.
+
+        Edges inside a cluster are dropped; edges between the same pair of clusters are merged, summing their
+        strengths.
+
+        Parameters:
+            nodes (np.ndarray): Node indices to aggregate.
+            edges (np.ndarray): Edge positions to aggregate; both endpoints must be in `nodes`.
+            max_clusters (int): Upper bound on the number of clusters.
+
+        Returns:
+            ClusterLevel: The aggregated graph.
+        """
+        points = self.positions[nodes]
+        if points.shape[0] == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return ClusterLevel(np.empty((0, 3)), empty, [], empty, empty, empty, np.empty(0), empty)
+
+        resolution = max(1, int(np.floor(max_clusters ** (1.0 / 3.0) + 1e-9)))
+        lower = points.min(axis=0)
+        span = points.max(axis=0) - lower
+        span[span == 0] = 1.0
+        cells = np.minimum(((points - lower) / span * resolution).astype(np.int64), resolution - 1)
+        keys = (cells[:, 0] * resolution + cells[:, 1]) * resolution + cells[:, 2]
+        _, labels, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        labels = labels.reshape(-1)
+        cluster_count = counts.size
+
+        centroids = np.zeros((cluster_count, 3))
+        np.add.at(centroids, labels, points)
+        centroids /= counts[:, None]
+
+        palette, color_codes = np.unique(np.asarray([self.colors[i] for i in nodes]), return_inverse=True)
+        tally = np.zeros((cluster_count, palette.size), dtype=np.int64)
+        np.add.at(tally, (labels, color_codes.reshape(-1)), 1)
+        colors = palette[tally.argmax(axis=1)].tolist()
+
+        cluster_of = np.full(self.node_count, -1, dtype=np.int64)
+        cluster_of[nodes] = labels
+        source = cluster_of[self.edge_source[edges]]
+        target = cluster_of[self.edge_target[edges]]
+        between = source != target
+        pair = source[between] * cluster_count + target[between]
+        pairs, inverse, edge_count = np.unique(pair, return_inverse=True, return_counts=True)
+        edge_weight = np.bincount(inverse.reshape(-1), weights=self.edge_strength[edges][between], minlength=pairs.size)
+
+        return ClusterLevel(
+            centroids=centroids,
+            counts=counts,
+            colors=colors,
+            labels=labels,
+            edge_source=pairs // cluster_count,
+            edge_target=pairs % cluster_count,
+            edge_weight=edge_weight,
+            edge_count=edge_count,
+        )
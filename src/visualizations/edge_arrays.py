@@ -0,0 +1,72 @@
+"""Vectorized Plotly line-trace data for graph edges.
+
+Plotly draws many edges as one line trace whose points run source, target, gap for every edge. These helpers
+build that data for all edges of a trace at once from integer index arrays: coordinates are gathered into
+preallocated float arrays with NaN gaps, and hover texts are left to the browser. Each point only carries a
+"source → target" label and the edge strength; `edge_hovertemplate` formats them when the user hovers.
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+def edge_coordinates(positions: np.ndarray, sources: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Gather line coordinates for a set of edges.
+
+    Parameters:
+        positions (np.ndarray): Node positions with shape (n, d).
+        sources (np.ndarray): Row of `positions` for each edge's source.
+        targets (np.ndarray): Row of `positions` for each edge's target.
+
+    Returns:
+        Tuple[np.ndarray, ...]: One contiguous float array of length `3 * len(sources)` per dimension, holding
+        the source, the target and a NaN gap for every edge.
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    coordinates = np.full((positions.shape[1], 3 * sources.size), np.nan)
+    coordinates[:, 0::3] = positions[sources].T
+    coordinates[:, 1::3] = positions[targets].T
+    return tuple(coordinates)
+
+
+def edge_values(values: Sequence[float]) -> np.ndarray:
+    """Repeat one value per edge onto the edge's two line points, with NaN at the gap."""
+    values = np.asarray(values, dtype=np.float64)
+    points = np.full(3 * values.size, np.nan)
+    points[0::3] = values
+    points[1::3] = values
+    return points
+
+
+def edge_labels(node_ids: Sequence[str], sources: np.ndarray, targets: np.ndarray, symbol: str = "→") -> np.ndarray:
+    """
+    Build the "source → target" hover label of every edge point.
+
+    Parameters:
+        node_ids (Sequence[str]): Node id of each position row.
+        sources (np.ndarray): Row of each edge's source.
+        targets (np.ndarray): Row of each edge's target.
+        symbol (str): Direction symbol between the two ids.
+
+    Returns:
+        np.ndarray: String array of length `3 * len(sources)`, empty at the gaps.
+    """
+    ids = np.asarray(node_ids, dtype=str)
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    if sources.size == 0:
+        return np.empty(0, dtype=str)
+    labels = np.char.add(np.char.add(ids[sources], f" {symbol} "), ids[targets])
+    points = np.zeros(3 * sources.size, dtype=labels.dtype)
+    points[0::3] = labels
+    points[1::3] = labels
+    return points
+
+
+def edge_hovertemplate(rel_type: str) -> str:
+    """Hover template showing a point's edge label, the relationship type and the strength from `customdata`."""
+    return f"%{{text}}<br>Type: {rel_type}<br>Strength: %{{customdata:.2f}}<extra></extra>"
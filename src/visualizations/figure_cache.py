@@ -0,0 +1,98 @@
+"""Process-wide LRU cache of rendered figures, keyed by graph version.
+
+Every dashboard session renders the same figures for the same graph. The cache stores each figure once as
+Plotly JSON and hands out fresh, independent `go.Figure` objects rebuilt from it without re-validation, so a
+session can never mutate what another session sees. Text outputs such as reports are cached alongside.
+
+Entries are keyed by the graph object and its `version`, the counter the graph's own derived structures use: every
+mutation of the graph's relationships, assets or regulatory events increases it, as does
+`graph.invalidate_caches()`, so outputs depending on events or asset attributes are rebuilt along with the figures.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Sequence, Tuple
+
+import plotly.graph_objects as go
+
+from src.logic.asset_graph import AssetRelationshipGraph
+
+
+class FigureCache:
+    """
+    Thread-safe LRU cache of figure JSON and text outputs per graph version.
+
+    Builds run outside the lock, so a slow render never blocks sessions reading other entries; concurrent
+    misses for the same key may both build, and the last result is kept.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None) -> None:
+        """
+        Create an empty cache.
+
+        Parameters:
+            max_entries (Optional[int]): Maximum number of entries kept across all graph versions. Defaults to
+                the `FIGURE_CACHE_MAX_ENTRIES` environment variable, or 64 when unset.
+        """
+        if max_entries is None:
+            max_entries = int(os.getenv("FIGURE_CACHE_MAX_ENTRIES", "64"))
+        self.max_entries = max(1, max_entries)
+        # Entries keep a weak reference to their graph so an id reused by a later graph can never produce a hit
+        self._entries: "OrderedDict[Tuple[int, int, Hashable], Tuple[weakref.ref, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_or_build(self, graph: AssetRelationshipGraph, key: Hashable, build: Callable[[], Any]) -> Any:
+        entry_key = (id(graph), graph.version, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0]() is graph:
+                self._entries.move_to_end(entry_key)
+                return entry[1]
+
+        value = build()
+        with self._lock:
+            self._entries[entry_key] = (weakref.ref(graph), value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def figures(
+        self, graph: AssetRelationshipGraph, key: Hashable, build: Callable[[], Sequence[go.Figure]]
+    ) -> List[go.Figure]:
+        """
+        Return fresh copies of the cached figures for `key`, rendering them with `build` on a miss.
+
+        Parameters:
+            graph (AssetRelationshipGraph): Graph the figures are derived from.
+            key (Hashable): Figure name followed by the parameters that shape it.
+            build (Callable[[], Sequence[go.Figure]]): Zero-argument callable rendering the figures together.
+
+        Returns:
+            List[go.Figure]: New figure objects, independent of the cache and of other callers.
+        """
+        figure_jsons = self._get_or_build(graph, key, lambda: tuple(figure.to_json() for figure in build()))
+        # The JSON came from validated figures, so rebuilding skips validation
+        return [go.Figure(json.loads(figure_json), _validate=False) for figure_json in figure_jsons]
+
+    def figure(self, graph: AssetRelationshipGraph, key: Hashable, build: Callable[[], go.Figure]) -> go.Figure:
+        """Return a fresh copy of the cached figure for `key`, rendering it with `build` on a miss."""
+        return self.figures(graph, key, lambda: (build(),))[0]
+
+    def text(self, graph: AssetRelationshipGraph, key: Hashable, build: Callable[[], str]) -> str:
+        """Return the cached text output for `key`, building it with `build` on a miss."""
+        return self._get_or_build(graph, key, build)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
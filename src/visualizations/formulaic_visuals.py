@@ -1,11 +1,19 @@
 import math
-from typing import Any, Dict
+import os
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from src.analysis.formulaic_analysis import Formula
 
+# Largest number of assets shown in the correlation heatmap; the most strongly correlated assets are kept
+HEATMAP_MAX_ASSETS = int(os.getenv("FORMULAIC_HEATMAP_MAX_ASSETS", "8"))
+
+# Largest heatmap, in cells, that prints its value in every cell
+HEATMAP_TEXT_MAX_CELLS = 400
+
 
 class FormulaicVisualizer:
     """Visualizes mathematical formulas and relationships from financial analysis"""
@@ -84,45 +92,26 @@ class FormulaicVisualizer:
             )
 
         # 3. Empirical Correlation Heatmap
-        correlation_matrix = empirical_relationships.get("correlation_matrix", {})
-        if correlation_matrix:
-            # Convert correlation matrix to heatmap format
-            assets = list(
-                set(
-                    [pair.split("-")[0] for pair in correlation_matrix.keys()]
-                    + [pair.split("-")[1] for pair in correlation_matrix.keys()]
-                )
-            )
-
-            # Create correlation matrix
-            n_assets = min(len(assets), 8)  # Limit to 8x8 for visibility
-            assets = assets[:n_assets]
-
-            z_matrix = []
-            for i, asset1 in enumerate(assets):
-                row = []
-                for j, asset2 in enumerate(assets):
-                    if i == j:
-                        corr = 1.0
-                    else:
-                        key1 = f"{asset1}-{asset2}"
-                        key2 = f"{asset2}-{asset1}"
-                        corr = correlation_matrix.get(key1, correlation_matrix.get(key2, 0.5))
-                    row.append(corr)
-                z_matrix.append(row)
+        asset_ids, correlations = self._correlation_array(empirical_relationships)
+        if asset_ids:
+            shown = self._most_connected(correlations, HEATMAP_MAX_ASSETS)
+            z_matrix = correlations[np.ix_(shown, shown)]
+            labels = [asset_ids[i] for i in shown.tolist()]
+            # Cell values are formatted by the browser, and only while the heatmap is small enough to read them
+            cell_text = {}
+            if z_matrix.size <= HEATMAP_TEXT_MAX_CELLS:
+                cell_text = dict(texttemplate="%{z:.2f}", textfont={"size": 10})
 
             fig.add_trace(
                 go.Heatmap(
                     z=z_matrix,
-                    x=assets,
-                    y=assets,
+                    x=labels,
+                    y=labels,
                     colorscale="RdYlBu_r",
                     zmin=-1,
                     zmax=1,
-                    text=[[f"{val:.2f}" for val in row] for row in z_matrix],
-                    texttemplate="%{text}",
-                    textfont={"size": 10},
                     colorbar=dict(title="Correlation"),
+                    **cell_text,
                 ),
                 row=2,
                 col=1,
@@ -208,6 +197,36 @@ class FormulaicVisualizer:
 
         return fig
 
+    @staticmethod
+    def _correlation_array(empirical_relationships: Dict[str, Any]) -> Tuple[List[str], np.ndarray]:
+        """Return the asset ids and dense correlation matrix, building it from the pair mapping if needed"""
+        correlations = empirical_relationships.get("correlation_array")
+        if correlations is not None:
+            return list(empirical_relationships.get("correlation_asset_ids", [])), np.asarray(correlations, dtype=float)
+
+        correlation_matrix = empirical_relationships.get("correlation_matrix", {})
+        index: Dict[str, int] = {}
+        rows, cols, values = [], [], []
+        for pair, corr in correlation_matrix.items():
+            asset1, asset2 = pair.split("-")[:2]
+            rows.append(index.setdefault(asset1, len(index)))
+            cols.append(index.setdefault(asset2, len(index)))
+            values.append(corr)
+        # Pairs missing in both orders default to 0.5; a pair's own key wins over its reverse
+        correlations = np.full((len(index), len(index)), 0.5)
+        correlations[cols, rows] = values
+        correlations[rows, cols] = values
+        np.fill_diagonal(correlations, 1.0)
+        return list(index), correlations
+
+    @staticmethod
+    def _most_connected(correlations: np.ndarray, limit: int) -> np.ndarray:
+        """Return the rows of the `limit` assets with the largest total absolute correlation, in row order"""
+        if len(correlations) <= limit:
+            return np.arange(len(correlations))
+        strength = np.abs(correlations).sum(axis=1) - np.abs(np.diagonal(correlations))
+        return np.sort(np.argsort(-strength, kind="stable")[:limit])
+
     def create_formula_detail_view(self, formula: Formula) -> go.Figure:
         """Create a detailed view of a specific formula"""
         fig = go.Figure()
@@ -6,10 +6,14 @@ including multiple layout algorithms (spring, circular, grid) and relationship f
 
 import logging
 import math
-from typing import Dict, List, Tuple
+import os
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import plotly.graph_objects as go
 from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_centrality import CENTRALITY_MEASURES
+from src.visualizations.edge_arrays import edge_coordinates, edge_hovertemplate, edge_labels, edge_values
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,23 @@ REL_TYPE_COLORS = {
     "regulatory_impact": "#FFA07A",
 }
 
+# Graphs with more nodes or edges than this are drawn with WebGL (Scattergl) instead of SVG traces
+WEBGL_NODE_THRESHOLD = int(os.getenv("GRAPH_2D_WEBGL_NODE_THRESHOLD", "2000"))
+WEBGL_EDGE_THRESHOLD = int(os.getenv("GRAPH_2D_WEBGL_EDGE_THRESHOLD", "5000"))
+
+# WebGL line traces take one width, so edges are batched by strength: bin edges and the width of each batch
+_WEBGL_STRENGTH_BINS = np.array([1.0 / 3.0, 2.0 / 3.0])
+_WEBGL_LINE_WIDTHS = np.array([1.0, 2.0, 3.0])
+
+# Node color by asset class
+_ASSET_CLASS_COLORS = {
+    'equity': '#1f77b4',
+    'fixed_income': '#2ca02c',
+    'commodity': '#ff7f0e',
+    'currency': '#d62728',
+    'derivative': '#9467bd',
+}
+
 
 def _create_circular_layout(asset_ids: List[str]) -> Dict[str, Tuple[float, float]]:
     """Create circular layout for 2D visualization.
@@ -112,6 +133,7 @@ def _create_2d_relationship_traces(
     show_income_comparison: bool = True,
     show_regulatory: bool = True,
     show_all_relationships: bool = False,
+    use_webgl: bool = False,
 ) -> List[go.Scatter]:
     """Create 2D relationship traces with filtering.
 
@@ -127,9 +149,11 @@ def _create_2d_relationship_traces(
         show_income_comparison: Show income comparison relationships
         show_regulatory: Show regulatory relationships
         show_all_relationships: Master toggle to show all relationships
+        use_webgl: Draw with Scattergl, batching each relationship type's edges by strength into a few
+            traces of increasing line width
 
     Returns:
-        List of Plotly Scatter traces for relationships
+        List of Plotly Scatter (or Scattergl) traces for relationships
     """
     if not asset_ids or not positions:
         return []
@@ -149,18 +173,23 @@ def _create_2d_relationship_traces(
         relationship_filters = None
 
     traces = []
-    asset_id_set = set(asset_ids)
+    # Row of each drawable asset in the position array
+    drawable = [asset_id for asset_id in asset_ids if asset_id in positions]
+    row_index = {asset_id: row for row, asset_id in enumerate(drawable)}
+    coordinates = np.array([positions[asset_id] for asset_id in drawable], dtype=float).reshape(-1, 2)
 
-    # Group relationships by type
-    relationship_groups = {}
+    # Group relationships by type as parallel source/target/strength lists
+    relationship_groups: Dict[str, Tuple[List[int], List[int], List[float]]] = {}
 
     for source_id in asset_ids:
-        if source_id not in graph.relationships:
+        if source_id not in graph.relationships or source_id not in row_index:
             continue
+        source_row = row_index[source_id]
 
         for target_id, rel_type, strength in graph.relationships[source_id]:
             # Skip if target not in positions
-            if target_id not in positions or target_id not in asset_id_set:
+            target_row = row_index.get(target_id)
+            if target_row is None:
                 continue
 
             # Apply filters
@@ -168,56 +197,51 @@ def _create_2d_relationship_traces(
                 if not relationship_filters[rel_type]:
                     continue
 
-            # Group by relationship type
-            if rel_type not in relationship_groups:
-                relationship_groups[rel_type] = []
-
-            relationship_groups[rel_type].append({
-                'source_id': source_id,
-                'target_id': target_id,
-                'strength': strength
-            })
-
-    # Create traces for each relationship type
-    for rel_type, relationships in relationship_groups.items():
-        if not relationships:
-            continue
-
-        edges_x = []
-        edges_y = []
-        hover_texts = []
-
-        for rel in relationships:
-            source_pos = positions[rel['source_id']]
-            target_pos = positions[rel['target_id']]
-
-            edges_x.extend([source_pos[0], target_pos[0], None])
-            edges_y.extend([source_pos[1], target_pos[1], None])
-
-            hover_text = (
-                f"{rel['source_id']} → {rel['target_id']}<br>"
-                f"Type: {rel_type}<br>Strength: {rel['strength']:.2f}"
-            )
-            hover_texts.extend([hover_text, hover_text, None])
+            sources, targets, strengths = relationship_groups.setdefault(rel_type, ([], [], []))
+            sources.append(source_row)
+            targets.append(target_row)
+            strengths.append(strength)
 
+    # Create traces for each relationship type from vectorized edge arrays
+    trace_class = go.Scattergl if use_webgl else go.Scatter
+    for rel_type, (sources, targets, strengths) in relationship_groups.items():
+        sources, targets, strengths = np.asarray(sources), np.asarray(targets), np.asarray(strengths, dtype=float)
         color = REL_TYPE_COLORS.get(rel_type, "#888888")
         trace_name = rel_type.replace("_", " ").title()
 
-        trace = go.Scatter(
-            x=edges_x,
-            y=edges_y,
-            mode='lines',
-            line=dict(color=color, width=2),
-            hovertext=hover_texts,
-            hoverinfo='text',
-            name=trace_name,
-            showlegend=True,
-        )
-        traces.append(trace)
+        if use_webgl:
+            batches = np.digitize(strengths, _WEBGL_STRENGTH_BINS)
+        else:
+            batches = np.zeros(strengths.size, dtype=np.int64)
+
+        for i, batch in enumerate(np.unique(batches)):
+            in_batch = batches == batch
+            edges_x, edges_y = edge_coordinates(coordinates, sources[in_batch], targets[in_batch])
+            trace = trace_class(
+                x=edges_x,
+                y=edges_y,
+                mode='lines',
+                line=dict(color=color, width=_WEBGL_LINE_WIDTHS[batch] if use_webgl else 2),
+                text=edge_labels(drawable, sources[in_batch], targets[in_batch]),
+                customdata=edge_values(strengths[in_batch]),
+                hovertemplate=edge_hovertemplate(rel_type),
+                name=trace_name,
+                legendgroup=rel_type,
+                showlegend=i == 0,
+            )
+            traces.append(trace)
 
     return traces
 
 
+def _use_webgl(graph: AssetRelationshipGraph, node_count: int) -> bool:
+    """Return whether the graph is large enough to need WebGL rendering."""
+    if node_count > WEBGL_NODE_THRESHOLD:
+        return True
+    edge_count = sum(len(rels) for rels in graph.relationships.values())
+    return edge_count > WEBGL_EDGE_THRESHOLD
+
+
 def visualize_2d_graph(
     graph: AssetRelationshipGraph,
     layout_type: str = "spring",
@@ -229,6 +253,8 @@ def visualize_2d_graph(
     show_income_comparison: bool = True,
     show_regulatory: bool = True,
     show_all_relationships: bool = False,
+    node_size_by: Optional[str] = None,
+    use_webgl: Optional[bool] = None,
 ) -> go.Figure:
     """Create 2D visualization of asset relationship graph.
 
@@ -243,12 +269,18 @@ def visualize_2d_graph(
         show_income_comparison: Show income comparison relationships
         show_regulatory: Show regulatory relationships
         show_all_relationships: Master toggle to show all relationships
+        node_size_by: Centrality measure ("pagerank", "eigenvector" or "betweenness") that scales node size;
+            sized by number of outgoing relationships when omitted
+        use_webgl: Draw with WebGL (Scattergl) traces; chosen automatically from WEBGL_NODE_THRESHOLD and
+            WEBGL_EDGE_THRESHOLD when omitted. WebGL nodes are drawn without text labels.
 
     Returns:
         Plotly Figure object with 2D visualization
     """
     if not isinstance(graph, AssetRelationshipGraph):
         raise ValueError("Invalid graph data provided")
+    if node_size_by is not None and node_size_by not in CENTRALITY_MEASURES:
+        raise ValueError(f"node_size_by must be one of {CENTRALITY_MEASURES}, got {node_size_by!r}")
 
     # Get asset data
     asset_ids = list(graph.assets.keys())
@@ -282,6 +314,9 @@ def visualize_2d_graph(
             # Fallback to circular if 3D data not available
             positions = _create_circular_layout(asset_ids)
 
+    if use_webgl is None:
+        use_webgl = _use_webgl(graph, len(asset_ids))
+
     # Create figure
     fig = go.Figure()
 
@@ -298,37 +333,27 @@ def visualize_2d_graph(
         show_income_comparison=show_income_comparison,
         show_regulatory=show_regulatory,
         show_all_relationships=show_all_relationships,
+        use_webgl=use_webgl,
     )
 
-    for trace in relationship_traces:
-        fig.add_trace(trace)
+    fig.add_traces(relationship_traces)
 
     # Add node trace
-    node_x = [positions[asset_id][0] for asset_id in asset_ids]
-    node_y = [positions[asset_id][1] for asset_id in asset_ids]
+    node_positions = np.array([positions[asset_id] for asset_id in asset_ids], dtype=float).reshape(-1, 2)
 
     # Get colors for nodes
     colors = []
     for asset_id in asset_ids:
         asset = graph.assets[asset_id]
         asset_class = asset.asset_class.value if hasattr(asset.asset_class, 'value') else str(asset.asset_class)
+        colors.append(_ASSET_CLASS_COLORS.get(asset_class.lower(), '#7f7f7f'))
 
-        # Color mapping by asset class
-        color_map = {
-            'equity': '#1f77b4',
-            'fixed_income': '#2ca02c',
-            'commodity': '#ff7f0e',
-            'currency': '#d62728',
-            'derivative': '#9467bd',
-        }
-        colors.append(color_map.get(asset_class.lower(), '#7f7f7f'))
-
-    # Calculate node sizes based on connections
-    node_sizes = []
-    for asset_id in asset_ids:
-        num_connections = len(graph.relationships.get(asset_id, []))
-        size = 20 + min(num_connections * 5, 30)  # Size between 20 and 50
-        node_sizes.append(size)
+    # Calculate node sizes based on centrality or connections (between 20 and 50)
+    if node_size_by is not None:
+        node_sizes = graph.centrality().node_sizes(asset_ids, node_size_by, min_size=20, max_size=50)
+    else:
+        num_connections = np.array([len(graph.relationships.get(asset_id, [])) for asset_id in asset_ids])
+        node_sizes = 20 + np.minimum(num_connections * 5, 30)
 
     # Create hover texts
     hover_texts = []
@@ -337,13 +362,13 @@ def visualize_2d_graph(
         hover_text = f"{asset_id}<br>Class: {asset.asset_class.value if hasattr(asset.asset_class, 'value') else asset.asset_class}"
         hover_texts.append(hover_text)
 
-    node_trace = go.Scatter(
-        x=node_x,
-        y=node_y,
-        mode='markers+text',
+    node_trace = (go.Scattergl if use_webgl else go.Scatter)(
+        x=node_positions[:, 0],
+        y=node_positions[:, 1],
+        mode='markers' if use_webgl else 'markers+text',
         marker=dict(
             size=node_sizes,
-            color=colors,
+            color=np.array(colors),
             opacity=0.9,
             line=dict(color='rgba(0,0,0,0.8)', width=2),
         ),
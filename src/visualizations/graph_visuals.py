@@ -1,12 +1,18 @@
 import logging
+import os
 import re
 import threading
+import weakref
 from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import numpy as np
 import plotly.graph_objects as go
+from plotly.basedatatypes import BaseTraceType
 from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_centrality import CENTRALITY_MEASURES
+from src.visualizations.edge_arrays import edge_coordinates, edge_hovertemplate, edge_labels, edge_values
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +33,25 @@ REL_TYPE_COLORS = defaultdict(
     },
 )
 
+# Relationship type controlled by each show_* filter; a filter's position is its bit in the filter mask
+RELATIONSHIP_FILTERS: Tuple[Tuple[str, str], ...] = (
+    ("show_same_sector", "same_sector"),
+    ("show_market_cap", "market_cap_similar"),
+    ("show_correlation", "correlation"),
+    ("show_corporate_bond", "corporate_bond_to_equity"),
+    ("show_commodity_currency", "commodity_currency"),
+    ("show_income_comparison", "income_comparison"),
+    ("show_regulatory", "regulatory_impact"),
+)
+ALL_RELATIONSHIPS_MASK = (1 << len(RELATIONSHIP_FILTERS)) - 1
+
+# Direction arrow renderings: one diamond marker per edge, or one cone oriented along the edge
+ARROW_STYLES = ("markers", "cone")
+
+# Most direction arrows drawn per figure; beyond this an evenly spaced sample of unidirectional edges is drawn
+MAX_DIRECTION_ARROWS = int(os.getenv("GRAPH_MAX_DIRECTION_ARROWS", "5000"))
+_FILTER_BITS = {rel_type: 1 << bit for bit, (_, rel_type) in enumerate(RELATIONSHIP_FILTERS)}
+
 
 def _is_valid_color_format(color: str) -> bool:
     """Validate if a string is a valid color format.
@@ -117,6 +142,7 @@ def _build_relationship_index(
     - Validates each relationship tuple has the correct structure (3 elements)
     - Validates data types for target_id (string), rel_type (string), and strength (numeric)
     - Provides detailed error messages indicating the exact location and nature of any issues
+    - Skips the per-relationship checks for graphs already checked by `validate_graph_snapshot`
 
     Args:
         graph: The asset relationship graph
@@ -174,6 +200,15 @@ def _build_relationship_index(
                 f"Failed to create snapshot of graph.relationships: {exc}"
             ) from exc
 
+    # Relationships of a graph checked by validate_graph_snapshot skip the per-relationship checks below
+    if graph.is_validated:
+        return {
+            (source_id, target_id, rel_type): float(strength)
+            for source_id, rels in relevant_relationships.items()
+            for target_id, rel_type, strength in rels
+            if target_id in asset_ids_set
+        }
+
     # Build index outside the lock (no shared state access)
     # This minimizes the time the lock is held
     relationship_index: Dict[Tuple[str, str, str], float] = {}
@@ -239,6 +274,8 @@ def _create_node_trace(
     asset_ids: List[str],
     colors: List[str],
     hover_texts: List[str],
+    sizes: Optional[np.ndarray] = None,
+    validate: bool = True,
 ) -> go.Scatter3d:
     """Create node trace for 3D visualization with comprehensive input validation.
 
@@ -255,6 +292,9 @@ def _create_node_trace(
         asset_ids: List of asset ID strings (must be non-empty strings, length must match positions)
         colors: List of node colors (length must match positions)
         hover_texts: List of hover texts (length must match positions)
+        sizes: Optional per-node marker sizes (length must match positions); 15 for every node when omitted
+        validate: Run the content checks of `_validate_visualization_data`; pass False for data from a graph
+            already checked by `validate_graph_snapshot`
 
     Returns:
         Plotly Scatter3d trace for nodes
@@ -288,18 +328,21 @@ def _create_node_trace(
 
     # Comprehensive validation: detailed checks on content, numeric types, and finite values
     # Delegates to shared validator to ensure consistency across all visualization functions
-    _validate_visualization_data(positions, asset_ids, colors, hover_texts)
+    if validate:
+        _validate_visualization_data(positions, asset_ids, colors, hover_texts)
 
     # Edge case validation: Ensure inputs are not empty
     if len(asset_ids) == 0:
         raise ValueError("Cannot create node trace with empty inputs (asset_ids length is 0)")
+    if sizes is not None and len(sizes) != len(asset_ids):
+        raise ValueError(f"sizes length ({len(sizes)}) must match asset_ids length ({len(asset_ids)})")
     return go.Scatter3d(
         x=positions[:, 0],
         y=positions[:, 1],
         z=positions[:, 2],
         mode="markers+text",
         marker=dict(
-            size=15,
+            size=15 if sizes is None else sizes,
             color=colors,
             opacity=0.9,
             line=dict(color="rgba(0,0,0,0.8)", width=2),
@@ -315,6 +358,21 @@ def _create_node_trace(
     )
 
 
+def _centrality_node_sizes(
+    graph: AssetRelationshipGraph, asset_ids: List[str], node_size_by: Optional[str]
+) -> Optional[np.ndarray]:
+    """Return node marker sizes scaled by a centrality measure, or None for uniform sizes.
+
+    Raises:
+        ValueError: If `node_size_by` is not a known centrality measure
+    """
+    if node_size_by is None:
+        return None
+    if node_size_by not in CENTRALITY_MEASURES:
+        raise ValueError(f"node_size_by must be one of {CENTRALITY_MEASURES}, got {node_size_by!r}")
+    return graph.centrality().node_sizes(asset_ids, node_size_by)
+
+
 def _generate_dynamic_title(
     num_assets: int,
     num_relationships: int,
@@ -349,7 +407,7 @@ def _calculate_visible_relationships(relationship_traces: List[go.Scatter3d]) ->
         Number of visible relationships (edges) in the traces
     """
     try:
-        return sum(len(getattr(trace, "x", []) or []) for trace in relationship_traces) // 3
+        return sum(len(trace.x) for trace in relationship_traces if trace.x is not None) // 3
     except Exception:  # pylint: disable=broad-except
         return 0
 
@@ -537,17 +595,58 @@ def _validate_visualization_data(
     _validate_asset_ids_uniqueness(asset_ids)
 
 
-def visualize_3d_graph(graph: AssetRelationshipGraph) -> go.Figure:
-    """Create enhanced 3D visualization of asset relationship graph with improved relationship visibility"""
+def validate_graph_snapshot(graph: AssetRelationshipGraph) -> None:
+    """Validate a graph's visualization data and relationships once and mark the graph as trusted.
+
+    Visualizers skip their per-call checks (`_validate_visualization_data` and the per-relationship checks in
+    `_build_relationship_index`) for a trusted graph until its `version` changes, that is until the graph is mutated
+    or `graph.invalidate_caches()` is called. Call this where a graph is built and published, before it is rendered.
+
+    Args:
+        graph: Graph to validate
+
+    Raises:
+        TypeError: If the graph or its relationship data has the wrong types
+        ValueError: If the visualization data or relationship data is invalid
+    """
+    if not isinstance(graph, AssetRelationshipGraph):
+        raise TypeError(f"Invalid input: graph must be an AssetRelationshipGraph instance, got {type(graph).__name__}")
+    if graph.is_validated:
+        return
+    positions, asset_ids, colors, hover_texts = graph.get_3d_visualization_data_enhanced()
+    _validate_visualization_data(positions, asset_ids, colors, hover_texts)
+    _build_relationship_index(graph, asset_ids)
+    graph.mark_validated()
+
+
+def visualize_3d_graph(
+    graph: AssetRelationshipGraph, node_size_by: Optional[str] = None, arrow_style: str = "markers"
+) -> go.Figure:
+    """Create enhanced 3D visualization of asset relationship graph with improved relationship visibility
+
+    Args:
+        graph: Asset relationship graph to visualize
+        node_size_by: Centrality measure ("pagerank", "eigenvector" or "betweenness") that scales node size;
+            uniform node size when omitted
+        arrow_style: "markers" or "cone" for the directional arrows
+
+    Raises:
+        ValueError: If graph is invalid, or `node_size_by` or `arrow_style` is unknown
+    """
     if not isinstance(graph, AssetRelationshipGraph) or not hasattr(
         graph, "get_3d_visualization_data_enhanced"
     ):
         raise ValueError("Invalid graph data provided")
+    if arrow_style not in ARROW_STYLES:
+        raise ValueError(f"arrow_style must be one of {ARROW_STYLES}, got {arrow_style!r}")
 
     positions, asset_ids, colors, hover_texts = graph.get_3d_visualization_data_enhanced()
 
-    # Validate visualization data to prevent runtime errors (addresses review feedback)
-    _validate_visualization_data(positions, asset_ids, colors, hover_texts)
+    # Validate visualization data to prevent runtime errors (addresses review feedback);
+    # graphs checked by validate_graph_snapshot are trusted
+    trusted = graph.is_validated
+    if not trusted:
+        _validate_visualization_data(positions, asset_ids, colors, hover_texts)
 
     fig = go.Figure()
 
@@ -567,7 +666,7 @@ def visualize_3d_graph(graph: AssetRelationshipGraph) -> go.Figure:
 
     # Add directional arrows for unidirectional relationships
     try:
-        arrow_traces = _create_directional_arrows(graph, positions, asset_ids)
+        arrow_traces = _create_directional_arrows(graph, positions, asset_ids, arrow_style)
     except Exception as exc:  # pylint: disable=broad-except
         logger.exception("Failed to create directional arrow traces: %s", exc)
         arrow_traces = []
@@ -579,11 +678,12 @@ def visualize_3d_graph(graph: AssetRelationshipGraph) -> go.Figure:
             logger.exception("Failed to add arrow traces to figure: %s", exc)
 
     # Add nodes with enhanced styling
-    node_trace = _create_node_trace(positions, asset_ids, colors, hover_texts)
+    sizes = _centrality_node_sizes(graph, asset_ids, node_size_by)
+    node_trace = _create_node_trace(positions, asset_ids, colors, hover_texts, sizes, validate=not trusted)
     fig.add_trace(node_trace)
 
     # Calculate total relationships for dynamic title
-    total_relationships = sum(len(getattr(trace, "x", []) or []) for trace in relationship_traces) // 3
+    total_relationships = _calculate_visible_relationships(relationship_traces)
     dynamic_title = _generate_dynamic_title(len(asset_ids), total_relationships)
 
     fig.update_layout(
@@ -616,16 +716,24 @@ def visualize_3d_graph(graph: AssetRelationshipGraph) -> go.Figure:
     return fig
 
 
+# Source rows, target rows and strengths of the edges in one relationship group
+EdgeGroup = Tuple[List[int], List[int], List[float]]
+
+
 def _collect_and_group_relationships(
     graph: AssetRelationshipGraph,
-    asset_ids: Iterable[str],
+    asset_ids: List[str],
     relationship_filters: Optional[Dict[str, bool]] = None,
-) -> Dict[Tuple[str, bool], List[dict]]:
-    """Collect and group relationships with directionality info in a single pass."""
+) -> Dict[Tuple[str, bool], EdgeGroup]:
+    """Collect and group relationships with directionality info in a single pass.
+
+    Edges are recorded as rows into `asset_ids` so that traces can gather their coordinates with index arrays.
+    """
     relationship_index = _build_relationship_index(graph, asset_ids)
+    asset_id_index = _build_asset_id_index(asset_ids)
 
     processed_pairs: Set[Tuple[str, str, str]] = set()
-    relationship_groups: Dict[Tuple[str, bool], List[dict]] = defaultdict(list)
+    relationship_groups: Dict[Tuple[str, bool], EdgeGroup] = {}
 
     for (source_id, target_id, rel_type), strength in relationship_index.items():
         if relationship_filters and rel_type in relationship_filters and not relationship_filters[rel_type]:
@@ -646,65 +754,14 @@ def _collect_and_group_relationships(
         if is_bidirectional:
             processed_pairs.add(pair_key)
 
-        relationship_groups[(rel_type, is_bidirectional)].append(
-            {
-                "source_id": source_id,
-                "target_id": target_id,
-                "strength": float(strength),
-            }
-        )
+        sources, targets, strengths = relationship_groups.setdefault((rel_type, is_bidirectional), ([], [], []))
+        sources.append(asset_id_index[source_id])
+        targets.append(asset_id_index[target_id])
+        strengths.append(strength)
 
     return relationship_groups
 
 
-def _build_edge_coordinates_optimized(
-    relationships: List[dict],
-    positions: np.ndarray,
-    asset_id_index: Dict[str, int],
-) -> Tuple[List[Optional[float]], List[Optional[float]], List[Optional[float]]]:
-    """Build edge coordinate lists for relationships using optimized O(1) lookups."""
-    num_edges = len(relationships)
-    edges_x: List[Optional[float]] = [None] * (num_edges * 3)
-    edges_y: List[Optional[float]] = [None] * (num_edges * 3)
-    edges_z: List[Optional[float]] = [None] * (num_edges * 3)
-
-    for i, rel in enumerate(relationships):
-        source_idx = asset_id_index[rel["source_id"]]
-        target_idx = asset_id_index[rel["target_id"]]
-
-        base_idx = i * 3
-
-        edges_x[base_idx] = positions[source_idx, 0]
-        edges_x[base_idx + 1] = positions[target_idx, 0]
-
-        edges_y[base_idx] = positions[source_idx, 1]
-        edges_y[base_idx + 1] = positions[target_idx, 1]
-
-        edges_z[base_idx] = positions[source_idx, 2]
-        edges_z[base_idx + 1] = positions[target_idx, 2]
-
-    return edges_x, edges_y, edges_z
-
-
-def _build_hover_texts(relationships: List[dict], rel_type: str, is_bidirectional: bool) -> List[Optional[str]]:
-    """Build hover text list for relationships with pre-allocation for performance."""
-    direction_text = "↔" if is_bidirectional else "→"
-
-    num_rels = len(relationships)
-    hover_texts: List[Optional[str]] = [None] * (num_rels * 3)
-
-    for i, rel in enumerate(relationships):
-        hover_text = (
-            f"{rel['source_id']} {direction_text} {rel['target_id']}<br>"
-            f"Type: {rel_type}<br>Strength: {rel['strength']:.2f}"
-        )
-        base_idx = i * 3
-        hover_texts[base_idx] = hover_text
-        hover_texts[base_idx + 1] = hover_text
-
-    return hover_texts
-
-
 def _get_line_style(rel_type: str, is_bidirectional: bool) -> dict:
     """Get line style configuration for a relationship with color validation.
 
@@ -737,15 +794,16 @@ def _format_trace_name(rel_type: str, is_bidirectional: bool) -> str:
 def _create_trace_for_group(
     rel_type: str,
     is_bidirectional: bool,
-    relationships: List[dict],
+    edges: EdgeGroup,
     positions: np.ndarray,
-    asset_id_index: Dict[str, int],
+    asset_ids: List[str],
 ) -> go.Scatter3d:
-    """Create a single trace for a relationship group with optimized performance."""
-    edges_x, edges_y, edges_z = _build_edge_coordinates_optimized(
-        relationships, positions, asset_id_index
-    )
-    hover_texts = _build_hover_texts(relationships, rel_type, is_bidirectional)
+    """Create a single trace for a relationship group from vectorized edge arrays.
+
+    Hover texts are formatted by the browser from per-point edge labels and strengths.
+    """
+    sources, targets, strengths = edges
+    edges_x, edges_y, edges_z = edge_coordinates(positions, sources, targets)
 
     return go.Scatter3d(
         x=edges_x,
@@ -753,8 +811,9 @@ def _create_trace_for_group(
         z=edges_z,
         mode="lines",
         line=_get_line_style(rel_type, is_bidirectional),
-        hovertext=hover_texts,
-        hoverinfo="text",
+        text=edge_labels(asset_ids, sources, targets, "↔" if is_bidirectional else "→"),
+        customdata=edge_values(strengths),
+        hovertemplate=edge_hovertemplate(rel_type),
         name=_format_trace_name(rel_type, is_bidirectional),
         visible=True,
         legendgroup=rel_type,
@@ -780,29 +839,42 @@ def _create_relationship_traces(
     if len(positions) != len(asset_ids):
         raise ValueError("Invalid input data: positions array length must match asset_ids length")
 
-    asset_id_index = _build_asset_id_index(asset_ids)
-
     relationship_groups = _collect_and_group_relationships(
         graph, asset_ids, relationship_filters
     )
 
     traces: List[go.Scatter3d] = []
-    for (rel_type, is_bidirectional), relationships in relationship_groups.items():
-        if relationships:
-            trace = _create_trace_for_group(
-                rel_type, is_bidirectional, relationships, positions, asset_id_index
-            )
-            traces.append(trace)
+    for (rel_type, is_bidirectional), edges in relationship_groups.items():
+        trace = _create_trace_for_group(rel_type, is_bidirectional, edges, positions, asset_ids)
+        traces.append(trace)
 
     return traces
 
 
 def _create_directional_arrows(
-    graph: AssetRelationshipGraph, positions: np.ndarray, asset_ids: List[str]
-) -> List[go.Scatter3d]:
-    """Create arrow markers for unidirectional relationships using vectorized NumPy operations. Returns a list of traces for batch addition to figure."""
+    graph: AssetRelationshipGraph,
+    positions: np.ndarray,
+    asset_ids: List[str],
+    arrow_style: str = "markers",
+    max_arrows: Optional[int] = MAX_DIRECTION_ARROWS,
+) -> List[BaseTraceType]:
+    """Create arrowheads for unidirectional relationships as a single trace, using vectorized NumPy operations.
+
+    Unidirectional edges are found by matching each edge's code against the codes of the reversed edges, and
+    arrowheads are placed 70% of the way along each edge. With `arrow_style="cone"` they are drawn as one
+    `go.Cone` trace oriented along the edge; otherwise as one diamond marker trace. Above `max_arrows`
+    unidirectional edges, an evenly spaced sample is drawn so large graphs stay renderable.
+
+    Returns a list with at most one trace for batch addition to figure.
+
+    Raises:
+        TypeError: If graph is not an AssetRelationshipGraph
+        ValueError: If positions, asset_ids or arrow_style are invalid
+    """
     if not isinstance(graph, AssetRelationshipGraph):
         raise TypeError("Expected graph to be an instance of AssetRelationshipGraph")
+    if arrow_style not in ARROW_STYLES:
+        raise ValueError(f"arrow_style must be one of {ARROW_STYLES}, got {arrow_style!r}")
     if not hasattr(graph, "relationships") or not isinstance(graph.relationships, dict):
         raise ValueError("Invalid input data: graph must have a relationships dictionary")
 
@@ -840,34 +912,77 @@ def _create_directional_arrows(
         raise ValueError("asset_ids must contain non-empty strings")
 
     relationship_index = _build_relationship_index(graph, asset_ids)
+    if not relationship_index:
+        return []
     asset_id_index = _build_asset_id_index(asset_ids)
 
-    source_indices: List[int] = []
-    target_indices: List[int] = []
-    hover_texts: List[str] = []
-
-    # Gather unidirectional relationships
-    for (source_id, target_id, rel_type), _ in relationship_index.items():
-        reverse_key = (target_id, source_id, rel_type)
-        if reverse_key not in relationship_index:
-            source_indices.append(asset_id_index[source_id])
-            target_indices.append(asset_id_index[target_id])
-            hover_texts.append(f"Direction: {source_id} → {target_id}<br>Type: {rel_type}")
+    # Encode every (source, target, type) edge as one integer so reverse lookups are a single np.isin
+    keys = list(relationship_index)
+    count = len(keys)
+    type_codes: Dict[str, int] = {}
+    sources = np.fromiter((asset_id_index[source_id] for source_id, _, _ in keys), dtype=np.int64, count=count)
+    targets = np.fromiter((asset_id_index[target_id] for _, target_id, _ in keys), dtype=np.int64, count=count)
+    types = np.fromiter(
+        (type_codes.setdefault(rel_type, len(type_codes)) for _, _, rel_type in keys), dtype=np.int64, count=count
+    )
+    node_count, type_count = len(asset_ids), len(type_codes)
+    codes = (sources * node_count + targets) * type_count + types
+    reverse_codes = (targets * node_count + sources) * type_count + types
+    one_way = np.flatnonzero(~np.isin(reverse_codes, codes))
 
-    if not source_indices:
+    if one_way.size == 0:
         return []
+    if max_arrows is not None and one_way.size > max_arrows:
+        # Evenly spaced sample keeps the arrows spread over the whole graph
+        one_way = one_way[np.linspace(0, one_way.size - 1, max(max_arrows, 0)).astype(np.int64)]
+        if one_way.size == 0:
+            return []
 
     # Vectorized arrow position calculation at 70% along each edge
-    src_idx_arr = np.asarray(source_indices, dtype=int)
-    tgt_idx_arr = np.asarray(target_indices, dtype=int)
-    source_positions = positions[src_idx_arr]
-    target_positions = positions[tgt_idx_arr]
-    arrow_positions = source_positions + 0.7 * (target_positions - source_positions)
+    source_positions = positions[sources[one_way]]
+    direction = positions[targets[one_way]] - source_positions
+    arrow_positions = source_positions + 0.7 * direction
+
+    ids = np.asarray(asset_ids, dtype=str)
+    type_names = np.asarray(list(type_codes), dtype=str)
+    hover_texts = np.char.add(
+        np.char.add(np.char.add(np.char.add("Direction: ", ids[sources[one_way]]), " → "), ids[targets[one_way]]),
+        np.char.add("<br>Type: ", type_names[types[one_way]]),
+    )
+
+    if arrow_style == "cone":
+        lengths = np.linalg.norm(direction, axis=1)
+        # Edges between coincident nodes have no direction to draw
+        oriented = lengths > 0
+        if not oriented.any():
+            return []
+        arrow_length = 0.08 * float(np.median(lengths[oriented]))
+        vectors = direction[oriented] / lengths[oriented, None] * arrow_length
+        arrow_positions = arrow_positions[oriented]
+        arrow_trace: BaseTraceType = go.Cone(
+            x=arrow_positions[:, 0],
+            y=arrow_positions[:, 1],
+            z=arrow_positions[:, 2],
+            u=vectors[:, 0],
+            v=vectors[:, 1],
+            w=vectors[:, 2],
+            sizemode="absolute",
+            sizeref=1.0,
+            anchor="tip",
+            colorscale=[[0.0, "rgba(255, 0, 0, 0.8)"], [1.0, "rgba(255, 0, 0, 0.8)"]],
+            showscale=False,
+            hovertext=hover_texts[oriented],
+            hoverinfo="text",
+            name="Direction Arrows",
+            visible=True,
+            showlegend=False,
+        )
+        return [arrow_trace]
 
     arrow_trace = go.Scatter3d(
-        x=arrow_positions[:, 0].tolist(),
-        y=arrow_positions[:, 1].tolist(),
-        z=arrow_positions[:, 2].tolist(),
+        x=arrow_positions[:, 0],
+        y=arrow_positions[:, 1],
+        z=arrow_positions[:, 2],
         mode="markers",
         marker=dict(
             symbol="diamond",
@@ -952,6 +1067,137 @@ def _validate_relationship_filters(relationship_filters: Optional[Dict[str, bool
         )
 
 
+@dataclass
+class _FilterTraceCache:
+    """Traces of one graph version, built once and composed into filtered figures.
+
+    Attributes:
+        version: Graph `version` the traces were built from; a different value means the graph changed.
+        positions, asset_ids, colors, hover_texts: Validated visualization data.
+        relationship_traces: Trace per (rel_type, is_bidirectional) group, in first-seen order.
+        arrow_traces: Directional arrow traces per arrow style, built on first use.
+        node_traces: Node trace per `node_size_by` value, built on first use.
+    """
+
+    version: int
+    positions: np.ndarray
+    asset_ids: List[str]
+    colors: List[str]
+    hover_texts: List[str]
+    relationship_traces: Dict[Tuple[str, bool], go.Scatter3d]
+    arrow_traces: Dict[str, List[BaseTraceType]] = field(default_factory=dict)
+    node_traces: Dict[Optional[str], go.Scatter3d] = field(default_factory=dict)
+
+
+# Filter trace cache per graph; entries go away with their graph
+_filter_trace_cache: "weakref.WeakKeyDictionary[AssetRelationshipGraph, _FilterTraceCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_filter_trace_cache_lock = threading.Lock()
+
+
+def _relationship_filter_mask(relationship_filters: Optional[Dict[str, bool]]) -> int:
+    """Return the bitmask of enabled relationship filters; every bit is set when no filters apply."""
+    if relationship_filters is None:
+        return ALL_RELATIONSHIPS_MASK
+    mask = 0
+    for rel_type, bit in _FILTER_BITS.items():
+        if relationship_filters.get(rel_type, True):
+            mask |= bit
+    return mask
+
+
+def _build_filter_trace_cache(graph: AssetRelationshipGraph, version: int) -> _FilterTraceCache:
+    """Validate the graph's visualization data and build one trace per relationship group, unfiltered.
+
+    Raises:
+        ValueError: If the visualization data cannot be retrieved or is invalid
+    """
+    try:
+        positions, asset_ids, colors, hover_texts = graph.get_3d_visualization_data_enhanced()
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.exception("Failed to retrieve visualization data from graph: %s", exc)
+        raise ValueError("Failed to retrieve graph visualization data") from exc
+
+    if not graph.is_validated:
+        try:
+            _validate_visualization_data(positions, asset_ids, colors, hover_texts)
+        except ValueError as exc:
+            logger.error("Invalid visualization data: %s", exc)
+            raise
+
+    try:
+        relationship_traces = {
+            group: _create_trace_for_group(group[0], group[1], edges, positions, asset_ids)
+            for group, edges in _collect_and_group_relationships(graph, asset_ids).items()
+        }
+    except (TypeError, ValueError, KeyError) as exc:
+        logger.exception("Failed to create relationship traces due to invalid data: %s", exc)
+        raise ValueError(f"Failed to create relationship traces: {exc}") from exc
+
+    return _FilterTraceCache(version, positions, list(asset_ids), list(colors), list(hover_texts), relationship_traces)
+
+
+def _get_filter_trace_cache(graph: AssetRelationshipGraph) -> _FilterTraceCache:
+    """Return the graph's trace cache, rebuilding it when the graph's `version` has changed."""
+    version = graph.version
+    with _filter_trace_cache_lock:
+        cache = _filter_trace_cache.get(graph)
+    if cache is not None and cache.version == version:
+        return cache
+    cache = _build_filter_trace_cache(graph, version)
+    with _filter_trace_cache_lock:
+        _filter_trace_cache[graph] = cache
+    return cache
+
+
+def _copy_trace(trace: BaseTraceType) -> BaseTraceType:
+    """Copy a cached trace so figures never share its data.
+
+    The copy skips validation, since the cached trace was validated when it was built and the figure
+    validates the copy again when it is added.
+    """
+    return type(trace)(trace, _validate=False)
+
+
+def _compose_relationship_traces(cache: _FilterTraceCache, mask: int) -> List[go.Scatter3d]:
+    """Return fresh copies of the cached relationship traces enabled by `mask`.
+
+    Relationship types without a filter bit are always included.
+    """
+    return [
+        _copy_trace(trace)
+        for (rel_type, _), trace in cache.relationship_traces.items()
+        if rel_type not in _FILTER_BITS or _FILTER_BITS[rel_type] & mask
+    ]
+
+
+def _cached_arrow_traces(
+    graph: AssetRelationshipGraph, cache: _FilterTraceCache, arrow_style: str = "markers"
+) -> List[BaseTraceType]:
+    """Return fresh copies of the cached directional arrow traces for `arrow_style`, building them on first use."""
+    traces = cache.arrow_traces.get(arrow_style)
+    if traces is None:
+        traces = _create_directional_arrows(graph, cache.positions, cache.asset_ids, arrow_style)
+        cache.arrow_traces[arrow_style] = traces
+    return [_copy_trace(trace) for trace in traces]
+
+
+def _cached_node_trace(
+    graph: AssetRelationshipGraph, cache: _FilterTraceCache, node_size_by: Optional[str]
+) -> go.Scatter3d:
+    """Return a fresh copy of the cached node trace for `node_size_by`, building it on first use."""
+    trace = cache.node_traces.get(node_size_by)
+    if trace is None:
+        sizes = _centrality_node_sizes(graph, cache.asset_ids, node_size_by)
+        # The cached data was validated (or trusted) when the cache was built
+        trace = _create_node_trace(
+            cache.positions, cache.asset_ids, cache.colors, cache.hover_texts, sizes, validate=False
+        )
+        cache.node_traces[node_size_by] = trace
+    return _copy_trace(trace)
+
+
 def visualize_3d_graph_with_filters(
     graph: AssetRelationshipGraph,
     show_same_sector: bool = True,
@@ -963,12 +1209,15 @@ def visualize_3d_graph_with_filters(
     show_regulatory: bool = True,
     show_all_relationships: bool = True,
     toggle_arrows: bool = True,
+    node_size_by: Optional[str] = None,
+    arrow_style: str = "markers",
 ) -> go.Figure:
     """Create 3D visualization with selective relationship filtering.
 
-    This function dynamically creates and adds relationship traces based on optional filters,
-    with comprehensive error handling to manage potential issues from invalid filter
-    configurations or data inconsistencies.
+    Relationship, arrow and node traces are built once per graph version (see `_get_filter_trace_cache`);
+    the show_* flags form a bitmask that selects which cached relationship traces go into the figure, so
+    toggling a filter only copies existing traces. Errors from invalid filter configurations or data
+    inconsistencies are logged and handled.
 
     Args:
         graph: Asset relationship graph to visualize
@@ -981,12 +1230,17 @@ def visualize_3d_graph_with_filters(
         show_regulatory: Show regulatory relationships (default: True)
         show_all_relationships: Master toggle to show all relationships (default: True)
         toggle_arrows: Show directional arrows for unidirectional relationships (default: True)
+        node_size_by: Centrality measure ("pagerank", "eigenvector" or "betweenness") that scales node size;
+            uniform node size when omitted (default: None)
+        arrow_style: "markers" for diamond markers or "cone" for oriented cones; above
+            `MAX_DIRECTION_ARROWS` unidirectional edges only a sample gets an arrow (default: "markers")
 
     Returns:
         Plotly Figure object with 3D visualization
 
     Raises:
-        ValueError: If graph is invalid or missing required methods/attributes
+        ValueError: If graph is invalid or missing required methods/attributes, or `node_size_by` or
+            `arrow_style` is unknown
         TypeError: If filter parameters are not boolean values
     """
     # Validate graph input
@@ -1016,6 +1270,8 @@ def visualize_3d_graph_with_filters(
     except TypeError as exc:
         logger.error("Invalid filter configuration: %s", exc)
         raise
+    if arrow_style not in ARROW_STYLES:
+        raise ValueError(f"arrow_style must be one of {ARROW_STYLES}, got {arrow_style!r}")
 
     # Build filter configuration with validation
     try:
@@ -1046,38 +1302,19 @@ def visualize_3d_graph_with_filters(
         logger.exception("Unexpected error building filter configuration: %s", exc)
         raise ValueError("Failed to build filter configuration") from exc
 
-    # Retrieve visualization data with error handling
-    try:
-        positions, asset_ids, colors, hover_texts = graph.get_3d_visualization_data_enhanced()
-    except Exception as exc:  # pylint: disable=broad-except
-        logger.exception("Failed to retrieve visualization data from graph: %s", exc)
-        raise ValueError("Failed to retrieve graph visualization data") from exc
-
-    # Validate retrieved data
-    try:
-        _validate_visualization_data(positions, asset_ids, colors, hover_texts)
-    except ValueError as exc:
-        logger.error("Invalid visualization data: %s", exc)
-        raise
+    # Traces are built once per graph version; a filter change only composes them
+    cache = _get_filter_trace_cache(graph)
+    asset_ids = cache.asset_ids
 
     # Create figure
     fig = go.Figure()
 
-    # Build relationship traces with comprehensive error handling
+    # Select the cached relationship traces enabled by the filter bitmask
     try:
-        relationship_traces = _create_relationship_traces(
-            graph, positions, asset_ids, relationship_filters
-        )
-    except (TypeError, ValueError) as exc:
-        logger.exception(
-            "Failed to create filtered relationship traces due to invalid data (filters: %s): %s",
-            relationship_filters,
-            exc
-        )
-        raise ValueError(f"Failed to create relationship traces: {exc}") from exc
+        relationship_traces = _compose_relationship_traces(cache, _relationship_filter_mask(relationship_filters))
     except Exception as exc:  # pylint: disable=broad-except
         logger.exception(
-            "Unexpected error creating filtered relationship traces (filters: %s): %s",
+            "Unexpected error composing filtered relationship traces (filters: %s): %s",
             relationship_filters,
             exc
         )
@@ -1093,7 +1330,7 @@ def visualize_3d_graph_with_filters(
     # Add directional arrows if enabled
     if toggle_arrows:
         try:
-            arrow_traces = _create_directional_arrows(graph, positions, asset_ids)
+            arrow_traces = _cached_arrow_traces(graph, cache, arrow_style)
         except (TypeError, ValueError) as exc:
             logger.exception("Failed to create directional arrows due to invalid data: %s", exc)
             arrow_traces = []
@@ -1108,9 +1345,10 @@ def visualize_3d_graph_with_filters(
                 logger.exception("Failed to add directional arrows to figure: %s", exc)
 
     # Add node trace
+    if node_size_by is not None and node_size_by not in CENTRALITY_MEASURES:
+        raise ValueError(f"node_size_by must be one of {CENTRALITY_MEASURES}, got {node_size_by!r}")
     try:
-        node_trace = _create_node_trace(positions, asset_ids, colors, hover_texts)
-        fig.add_trace(node_trace)
+        fig.add_trace(_cached_node_trace(graph, cache, node_size_by))
     except Exception as exc:  # pylint: disable=broad-except
         logger.exception("Failed to create or add node trace: %s", exc)
         raise ValueError("Failed to create node visualization") from exc
@@ -0,0 +1,263 @@
+"""Headless static rendering of graph layouts to PNG and SVG.
+
+Consumers that only need a picture of the network (reports, emails) should not have to build an interactive
+Plotly figure and run a browser to export it. These renderers work directly on the layout and edge arrays of a
+`LayoutIndex`:
+
+- PNG: edges are sampled into pixels for all edges of a chunk at once and blended by how many edges cross each
+  pixel; nodes are stamped as disks in depth order. The image is encoded with `zlib`, so nothing beyond NumPy
+  and the standard library is needed.
+- SVG: one path per relationship type and one circle per node.
+
+Both project the 3D layout orthographically from the same corner the interactive figure's default camera uses.
+"""
+
+from __future__ import annotations
+
+import re
+import struct
+import zlib
+from html import escape
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from src.logic.level_of_detail import LayoutIndex
+from src.visualizations.graph_visuals import REL_TYPE_COLORS
+
+# Content type of each snapshot format
+SNAPSHOT_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+
+# Edge pixels sampled per rasterization chunk; bounds the temporary arrays for graphs with many long edges
+_SAMPLES_PER_CHUNK = 2_000_000
+
+# Gray used for relationship types without a palette entry and for unparseable colors
+_FALLBACK_COLOR = "#888888"
+_FALLBACK_RGB = (136, 136, 136)
+_RGB_PATTERN = re.compile(r"rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)")
+
+
+def parse_color(color: str) -> Tuple[int, int, int]:
+    """Return the RGB triple of a `#rgb`, `#rrggbb`, `rgb(...)` or `rgba(...)` color, or gray if unrecognized."""
+    color = color.strip()
+    if color.startswith("#"):
+        digits = color[1:]
+        if len(digits) == 3:
+            digits = "".join(digit * 2 for digit in digits)
+        if len(digits) in (6, 8):
+            try:
+                return int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16)
+            except ValueError:
+                return _FALLBACK_RGB
+        return _FALLBACK_RGB
+    match = _RGB_PATTERN.match(color)
+    if match:
+        return tuple(min(int(channel), 255) for channel in match.groups())  # type: ignore[return-value]
+    return _FALLBACK_RGB
+
+
+def project_positions(positions: np.ndarray, width: int, height: int, margin: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Project 3D positions onto the image plane, viewed from the (+x, +y, +z) corner.
+
+    Parameters:
+        positions (np.ndarray): Node coordinates, shape (n, 3).
+        width (int): Image width in pixels.
+        height (int): Image height in pixels.
+        margin (int): Blank border in pixels.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Pixel coordinates with shape (n, 2), with y growing downwards and the
+        layout scaled uniformly to fit inside the margin, and the depth of each node (larger is nearer).
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    view = np.array([1.0, 1.0, 1.0]) / np.sqrt(3.0)
+    right = np.array([-1.0, 1.0, 0.0]) / np.sqrt(2.0)
+    up = np.cross(view, right)
+    plane = np.stack([positions @ right, positions @ up], axis=1)
+    depth = positions @ view
+    if plane.shape[0] == 0:
+        return plane, depth
+
+    low, high = plane.min(axis=0), plane.max(axis=0)
+    extent = np.maximum(high - low, 1e-12)
+    scale = min((width - 2 * margin) / extent[0], (height - 2 * margin) / extent[1])
+    # Center the drawing; degenerate axes collapse to the middle of the image
+    center = (low + high) / 2.0
+    pixels = np.empty_like(plane)
+    pixels[:, 0] = width / 2.0 + (plane[:, 0] - center[0]) * scale
+    pixels[:, 1] = height / 2.0 - (plane[:, 1] - center[1]) * scale
+    return pixels, depth
+
+
+def _edge_samples(start: np.ndarray, end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample every edge at one-pixel steps; return the integer x and y pixel coordinates of all samples."""
+    delta = end - start
+    steps = np.maximum(np.ceil(np.abs(delta).max(axis=1)).astype(np.int64), 1)
+    counts = steps + 1
+    edge = np.repeat(np.arange(start.shape[0], dtype=np.int32), counts)
+    # Position of each sample along its edge: a running count that restarts at every edge
+    offset = np.ones(edge.size, dtype=np.float32)
+    offset[0] = 0.0
+    offset[np.cumsum(counts)[:-1]] = -steps[:-1]
+    offset = np.cumsum(offset, dtype=np.float32)
+    step = (delta / steps[:, None]).astype(np.float32)
+    origin = start.astype(np.float32)
+    xs = np.rint(origin[edge, 0] + step[edge, 0] * offset).astype(np.int64)
+    ys = np.rint(origin[edge, 1] + step[edge, 1] * offset).astype(np.int64)
+    return xs, ys
+
+
+def encode_png(image: np.ndarray) -> bytes:
+    """Encode an (h, w, 3) uint8 RGB image as a PNG file."""
+    height, width = image.shape[:2]
+    rows = np.zeros((height, 1 + width * 3), dtype=np.uint8)
+    rows[:, 1:] = image.reshape(height, width * 3)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"".join(
+        [
+            b"\x89PNG\r\n\x1a\n",
+            chunk(b"IHDR", header),
+            chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)),
+            chunk(b"IEND", b""),
+        ]
+    )
+
+
+def render_png(
+    layout: LayoutIndex,
+    edges: Optional[np.ndarray] = None,
+    width: int = 800,
+    height: int = 600,
+    node_radius: int = 3,
+    edge_opacity: float = 0.35,
+    background: str = "#ffffff",
+    edge_colors: Optional[Dict[str, str]] = None,
+) -> bytes:
+    """
+    Rasterize a layout to a PNG image.
+
+    Parameters:
+        layout (LayoutIndex): Layout and edge arrays to draw.
+        edges (Optional[np.ndarray]): Positions of the edges to draw in the layout's edge arrays; all when omitted.
+        width (int): Image width in pixels.
+        height (int): Image height in pixels.
+        node_radius (int): Node disk radius in pixels.
+        edge_opacity (float): Opacity of a single edge; pixels crossed by several edges get darker.
+        background (str): Background color.
+        edge_colors (Optional[Dict[str, str]]): Color per relationship type; defaults to the interactive
+            figure's palette.
+
+    Returns:
+        bytes: The encoded PNG file.
+    """
+    edge_colors = REL_TYPE_COLORS if edge_colors is None else edge_colors
+    if edges is None:
+        edges = np.arange(layout.edge_source.size)
+    pixels, depth = project_positions(layout.positions, width, height, margin=node_radius + 2)
+    canvas = np.empty((height * width, 3), dtype=np.float64)
+    canvas[:] = parse_color(background)
+
+    if edges.size:
+        palette = [parse_color(edge_colors.get(rel_type, _FALLBACK_COLOR)) for rel_type in layout.relationship_types]
+        type_rgb = np.array(palette or [_FALLBACK_RGB], dtype=np.float64)
+        # Group edges by type and cut them into chunks of one type each, so a chunk has a single color
+        edges = edges[np.argsort(layout.edge_type[edges], kind="stable")]
+        edge_types = layout.edge_type[edges]
+        sources = pixels[layout.edge_source[edges]]
+        targets = pixels[layout.edge_target[edges]]
+        lengths = np.ceil(np.abs(targets - sources).max(axis=1)) + 2
+        chunk_ids = (np.cumsum(lengths) // _SAMPLES_PER_CHUNK).astype(np.int64)
+        cuts = (chunk_ids[1:] != chunk_ids[:-1]) | (edge_types[1:] != edge_types[:-1])
+        boundaries = np.flatnonzero(np.r_[True, cuts, True])
+
+        hits = np.zeros(height * width, dtype=np.int64)
+        color_sums = np.zeros((height * width, 3), dtype=np.float64)
+        for begin, end in zip(boundaries[:-1], boundaries[1:]):
+            xs, ys = _edge_samples(sources[begin:end], targets[begin:end])
+            inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+            chunk_hits = np.bincount(ys[inside] * width + xs[inside], minlength=hits.size)
+            hits += chunk_hits
+            color_sums += chunk_hits[:, None] * type_rgb[edge_types[begin]]
+
+        covered = hits > 0
+        alpha = 1.0 - (1.0 - edge_opacity) ** hits[covered]
+        mean_color = color_sums[covered] / hits[covered, None]
+        canvas[covered] = canvas[covered] * (1.0 - alpha[:, None]) + mean_color * alpha[:, None]
+
+    if layout.node_count:
+        color_table, color_index = np.unique(np.asarray(layout.colors, dtype=str), return_inverse=True)
+        node_rgb = np.array([parse_color(color) for color in color_table], dtype=np.float64)[color_index]
+        grid = np.arange(-node_radius, node_radius + 1)
+        dx, dy = np.meshgrid(grid, grid)
+        disk = dx * dx + dy * dy <= node_radius * node_radius + node_radius
+        dx, dy = dx[disk], dy[disk]
+        # Far nodes first, so nearer nodes are stamped over them
+        order = np.argsort(depth, kind="stable")
+        centers = np.rint(pixels[order]).astype(np.int64)
+        xs = (centers[:, 0, None] + dx).ravel()
+        ys = (centers[:, 1, None] + dy).ravel()
+        stamped = np.repeat(order, dx.size)
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        canvas[ys[inside] * width + xs[inside]] = node_rgb[stamped[inside]]
+
+    image = np.clip(np.rint(canvas), 0, 255).astype(np.uint8).reshape(height, width, 3)
+    return encode_png(image)
+
+
+def render_svg(
+    layout: LayoutIndex,
+    edges: Optional[np.ndarray] = None,
+    width: int = 800,
+    height: int = 600,
+    node_radius: int = 3,
+    edge_opacity: float = 0.35,
+    background: str = "#ffffff",
+    edge_colors: Optional[Dict[str, str]] = None,
+) -> bytes:
+    """
+    Render a layout as an SVG document.
+
+    Parameters are those of `render_png`. Edges become one path per relationship type and nodes one circle
+    each, drawn far to near.
+
+    Returns:
+        bytes: The UTF-8 encoded SVG document.
+    """
+    edge_colors = REL_TYPE_COLORS if edge_colors is None else edge_colors
+    if edges is None:
+        edges = np.arange(layout.edge_source.size)
+    pixels, depth = project_positions(layout.positions, width, height, margin=node_radius + 2)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}">',
+        f'<rect width="100%" height="100%" fill="{escape(background)}"/>',
+    ]
+
+    edge_types = layout.edge_type[edges]
+    for code in np.unique(edge_types).tolist():
+        selected = edges[edge_types == code]
+        segments = np.concatenate(
+            [pixels[layout.edge_source[selected]], pixels[layout.edge_target[selected]]], axis=1
+        ).round(1)
+        path = "".join(f"M{x0:g} {y0:g}L{x1:g} {y1:g}" for x0, y0, x1, y1 in segments.tolist())
+        color = escape(edge_colors.get(layout.relationship_types[code], _FALLBACK_COLOR))
+        parts.append(
+            f'<path d="{path}" fill="none" stroke="{color}" stroke-opacity="{edge_opacity:g}" stroke-width="1"/>'
+        )
+
+    order = np.argsort(depth, kind="stable")
+    centers = pixels[order].round(1).tolist()
+    parts.extend(
+        f'<circle cx="{x:g}" cy="{y:g}" r="{node_radius}" fill="{escape(layout.colors[i])}"/>'
+        for i, (x, y) in zip(order.tolist(), centers)
+    )
+    parts.append("</svg>")
+    return "".join(parts).encode("utf-8")
+
+
+SNAPSHOT_RENDERERS = {"png": render_png, "svg": render_svg}
@@ -4,9 +4,12 @@ This module tests all API endpoints, error handling, CORS configuration,
 lazy graph initialization with thread-safe double-check locking, and response models.
 """
 
+import json
 import os
+import struct
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
@@ -19,9 +22,11 @@ from api.main import (
     app,
     validate_origin,
 )
+from api.offload import ComputeBusyError, ComputeTimeoutError
 from src.data.sample_data import create_sample_database
 from src.data.real_data_fetcher import _save_to_cache
 from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_communities import CommunityAssignment
 from src.models.financial_models import AssetClass, Equity
 
 
@@ -734,5 +739,575 @@ class TestIntegrationScenarios:
         assert len(tech_equity_assets) <= len(equity_assets)
 
 
+class TestResponseCaching:
+    """Test version-keyed caching of encoded response bodies."""
+
+    @pytest.fixture
+    def graph(self):
+        """Mock graph exposing the attributes read by the cached endpoints."""
+        mock_graph = Mock()
+        mock_graph.assets = {
+            "AAPL": Equity(
+                id="AAPL",
+                symbol="AAPL",
+                name="Apple Inc.",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=150.0,
+                pe_ratio=25.5,
+            ),
+            "XOM": Equity(
+                id="XOM", symbol="XOM", name="Exxon Mobil", asset_class=AssetClass.EQUITY, sector="Energy", price=110.0
+            ),
+        }
+        mock_graph.relationships = {"AAPL": [("XOM", "market_cap_similar", 0.5)]}
+        mock_graph.calculate_metrics.return_value = {
+            "total_assets": 2,
+            "total_relationships": 1,
+            "avg_degree": 1.0,
+            "max_degree": 1,
+            "network_density": 0.5,
+        }
+        mock_graph.get_3d_visualization_data.return_value = (
+            np.array([[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]),
+            ["AAPL", "XOM"],
+            ["#1f77b4", "#1f77b4"],
+            ["Apple", "Exxon"],
+        )
+        mock_graph.communities.return_value = CommunityAssignment(["AAPL", "XOM"], np.array([0, 1]), 0.0, 1)
+        return mock_graph
+
+    @pytest.fixture
+    def client(self, graph):
+        """Yield a TestClient serving the mock graph and reset the global graph afterwards."""
+        api_main.set_graph(graph)
+        try:
+            yield TestClient(app)
+        finally:
+            api_main.reset_graph()
+
+    def test_repeated_requests_serve_identical_bytes(self, client):
+        """Second request should return the cached body unchanged."""
+        first = client.get("/api/assets")
+        second = client.get("/api/assets")
+        assert first.status_code == 200
+        assert first.content == second.content
+        assert first.headers["content-type"] == "application/json"
+        assert [a["id"] for a in first.json()] == ["AAPL", "XOM"]
+        assert first.json()[0]["additional_fields"] == {"pe_ratio": 25.5}
+
+    def test_cache_hit_skips_rebuild(self, client, graph):
+        """Visualization data should be computed once per graph snapshot."""
+        client.get("/api/visualization")
+        client.get("/api/visualization")
+        assert graph.get_3d_visualization_data.call_count == 1
+
+        data = client.get("/api/visualization").json()
+        assert data["nodes"][1]["x"] == 3.0
+        assert data["edges"] == [
+            {"source": "AAPL", "target": "XOM", "relationship_type": "market_cap_similar", "strength": 0.5}
+        ]
+
+    def test_cached_body_is_served_precompressed(self, client):
+        """Cached responses above the threshold are gzipped once and revalidate with their weak ETag."""
+        with patch.object(api_main, "COMPRESSION_MIN_SIZE", 1):
+            response = client.get("/api/relationships", headers={"Accept-Encoding": "gzip"})
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.headers["etag"].startswith('W/"')
+            assert response.json()[0]["source_id"] == "AAPL"
+
+            entry = next(iter(api_main.response_cache._entries.values()))
+            assert entry.has_compressed("gzip")
+
+            revalidated = client.get(
+                "/api/relationships",
+                headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]},
+            )
+            assert revalidated.status_code == 304
+
+    def test_columnar_visualization(self, client):
+        """The columnar format returns parallel arrays with integer edge endpoints and a type table."""
+        rows = client.get("/api/visualization").json()
+        data = client.get("/api/visualization?format=columnar").json()
+
+        assert data["format"] == "columnar"
+        assert data["nodes"]["id"] == [node["id"] for node in rows["nodes"]]
+        assert data["nodes"]["x"] == [node["x"] for node in rows["nodes"]]
+        assert data["nodes"]["asset_class"] == ["Equity", "Equity"]
+        assert data["nodes"]["cluster"] == [0, 1]
+        assert data["relationship_types"] == ["market_cap_similar"]
+        assert data["edges"] == {"source": [0], "target": [1], "relationship_type": [0], "strength": [0.5]}
+
+    def test_subgraph_viewport(self, client):
+        """A bounding box limits the served nodes and drops edges leaving the viewport."""
+        data = client.get("/api/visualization/subgraph?bbox=-1,-1,1,2").json()
+        assert data["level"] == "nodes"
+        assert data["nodes"]["id"] == ["AAPL"]
+        assert data["edges"]["source"] == []
+
+        full = client.get("/api/visualization/subgraph").json()
+        assert full["visible_nodes"] == 2
+        assert full["edges"]["strength"] == [0.5]
+        assert client.get("/api/visualization/subgraph?min_strength=0.6").json()["edges"]["source"] == []
+
+    def test_subgraph_clusters_when_too_many_nodes(self, client):
+        """Above max_nodes the viewport is aggregated into at most max_nodes clusters."""
+        data = client.get("/api/visualization/subgraph?max_nodes=1").json()
+        assert data["level"] == "clusters"
+        assert data["visible_nodes"] == 2
+        assert data["nodes"]["count"] == [2]
+        assert data["nodes"]["x"] == [1.5]
+
+    @pytest.mark.parametrize("query", ["bbox=1,2,3", "bbox=a,b,c,d", "bbox=2,0,1,1", "level=tiles"])
+    def test_subgraph_rejects_bad_parameters(self, client, query):
+        """Malformed viewports and unknown levels are rejected with 400."""
+        assert client.get(f"/api/visualization/subgraph?{query}").status_code == 400
+
+    def test_snapshot_png(self, client):
+        """The snapshot endpoint returns a cached PNG of the requested size."""
+        response = client.get("/api/visualization/snapshot?width=120&height=80")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.content[:8] == b"\x89PNG\r\n\x1a\n"
+        assert struct.unpack(">II", response.content[16:24]) == (120, 80)
+        with patch.object(api_main.compute_executor, "run", side_effect=AssertionError("offloaded")):
+            assert client.get("/api/visualization/snapshot?width=120&height=80").content == response.content
+
+    def test_snapshot_svg_filters_relationship_types(self, client):
+        """The SVG snapshot draws only the requested relationship types."""
+        full = client.get("/api/visualization/snapshot?format=svg").text
+        assert full.startswith("<svg") and full.count("<circle") == 2 and full.count("<path") == 1
+        filtered = client.get("/api/visualization/snapshot?format=svg&relationship_types=correlation").text
+        assert filtered.count("<circle") == 2 and "<path" not in filtered
+
+    @pytest.mark.parametrize("query", ["format=gif", "width=10", "min_strength=-1"])
+    def test_snapshot_rejects_bad_parameters(self, client, query):
+        """Unknown formats and out-of-range sizes are rejected."""
+        assert client.get(f"/api/visualization/snapshot?{query}").status_code in (400, 422)
+
+    @pytest.mark.parametrize(
+        "error, status_code", [(ComputeTimeoutError("slow"), 504), (ComputeBusyError("busy"), 503)]
+    )
+    def test_offloaded_build_errors(self, client, error, status_code):
+        """Timeouts and saturation of the compute executor map to 504 and 503."""
+        with patch.object(api_main.compute_executor, "run", side_effect=error):
+            assert client.get("/api/metrics").status_code == status_code
+
+    def test_cache_hit_does_not_offload(self, client):
+        """Cached bodies are served without touching the compute executor."""
+        client.get("/api/metrics")
+        with patch.object(api_main.compute_executor, "run", side_effect=AssertionError("offloaded")):
+            assert client.get("/api/metrics").status_code == 200
+
+    def test_unknown_visualization_format(self, client):
+        """Unsupported payload formats are rejected with 400."""
+        assert client.get("/api/visualization?format=xml").status_code == 400
+
+    def test_visualization_accepts_float32_positions(self, client, graph):
+        """Positions are converted in bulk from any numeric NumPy dtype."""
+        graph.get_3d_visualization_data.return_value = (
+            np.array([[0.5, 1.0, 2.0], [3.0, 4.0, 5.0]], dtype=np.float32),
+            ["AAPL", "XOM"],
+            ["#1f77b4", "#1f77b4"],
+            ["Apple", "Exxon"],
+        )
+        node = client.get("/api/visualization").json()["nodes"][0]
+        assert (node["x"], node["y"], node["z"]) == (0.5, 1.0, 2.0)
+
+    def test_query_parameters_are_part_of_key(self, client):
+        """Different filters must not share a cache entry."""
+        tech = client.get("/api/assets?sector=Technology").json()
+        energy = client.get("/api/assets?sector=Energy").json()
+        assert [a["id"] for a in tech] == ["AAPL"]
+        assert [a["id"] for a in energy] == ["XOM"]
+
+    def test_set_graph_invalidates_cache(self, client, graph):
+        """Publishing a new graph should bump the version and discard cached bodies."""
+        version_before = api_main.graph_version
+        assert len(client.get("/api/relationships").json()) == 1
+
+        graph.relationships = {}
+        api_main.set_graph(graph)
+
+        assert api_main.graph_version == version_before + 1
+        assert client.get("/api/relationships").json() == []
+
+    @pytest.mark.parametrize("path", ["/api/assets", "/api/relationships", "/api/metrics", "/api/visualization"])
+    def test_etag_and_cache_control_headers(self, client, path):
+        """Graph endpoints should emit a strong ETag and a Cache-Control header."""
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "no-cache"
+
+    @pytest.mark.parametrize("path", ["/api/assets", "/api/relationships", "/api/metrics", "/api/visualization"])
+    def test_if_none_match_returns_304(self, client, path):
+        """A matching If-None-Match header should yield 304 with an empty body."""
+        etag = client.get(path).headers["etag"]
+
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        weak = client.get(path, headers={"If-None-Match": f'"stale", W/{etag}'})
+        assert weak.status_code == 304
+
+    def test_stale_etag_returns_full_body(self, client, graph):
+        """After a graph refresh the old ETag no longer matches."""
+        etag = client.get("/api/relationships").headers["etag"]
+
+        graph.relationships = {}
+        api_main.set_graph(graph)
+
+        response = client.get("/api/relationships", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json() == []
+        assert response.headers["etag"] != etag
+
+
+class TestPaginationAndSparseFields:
+    """Test cursor pagination, limits and fields= selectors on list endpoints."""
+
+    @pytest.fixture
+    def client(self):
+        """Yield a TestClient serving a mock graph with three assets and three edges."""
+        mock_graph = Mock()
+        mock_graph.assets = {
+            asset_id: Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Inc.",
+                asset_class=AssetClass.EQUITY,
+                sector=sector,
+                price=100.0,
+                pe_ratio=20.0,
+            )
+            for asset_id, sector in [("MSFT", "Technology"), ("AAPL", "Technology"), ("XOM", "Energy")]
+        }
+        mock_graph.relationships = {
+            "AAPL": [("MSFT", "same_sector", 0.7), ("XOM", "market_cap_similar", 0.3)],
+            "MSFT": [("AAPL", "same_sector", 0.7)],
+        }
+        api_main.set_graph(mock_graph)
+        try:
+            yield TestClient(app)
+        finally:
+            api_main.reset_graph()
+
+    def test_unpaginated_list_is_ordered_by_id(self, client):
+        """Without paging parameters the endpoint still returns a plain list."""
+        data = client.get("/api/assets").json()
+        assert [a["id"] for a in data] == ["AAPL", "MSFT", "XOM"]
+
+    def test_asset_cursor_pagination(self, client):
+        """Pages chain through next_cursor until it is null."""
+        first = client.get("/api/assets?limit=2").json()
+        assert [a["id"] for a in first["items"]] == ["AAPL", "MSFT"]
+        assert first["total"] == 3
+        assert first["limit"] == 2
+
+        second = client.get(f"/api/assets?limit=2&cursor={first['next_cursor']}").json()
+        assert [a["id"] for a in second["items"]] == ["XOM"]
+        assert second["next_cursor"] is None
+
+    def test_filtered_pagination(self, client):
+        """Filters apply before pagination."""
+        data = client.get("/api/assets?sector=Technology&limit=5").json()
+        assert data["total"] == 2
+        assert data["next_cursor"] is None
+
+    def test_sparse_asset_fields(self, client):
+        """fields= limits keys and omits additional_fields unless requested."""
+        data = client.get("/api/assets?fields=id,price").json()
+        assert data[0] == {"id": "AAPL", "price": 100.0}
+
+        with_extra = client.get("/api/assets?fields=id,additional_fields&limit=1").json()
+        assert with_extra["items"][0] == {"id": "AAPL", "additional_fields": {"pe_ratio": 20.0}}
+
+    def test_relationship_pagination_and_filter(self, client):
+        """Relationships page in (source, target, type) order and filter by type."""
+        first = client.get("/api/relationships?limit=2&fields=source_id,target_id").json()
+        assert first["items"] == [{"source_id": "AAPL", "target_id": "MSFT"}, {"source_id": "AAPL", "target_id": "XOM"}]
+        second = client.get(f"/api/relationships?limit=2&cursor={first['next_cursor']}").json()
+        assert second["items"] == [
+            {"source_id": "MSFT", "target_id": "AAPL", "relationship_type": "same_sector", "strength": 0.7}
+        ]
+
+        same_sector = client.get("/api/relationships?relationship_type=same_sector").json()
+        assert len(same_sector) == 2
+
+    @pytest.mark.parametrize(
+        "query",
+        ["/api/assets?cursor=garbage", "/api/assets?fields=id,bogus", "/api/relationships?cursor=garbage"],
+    )
+    def test_invalid_parameters_return_400(self, client, query):
+        """Malformed cursors and unknown fields are client errors."""
+        assert client.get(query).status_code == 400
+
+    def test_limit_bounds(self, client):
+        """limit must be positive and at most MAX_PAGE_LIMIT."""
+        assert client.get("/api/assets?limit=0").status_code == 422
+        assert client.get(f"/api/assets?limit={api_main.MAX_PAGE_LIMIT + 1}").status_code == 422
+
+
+@pytest.mark.unit
+class TestRelationshipExport:
+    """Test the streaming relationship export endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        """Yield a TestClient serving a mock graph with three edges."""
+        mock_graph = Mock()
+        mock_graph.relationships = {
+            "AAPL": [("MSFT", "same_sector", 0.7), ("XOM", "market_cap_similar", 0.3)],
+            "MSFT": [("AAPL", "same_sector", 0.7)],
+        }
+        api_main.set_graph(mock_graph)
+        try:
+            yield TestClient(app)
+        finally:
+            api_main.reset_graph()
+
+    def test_ndjson_is_default(self, client):
+        """Each line is one JSON relationship object."""
+        response = client.get("/api/export/relationships")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 3
+        assert rows[0] == {"source_id": "AAPL", "target_id": "MSFT", "relationship_type": "same_sector", "strength": 0.7}
+
+    def test_csv_has_header(self, client):
+        """CSV export starts with a header row and is offered as an attachment."""
+        response = client.get("/api/export/relationships?format=csv&relationship_type=same_sector")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "relationships.csv" in response.headers["content-disposition"]
+        lines = response.text.splitlines()
+        assert lines[0] == "source_id,target_id,relationship_type,strength"
+        assert lines[1:] == ["AAPL,MSFT,same_sector,0.7", "MSFT,AAPL,same_sector,0.7"]
+
+    def test_unsupported_format(self, client):
+        """Unknown formats are rejected with 400."""
+        assert client.get("/api/export/relationships?format=xml").status_code == 400
+
+
+@pytest.mark.unit
+class TestColumnarExport:
+    """Test the Arrow/Parquet export endpoints."""
+
+    @pytest.fixture
+    def client(self):
+        """Yield a TestClient serving a mock graph with two assets and one edge."""
+        mock_graph = Mock()
+        mock_graph.assets = {
+            asset_id: Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=f"{asset_id} Inc.",
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=100.0,
+            )
+            for asset_id in ("MSFT", "AAPL")
+        }
+        mock_graph.relationships = {"AAPL": [("MSFT", "same_sector", 0.7)]}
+        mock_graph.communities.return_value = CommunityAssignment(["AAPL", "MSFT"], np.array([3, 3]), 0.0, 1)
+        api_main.set_graph(mock_graph)
+        try:
+            yield TestClient(app)
+        finally:
+            api_main.reset_graph()
+
+    def test_unknown_export_is_404(self, client):
+        """Only the assets and relationships datasets in arrow or parquet format exist."""
+        assert client.get("/api/export/prices.arrow").status_code == 404
+        assert client.get("/api/export/assets.xlsx").status_code == 404
+
+    def test_missing_pyarrow_is_501(self, client):
+        """Without pyarrow the endpoints report that the feature is unavailable."""
+        with patch("api.main.columnar_export_available", return_value=False):
+            response = client.get("/api/export/assets.arrow")
+        assert response.status_code == 501
+        assert "pyarrow" in response.json()["detail"]
+
+    def test_relationships_arrow(self, client):
+        """The Arrow stream decodes to the graph's edges and carries an ETag."""
+        pa = pytest.importorskip("pyarrow")
+        response = client.get("/api/export/relationships.arrow")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        assert "etag" in response.headers
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.column("source_id").to_pylist() == ["AAPL"]
+
+    def test_assets_parquet(self, client):
+        """The Parquet file decodes to the asset table ordered by id."""
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        response = client.get("/api/export/assets.parquet")
+        assert response.status_code == 200
+        table = pq.read_table(pa.BufferReader(response.content))
+        assert table.column("id").to_pylist() == ["AAPL", "MSFT"]
+        assert table.column("cluster").to_pylist() == [3, 3]
+
+
+@pytest.mark.unit
+class TestGraphQueryEndpoints:
+    """Test the neighborhood, path and centrality endpoints."""
+
+    @pytest.fixture
+    def client(self):
+        """Yield a TestClient serving a real graph with a three-asset chain."""
+        graph = AssetRelationshipGraph()
+        graph.assets = {asset_id: Mock() for asset_id in ("AAPL", "MSFT", "XOM")}
+        graph.relationships = {
+            "AAPL": [("MSFT", "same_sector", 0.7)],
+            "MSFT": [("XOM", "market_cap_similar", 0.3)],
+        }
+        api_main.set_graph(graph)
+        try:
+            yield TestClient(app)
+        finally:
+            api_main.reset_graph()
+
+    def test_two_hops(self, client):
+        """Nodes carry hop distances and edges are returned among them."""
+        response = client.get("/api/assets/AAPL/neighborhood?hops=2")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["center"] == "AAPL"
+        assert data["nodes"] == [{"id": "AAPL", "hop": 0}, {"id": "MSFT", "hop": 1}, {"id": "XOM", "hop": 2}]
+        assert len(data["edges"]) == 2
+
+    def test_filters(self, client):
+        """Type, strength and direction filters are applied."""
+        typed = client.get("/api/assets/AAPL/neighborhood?hops=2&relationship_types=same_sector").json()
+        assert [node["id"] for node in typed["nodes"]] == ["AAPL", "MSFT"]
+        strong = client.get("/api/assets/MSFT/neighborhood?min_strength=0.5").json()
+        assert [node["id"] for node in strong["nodes"]] == ["MSFT", "AAPL"]
+        incoming = client.get("/api/assets/MSFT/neighborhood?direction=in").json()
+        assert [node["id"] for node in incoming["nodes"]] == ["MSFT", "AAPL"]
+
+    def test_errors(self, client):
+        """Unknown assets are 404, bad directions 400 and excessive hops 422."""
+        assert client.get("/api/assets/NOPE/neighborhood").status_code == 404
+        assert client.get("/api/assets/AAPL/neighborhood?direction=up").status_code == 400
+        too_deep = api_main.MAX_NEIGHBORHOOD_HOPS + 1
+        assert client.get(f"/api/assets/AAPL/neighborhood?hops={too_deep}").status_code == 422
+
+    def test_paths(self, client):
+        """Paths explain the connection with edges and the strength product."""
+        response = client.get("/api/paths?source=AAPL&target=XOM&k=2")
+        assert response.status_code == 200
+        data = response.json()
+        assert [path["nodes"] for path in data["paths"]] == [["AAPL", "MSFT", "XOM"]]
+        path = data["paths"][0]
+        assert path["hops"] == 2
+        assert path["strength"] == pytest.approx(0.21)
+        assert path["edges"][1] == {
+            "source": "MSFT",
+            "target": "XOM",
+            "relationship_type": "market_cap_similar",
+            "strength": 0.3,
+        }
+
+    def test_paths_filters_and_errors(self, client):
+        """Direction and type filters can disconnect assets; unknown assets and bad directions fail."""
+        assert client.get("/api/paths?source=XOM&target=AAPL&direction=out").json()["paths"] == []
+        typed = client.get("/api/paths?source=AAPL&target=XOM&relationship_types=same_sector")
+        assert typed.json()["paths"] == []
+        assert client.get("/api/paths?source=AAPL&target=NOPE").status_code == 404
+        assert client.get("/api/paths?source=AAPL&target=XOM&direction=up").status_code == 400
+        assert client.get("/api/paths?source=AAPL&target=XOM&k=0").status_code == 422
+
+    def test_republished_in_place_edit(self, client):
+        """Publishing a graph edited in place serves the edit, even when no container changed size."""
+        graph, _ = api_main.get_graph_snapshot()
+        assert client.get("/api/paths?source=AAPL&target=XOM&k=2").json()["paths"][0]["hops"] == 2
+
+        graph.relationships["AAPL"].append(("XOM", "same_sector", 0.9))
+        api_main.set_graph(graph)
+
+        neighborhood = client.get("/api/assets/AAPL/neighborhood?hops=1").json()
+        assert [node["id"] for node in neighborhood["nodes"]] == ["AAPL", "MSFT", "XOM"]
+        paths = client.get("/api/paths?source=AAPL&target=XOM&k=2").json()["paths"]
+        assert [path["nodes"] for path in paths] == [["AAPL", "XOM"], ["AAPL", "MSFT", "XOM"]]
+
+    def test_metrics_centrality(self, client):
+        """Centrality is only included on request, per asset and computed once per snapshot."""
+        graph, _ = api_main.get_graph_snapshot()
+        graph.assets = {
+            asset_id: Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=asset_id,
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=1.0,
+            )
+            for asset_id in ("AAPL", "MSFT", "XOM")
+        }
+        graph.calculate_metrics = Mock(return_value={"total_assets": 3, "total_relationships": 2})
+
+        assert "centrality" not in client.get("/api/metrics").json()
+        with patch.object(graph, "centrality", wraps=graph.centrality) as centrality:
+            data = client.get("/api/metrics?include_centrality=true").json()
+            client.get("/api/metrics?include_centrality=true")
+        assert centrality.call_count == 1
+        scores = data["centrality"]
+        assert set(scores["pagerank"]) == {"AAPL", "MSFT", "XOM"}
+        assert max(scores["betweenness"], key=scores["betweenness"].get) == "MSFT"
+        assert scores["betweenness_samples"] == 3
+
+
+@pytest.mark.unit
+class TestGraphRefreshEndpoints:
+    """Test atomic graph publication and the refresh endpoints."""
+
+    @pytest.fixture
+    def client(self):
+        """Yield a TestClient serving an empty mock graph built by a factory."""
+        api_main.set_graph_factory(lambda: Mock(relationships={}))
+        try:
+            yield TestClient(app)
+        finally:
+            api_main.app.dependency_overrides.clear()
+            api_main.reset_graph()
+
+    def test_publish_swaps_graph_and_keeps_factory(self, client):
+        """Publishing installs the new graph under a new version without dropping the factory."""
+        old_graph, old_version = api_main.get_graph_snapshot()
+        new_graph = Mock(relationships={})
+        api_main._publish_graph(new_graph)
+
+        assert api_main.get_graph_snapshot() == (new_graph, old_version + 1)
+        assert api_main.graph_factory is not None
+        assert old_graph is not new_graph
+
+    def test_status_reports_version(self, client):
+        """The status endpoint exposes refresh metrics and the current graph version."""
+        api_main.get_graph()
+        data = client.get("/api/refresh/status").json()
+        assert data["graph_version"] == api_main.graph_version
+        for key in ("refresh_count", "last_duration_seconds", "staleness_seconds", "in_progress"):
+            assert key in data
+
+    def test_trigger_requires_authentication(self, client):
+        """Anonymous callers cannot trigger a rebuild."""
+        assert client.post("/api/refresh").status_code == 401
+
+    def test_trigger_schedules_refresh(self, client):
+        """Authenticated callers get 202 and the scheduler is woken."""
+        api_main.app.dependency_overrides[api_main.get_current_active_user] = lambda: Mock(username="ops")
+        with patch.object(api_main.refresh_scheduler, "trigger") as trigger:
+            response = client.post("/api/refresh")
+        assert response.status_code == 202
+        assert response.json() == {"status": "scheduled"}
+        trigger.assert_called_once()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""Unit tests for the benchmark harness (benchmarks/harness.py) and suite definition."""
+
+import os
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.harness import (
+    BenchmarkCase,
+    compare_results,
+    format_seconds,
+    load_results,
+    run_suite,
+    save_results,
+    time_case,
+)
+
+
+def _results(**timings):
+    """Build a results payload with one size-10 measurement per keyword; None marks a failure."""
+    return {
+        "schema": 1,
+        "results": [
+            {"name": name, "size": 10, "min": seconds, "error": None if seconds is not None else "Error: boom"}
+            for name, seconds in timings.items()
+        ],
+    }
+
+
+@pytest.mark.unit
+class TestTimeCase:
+    """Test timing, calibration and error capture of single cases."""
+
+    def test_batched_case_statistics(self):
+        """Fast cases without a prepare step are batched and reported per call."""
+        calls = []
+        case = BenchmarkCase("noop", setup=lambda size: size, run=calls.append)
+        measurement = time_case(case, 7, repeat=3, min_time=0.001)
+        assert measurement.error is None
+        assert measurement.repeat == 3 and measurement.number >= 1
+        assert len(calls) == 1 + 3 * measurement.number
+        assert set(calls) == {7}
+        assert 0 <= measurement.min <= measurement.median
+
+    def test_prepare_runs_before_every_call(self):
+        """Cases with a prepare step get a fresh argument for every single timed call."""
+        prepared, received = [], []
+
+        def prepare(state):
+            prepared.append(state)
+            return len(prepared)
+
+        case = BenchmarkCase("fresh", setup=lambda size: "state", prepare=prepare, run=received.append)
+        measurement = time_case(case, 1, repeat=4, min_time=10.0)
+        assert measurement.number == 1
+        assert received == [1, 2, 3, 4, 5]
+        assert prepared == ["state"] * 5
+
+    def test_errors_are_recorded(self):
+        """A failing setup or call yields a measurement carrying the first line of the error."""
+
+        def fail(_):
+            raise RuntimeError("first line\nsecond line")
+
+        measurement = time_case(BenchmarkCase("broken", setup=lambda size: None, run=fail), 5)
+        assert measurement.error == "RuntimeError: first line"
+        assert measurement.min is None
+
+    def test_run_suite_skips_sizes_above_limit(self):
+        """Sizes above a case's max_size are skipped and every measurement is reported."""
+        reported = []
+        cases = [
+            BenchmarkCase("small", setup=lambda size: size, run=lambda state: None, max_size=10),
+            BenchmarkCase("any", setup=lambda size: size, run=lambda state: None),
+        ]
+        results = run_suite(cases, [10, 100], repeat=1, min_time=0.0, report=reported.append)
+        keys = [(result["name"], result["size"]) for result in results["results"]]
+        assert keys == [("small", 10), ("any", 10), ("any", 100)]
+        assert len(reported) == 3
+        assert results["sizes"] == [10, 100]
+        assert set(results["commit"]) == {"sha", "dirty"}
+
+
+@pytest.mark.unit
+class TestResults:
+    """Test result files and run comparison."""
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Saved results load back unchanged; another schema is rejected."""
+        results = _results(a=0.5)
+        path = tmp_path / "nested" / "run.json"
+        save_results(results, path)
+        assert load_results(path) == results
+        save_results({**results, "schema": 99}, path)
+        with pytest.raises(ValueError):
+            load_results(path)
+
+    def test_compare_classifies_changes(self):
+        """Changes beyond the threshold are regressions or improvements; others are unchanged."""
+        baseline = _results(slower=1.0, faster=1.0, steady=1.0, broken=1.0, gone=1.0)
+        current = _results(slower=1.5, faster=0.5, steady=1.1, broken=None, added=1.0)
+        statuses = {comparison.name: comparison.status for comparison in compare_results(baseline, current, 0.2)}
+        assert statuses == {
+            "slower": "regressed",
+            "faster": "improved",
+            "steady": "unchanged",
+            "broken": "failed",
+            "added": "new",
+            "gone": "missing",
+        }
+
+    def test_compare_command_exit_status(self, tmp_path, capsys):
+        """The compare command fails when a benchmark regressed."""
+        baseline, current = tmp_path / "base.json", tmp_path / "current.json"
+        save_results(_results(case=1.0), baseline)
+        save_results(_results(case=1.05), current)
+        assert main(["compare", str(baseline), str(current)]) == 0
+        save_results(_results(case=2.0), current)
+        assert main(["compare", str(baseline), str(current), "--threshold", "0.5"]) == 1
+        assert "regressed" in capsys.readouterr().out
+
+    def test_format_seconds(self):
+        """Durations are shown with a unit matching their magnitude."""
+        assert format_seconds(None) == "-"
+        assert format_seconds(2.5) == "2.5 s"
+        assert format_seconds(0.0123) == "12.3 ms"
+        assert format_seconds(4e-7) == "400 ns"
+
+
+@pytest.mark.unit
+def test_suite_covers_requested_operations():
+    """The suite defines uniquely named cases for every measured area."""
+    from benchmarks.suite import CASES
+
+    names = [case.name for case in CASES]
+    assert len(names) == len(set(names))
+    for expected in (
+        "graph.synthetic_relationships",
+        "graph.centrality",
+        "graph.communities",
+        "graph.get_3d_visualization_data_enhanced",
+        "visuals.visualize_3d_graph_with_filters",
+        "analysis.analyze_graph",
+        "cache.json_save",
+        "cache.json_load",
+        "repository.store",
+        "repository.load",
+    ):
+        assert expected in names
+    assert any(name.startswith("api.") for name in names)
+
+
+@pytest.mark.unit
+def test_every_case_runs(monkeypatch):
+    """Every case completes on a tiny universe, API cases included."""
+    monkeypatch.setenv("ASSET_GRAPH_DATABASE_URL", os.getenv("ASSET_GRAPH_DATABASE_URL", "sqlite:///:memory:"))
+    from benchmarks.suite import CASES, api_environment
+
+    for name, value in api_environment().items():
+        monkeypatch.setenv(name, os.getenv(name, value))
+    try:
+        for case in CASES:
+            measurement = time_case(case, 50, repeat=1, min_time=0.0)
+            assert measurement.error is None, f"{case.name}: {measurement.error}"
+    finally:
+        import api.main
+
+        api.main.reset_graph()
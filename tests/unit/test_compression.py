@@ -0,0 +1,132 @@
+"""Unit tests for response compression (api/compression.py)."""
+
+import gzip
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from api import compression
+from api.compression import CompressionMiddleware, compress, is_compressible, negotiate_encoding
+from api.response_cache import CachedResponse
+
+LARGE_BODY = "x" * 4096
+
+
+@pytest.fixture
+def client():
+    """Yield a TestClient for a small app wrapped in CompressionMiddleware with a 1 KiB threshold."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse(LARGE_BODY)
+
+    @app.get("/precompressed")
+    def precompressed():
+        return Response(gzip.compress(LARGE_BODY.encode()), headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((LARGE_BODY for _ in range(3)), media_type="text/plain")
+
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestNegotiation:
+    """Test Accept-Encoding negotiation."""
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            (None, None),
+            ("", None),
+            ("identity", None),
+            ("gzip, deflate", "gzip"),
+            ("gzip;q=0", None),
+            ("*", "gzip"),
+            ("deflate, *;q=0.5", "gzip"),
+        ],
+    )
+    def test_gzip_only(self, header, expected):
+        """Without brotli only gzip is offered."""
+        with patch.object(compression, "brotli", None):
+            assert negotiate_encoding(header) == expected
+
+    def test_brotli_preferred_when_available(self):
+        """Brotli wins ties when the library is installed, but explicit weights are honoured."""
+        with patch.object(compression, "brotli", object()):
+            assert negotiate_encoding("gzip, br") == "br"
+            assert negotiate_encoding("gzip;q=1.0, br;q=0.5") == "gzip"
+
+    def test_excluded_media_types(self):
+        """Already-compressed formats are never recompressed."""
+        assert is_compressible("application/json")
+        assert is_compressible("text/csv; charset=utf-8")
+        assert not is_compressible("image/png")
+        assert not is_compressible("application/vnd.apache.parquet")
+
+
+@pytest.mark.unit
+class TestCompressionMiddleware:
+    """Test the ASGI compression middleware."""
+
+    def test_small_response_is_not_compressed(self, client):
+        """Responses below the threshold are sent as-is."""
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert response.text == "tiny"
+
+    def test_large_response_is_gzipped(self, client):
+        """Responses above the threshold are compressed and marked as varying by encoding."""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(LARGE_BODY)
+        assert response.text == LARGE_BODY
+
+    def test_identity_when_not_accepted(self, client):
+        """Clients that do not accept gzip receive the raw body."""
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.text == LARGE_BODY
+
+    def test_precompressed_response_passes_through(self, client):
+        """Responses that already carry a Content-Encoding are not compressed twice."""
+        response = client.get("/precompressed", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == LARGE_BODY
+
+    def test_streaming_response_is_compressed(self, client):
+        """Chunked responses are compressed incrementally."""
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == LARGE_BODY * 3
+
+
+@pytest.mark.unit
+class TestPrecompressedEntries:
+    """Test compressed variants stored on cache entries."""
+
+    def test_compressed_variant_is_memoised(self):
+        """Each coding is compressed once per entry."""
+        entry = CachedResponse(body=LARGE_BODY.encode())
+        with patch("api.response_cache.compress", wraps=compress) as spy:
+            first = entry.compressed("gzip")
+            second = entry.compressed("gzip")
+        assert first is second
+        assert spy.call_count == 1
+        assert gzip.decompress(first) == entry.body
+
+    def test_unknown_encoding_raises(self):
+        """Unsupported codings raise ValueError."""
+        with pytest.raises(ValueError):
+            compress(b"data", "zstd")
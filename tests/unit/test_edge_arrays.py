@@ -0,0 +1,47 @@
+"""Unit tests for vectorized edge trace data (src/visualizations/edge_arrays.py)."""
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from src.visualizations.edge_arrays import edge_coordinates, edge_hovertemplate, edge_labels, edge_values
+
+
+@pytest.mark.unit
+class TestEdgeArrays:
+    """Test coordinate gathering, gap placement and hover data."""
+
+    def test_coordinates_with_nan_gaps(self):
+        """Each edge contributes source, target and a NaN gap per dimension."""
+        positions = np.array([[0.0, 1.0, 2.0], [3.0, 4.0, 5.0], [6.0, 7.0, 8.0]])
+        xs, ys, zs = edge_coordinates(positions, np.array([0, 2]), np.array([1, 0]))
+        np.testing.assert_array_equal(xs, [0.0, 3.0, np.nan, 6.0, 0.0, np.nan])
+        np.testing.assert_array_equal(zs, [2.0, 5.0, np.nan, 8.0, 2.0, np.nan])
+        assert ys.flags["C_CONTIGUOUS"]
+
+    def test_two_dimensional_positions(self):
+        """Two-dimensional positions give two coordinate arrays."""
+        coordinates = edge_coordinates(np.array([[0.0, 1.0], [2.0, 3.0]]), [0], [1])
+        assert len(coordinates) == 2
+        np.testing.assert_array_equal(coordinates[1], [1.0, 3.0, np.nan])
+
+    def test_no_edges(self):
+        """An empty edge set gives empty arrays."""
+        xs, ys = edge_coordinates(np.zeros((2, 2)), [], [])
+        assert xs.size == 0 and ys.size == 0
+        assert edge_labels(["A"], [], []).size == 0
+        assert edge_values([]).size == 0
+
+    def test_labels_and_values(self):
+        """Labels and strengths repeat on both line points and are blank at the gap."""
+        labels = edge_labels(["AAPL", "MSFT"], [0], [1], "↔")
+        assert labels.tolist() == ["AAPL ↔ MSFT", "AAPL ↔ MSFT", ""]
+        np.testing.assert_array_equal(edge_values([0.25]), [0.25, 0.25, np.nan])
+
+    def test_hovertemplate_builds_valid_trace(self):
+        """The template references the per-point label and strength and is accepted by Plotly."""
+        template = edge_hovertemplate("same_sector")
+        assert "%{text}" in template and "%{customdata:.2f}" in template and "same_sector" in template
+        xs, ys = edge_coordinates(np.array([[0.0, 0.0], [1.0, 1.0]]), [0], [1])
+        trace = go.Scatter(x=xs, y=ys, text=edge_labels(["A", "B"], [0], [1]), hovertemplate=template)
+        assert trace.hovertemplate == template
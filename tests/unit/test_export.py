@@ -0,0 +1,98 @@
+"""Unit tests for the streaming export helpers (api/export.py)."""
+
+import json
+
+import pytest
+
+from api.export import (
+    assets_table,
+    encode_table,
+    iter_relationship_rows,
+    relationships_table,
+    stream_relationships,
+)
+from src.models.financial_models import AssetClass, Equity
+
+
+@pytest.fixture
+def relationships():
+    """Adjacency mapping with five edges across two relationship types."""
+    return {
+        f"A{i}": [(f"A{i + 1}", "same_sector", 0.5), (f"A{i + 2}", "correlation", 0.25)] for i in range(2)
+    } | {"A2": [("A0", "same_sector", 1)]}
+
+
+@pytest.mark.unit
+class TestRelationshipStreaming:
+    """Test chunked NDJSON and CSV encoding of relationships."""
+
+    def test_rows_follow_adjacency_order(self, relationships):
+        """Rows are yielded lazily in adjacency order with float strengths."""
+        rows = list(iter_relationship_rows(relationships))
+        assert rows[0] == ("A0", "A1", "same_sector", 0.5)
+        assert rows[-1] == ("A2", "A0", "same_sector", 1.0)
+        assert isinstance(rows[-1][3], float)
+
+    def test_ndjson_chunking(self, relationships):
+        """Every chunk holds at most chunk_rows complete lines."""
+        chunks = list(stream_relationships(relationships, "ndjson", chunk_rows=2))
+        assert len(chunks) == 3
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+        rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+        assert len(rows) == 5
+
+    def test_csv_filter_and_header(self, relationships):
+        """The header is written once and filtering is applied before encoding."""
+        text = b"".join(stream_relationships(relationships, "csv", "correlation", chunk_rows=1)).decode()
+        assert text.splitlines() == [
+            "source_id,target_id,relationship_type,strength",
+            "A0,A2,correlation,0.25",
+            "A1,A3,correlation,0.25",
+        ]
+
+    def test_unsupported_format(self, relationships):
+        """Unknown formats raise ValueError."""
+        with pytest.raises(ValueError):
+            stream_relationships(relationships, "xml")
+
+
+@pytest.mark.unit
+class TestColumnarExport:
+    """Test Arrow and Parquet encoding of the asset table and edge list (requires pyarrow)."""
+
+    def test_relationships_arrow_round_trip(self, relationships):
+        """The Arrow IPC stream decodes back to the same edges with a dictionary-encoded type column."""
+        pa = pytest.importorskip("pyarrow")
+        table = relationships_table(relationships)
+        decoded = pa.ipc.open_stream(encode_table(table, "arrow")).read_all()
+        assert decoded.num_rows == 5
+        assert pa.types.is_dictionary(decoded.schema.field("relationship_type").type)
+        assert decoded.column("strength").to_pylist()[-1] == 1.0
+
+    def test_assets_parquet_round_trip(self):
+        """Assets are written in id order and missing market caps become nulls."""
+        pytest.importorskip("pyarrow")
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        assets = {
+            asset_id: Equity(
+                id=asset_id,
+                symbol=asset_id,
+                name=asset_id,
+                asset_class=AssetClass.EQUITY,
+                sector="Technology",
+                price=10.0,
+                market_cap=cap,
+            )
+            for asset_id, cap in [("MSFT", 2e12), ("AAPL", None)]
+        }
+        decoded = pq.read_table(pa.BufferReader(encode_table(assets_table(assets), "parquet")))
+        assert decoded.column("id").to_pylist() == ["AAPL", "MSFT"]
+        assert decoded.column("market_cap").to_pylist() == [None, 2e12]
+
+    def test_unsupported_format(self, relationships):
+        """Unknown columnar formats raise ValueError."""
+        pytest.importorskip("pyarrow")
+        with pytest.raises(ValueError):
+            encode_table(relationships_table(relationships), "feather")
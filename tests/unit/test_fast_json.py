@@ -0,0 +1,39 @@
+"""Unit tests for the fast JSON encoder and response class (api/fast_json.py)."""
+
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from api import fast_json
+from api.fast_json import FastJSONResponse, dumps
+
+
+@pytest.mark.unit
+class TestFastJSON:
+    """Test NumPy-aware JSON encoding with and without orjson."""
+
+    def test_numpy_arrays_and_scalars(self):
+        """Arrays and scalars are encoded without manual conversion."""
+        payload = {"xs": np.array([1.5, 2.0]), "n": np.int64(3), "ok": np.bool_(True)}
+        assert json.loads(dumps(payload)) == {"xs": [1.5, 2.0], "n": 3, "ok": True}
+
+    def test_stdlib_fallback_matches(self):
+        """The standard library fallback produces equivalent documents."""
+        payload = {"xs": np.arange(3, dtype=np.float32), "name": "Zürich"}
+        with patch.object(fast_json, "orjson", None):
+            fallback = dumps(payload)
+        assert json.loads(fallback) == json.loads(dumps(payload))
+
+    def test_fallback_rejects_unknown_types(self):
+        """Objects with no JSON representation still raise TypeError."""
+        with patch.object(fast_json, "orjson", None):
+            with pytest.raises(TypeError):
+                dumps({"obj": object()})
+
+    def test_response_renders_bytes(self):
+        """The response class renders compact JSON with the JSON media type."""
+        response = FastJSONResponse({"values": np.array([1, 2])})
+        assert response.body == b'{"values":[1,2]}'
+        assert response.media_type == "application/json"
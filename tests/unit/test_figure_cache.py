@@ -0,0 +1,102 @@
+"""Unit tests for the shared figure cache (src/visualizations/figure_cache.py)."""
+
+from types import SimpleNamespace
+
+import plotly.graph_objects as go
+import pytest
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.visualizations.figure_cache import FigureCache
+
+
+def _graph():
+    graph = AssetRelationshipGraph()
+    graph.relationships = {"A": [("B", "correlation", 0.5)]}
+    return graph
+
+
+def _counting_builder(calls):
+    def build():
+        calls.append(1)
+        return go.Figure(go.Scatter(x=[1, 2], y=[3, 4]), layout={"title": {"text": "metrics"}})
+
+    return build
+
+
+@pytest.mark.unit
+class TestFigureCache:
+    """Test reuse, isolation, invalidation and the LRU bound."""
+
+    def test_figure_built_once_per_version(self):
+        """Repeated requests for the same graph version reuse the cached JSON."""
+        cache, graph, calls = FigureCache(), _graph(), []
+        first = cache.figure(graph, ("3d",), _counting_builder(calls))
+        second = cache.figure(graph, ("3d",), _counting_builder(calls))
+        assert len(calls) == 1
+        assert first.to_plotly_json() == second.to_plotly_json()
+        assert first.layout.title.text == "metrics"
+
+    def test_callers_get_independent_figures(self):
+        """Mutating a returned figure does not affect later callers."""
+        cache, graph = FigureCache(), _graph()
+        first = cache.figure(graph, ("3d",), _counting_builder([]))
+        first.update_layout(title_text="changed")
+        first.data[0].x = [9, 9]
+        second = cache.figure(graph, ("3d",), _counting_builder([]))
+        assert second.layout.title.text == "metrics"
+        assert list(second.data[0].x) == [1, 2]
+
+    def test_new_graph_version_rebuilds(self):
+        """Changing the relationships produces a new version and a fresh render."""
+        cache, graph, calls = FigureCache(), _graph(), []
+        cache.figure(graph, ("3d",), _counting_builder(calls))
+        graph.relationships = {"A": [("C", "correlation", 0.5)]}
+        cache.figure(graph, ("3d",), _counting_builder(calls))
+        assert len(calls) == 2
+
+    def test_events_and_invalidation_rebuild(self):
+        """New regulatory events and in-place edits followed by invalidate_caches() produce fresh outputs."""
+        cache, graph = FigureCache(), _graph()
+        graph.assets = {"A": SimpleNamespace(price=1.0), "B": SimpleNamespace(price=2.0)}
+        graph.regulatory_events = []
+
+        def report():
+            return f"{len(graph.regulatory_events)} events, price {graph.assets['A'].price}"
+
+        assert cache.text(graph, ("metrics_text",), report) == "0 events, price 1.0"
+        graph.add_regulatory_event(SimpleNamespace(asset_id="A"))
+        assert cache.text(graph, ("metrics_text",), report) == "1 events, price 1.0"
+        graph.assets["A"].price = 3.0
+        graph.invalidate_caches()
+        assert cache.text(graph, ("metrics_text",), report) == "1 events, price 3.0"
+
+    def test_other_graph_misses(self):
+        """Another graph at the same version never receives this graph's entries."""
+        cache, first, second = FigureCache(), _graph(), _graph()
+        assert first.version == second.version
+        cache.text(first, ("report",), lambda: "first")
+        assert cache.text(second, ("report",), lambda: "second") == "second"
+
+    def test_figure_groups_and_text(self):
+        """Figures built together are cached together, and text outputs are cached alongside."""
+        cache, graph, calls = FigureCache(), _graph(), []
+        builder = _counting_builder(calls)
+        figures = cache.figures(graph, ("metrics",), lambda: (builder(), builder(), builder()))
+        assert len(figures) == 3 and len(calls) == 3
+        cache.figures(graph, ("metrics",), lambda: (builder(), builder(), builder()))
+        assert len(calls) == 3
+        assert cache.text(graph, ("report",), lambda: "report") == "report"
+        assert cache.text(graph, ("report",), lambda: "rebuilt") == "report"
+
+    def test_lru_bound(self):
+        """The least recently used entry is evicted beyond max_entries."""
+        cache, graph = FigureCache(max_entries=2), _graph()
+        cache.text(graph, ("a",), lambda: "a")
+        cache.text(graph, ("b",), lambda: "b")
+        cache.text(graph, ("a",), lambda: "stale")
+        cache.text(graph, ("c",), lambda: "c")
+        assert len(cache) == 2
+        assert cache.text(graph, ("a",), lambda: "rebuilt") == "a"
+        assert cache.text(graph, ("b",), lambda: "rebuilt") == "rebuilt"
+        cache.clear()
+        assert len(cache) == 0
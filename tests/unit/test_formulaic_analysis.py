@@ -9,9 +9,12 @@ This module contains comprehensive unit tests for the formulaic_analysis module
 - Edge cases and error handling
 """
 
+from unittest.mock import Mock
+
+import numpy as np
 import pytest
 
-from src.analysis.formulaic_analysis import Formula, FormulaicdAnalyzer
+from src.analysis.formulaic_analysis import CorrelationPairs, Formula, FormulaicdAnalyzer
 from src.models.financial_models import AssetClass, Bond, Commodity, Currency, Equity
 
 
@@ -380,6 +383,27 @@ class TestFormulaicdAnalyzer:
         assert "TEST_AAPL-TEST_AAPL" in correlation_matrix
         assert correlation_matrix["TEST_AAPL-TEST_AAPL"] == 1.0
 
+    def test_calculate_correlation_array_matches_pairs(self, analyzer):
+        """The dense matrix is symmetric by asset class and agrees with the pair mapping."""
+        assets_data = {
+            "EQ1": {"price": 1.0, "asset_class": "Equity"},
+            "BD1": {"price": 1.0, "asset_class": "Fixed Income"},
+            "EQ2": {"price": 1.0, "asset_class": "Equity"},
+        }
+
+        asset_ids, correlations = analyzer._calculate_correlation_array(assets_data)
+
+        assert asset_ids == ["EQ1", "BD1", "EQ2"]
+        np.testing.assert_array_equal(correlations, [[1.0, 0.3, 0.7], [0.3, 1.0, 0.3], [0.7, 0.3, 1.0]])
+        assert analyzer._calculate_correlation_matrix(assets_data) == {
+            "EQ1-EQ1": 1.0,
+            "EQ1-BD1": 0.3,
+            "EQ1-EQ2": 0.7,
+            "BD1-BD1": 1.0,
+            "BD1-EQ2": 0.3,
+            "EQ2-EQ2": 1.0,
+        }
+
     def test_find_strongest_correlations(self, analyzer):
         """Test finding strongest correlations."""
         correlation_matrix = {
@@ -403,6 +427,54 @@ class TestFormulaicdAnalyzer:
         correlations = [c["correlation"] for c in strongest]
         assert correlations == sorted(correlations, reverse=True)
 
+    def test_correlation_pairs_view(self, analyzer):
+        """The lazy pair view equals the pair dictionary and resolves ids containing hyphens."""
+        asset_ids = ["EQ-1", "BD1", "EQ2"]
+        correlations = np.array([[1.0, 0.3, 0.7], [0.3, 1.0, 0.3], [0.7, 0.3, 1.0]])
+        pairs = CorrelationPairs(asset_ids, correlations)
+
+        assert pairs == analyzer._correlation_pairs(asset_ids, correlations)
+        assert len(pairs) == 6
+        assert pairs["EQ-1-EQ2"] == 0.7
+        assert "EQ2-EQ-1" not in pairs
+        with pytest.raises(KeyError):
+            pairs["EQ-1-XX"]
+
+    def test_strongest_correlations_from_array_match_pairs(self, analyzer):
+        """The array path returns what the pair dictionary path returns, ties and perfect correlations included."""
+        rng = np.random.default_rng(0)
+        asset_ids = [f"A{i}" for i in range(40)]
+        correlations = np.round(rng.uniform(-1.0, 1.0, (40, 40)), 1)
+        correlations = np.triu(correlations) + np.triu(correlations, 1).T
+        correlations[3, 9] = correlations[9, 3] = 1.0
+        np.fill_diagonal(correlations, 1.0)
+
+        expected = analyzer._find_strongest_correlations(analyzer._correlation_pairs(asset_ids, correlations), {})
+        assert analyzer._find_strongest_correlations(CorrelationPairs(asset_ids, correlations), {}) == expected
+        assert len(expected) == 5 and expected[0]["correlation"] == 0.9
+
+    def test_empirical_relationships_skip_pair_dictionary(self, analyzer, monkeypatch):
+        """The analysis pipeline never formats the full pair dictionary."""
+        graph = Mock()
+        graph.assets = {
+            f"EQ{i}": Equity(
+                id=f"EQ{i}",
+                symbol=f"EQ{i}",
+                name=f"Equity {i}",
+                asset_class=AssetClass.EQUITY if i % 2 else AssetClass.FIXED_INCOME,
+                sector="Technology",
+                price=10.0 + i,
+            )
+            for i in range(6)
+        }
+        monkeypatch.setattr(analyzer, "_correlation_pairs", Mock(side_effect=AssertionError("pairs built")))
+
+        relationships = analyzer._calculate_empirical_relationships(graph)
+        summary = analyzer._generate_formula_summary([], relationships)
+
+        assert [c["correlation"] for c in relationships["strongest_correlations"]] == [0.7] * 5
+        assert summary["empirical_data_points"] == 21
+
     def test_calculate_sector_relationships(self, analyzer, populated_graph):
         """Test calculation of sector-based relationships."""
         # Execute
@@ -11,6 +11,7 @@ This module contains comprehensive unit tests for the formulaic_visuals module i
 import pytest
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import plotly.graph_objects as go
 
 from src.visualizations.formulaic_visuals import FormulaicVisualizer
@@ -380,6 +381,52 @@ class TestFormulaicVisualizer:
             heatmap = heatmap_traces[0]
             assert len(heatmap.z) <= 8, "Should limit heatmap to 8x8"
 
+    def test_formula_dashboard_uses_dense_correlation_array(self, visualizer):
+        """A dense correlation array is clipped to the most strongly correlated assets."""
+        asset_ids = [f"ASSET_{i}" for i in range(12)]
+        correlations = np.full((12, 12), 0.1)
+        correlations[:, [3, 7]] = correlations[[3, 7], :] = 0.9
+        np.fill_diagonal(correlations, 1.0)
+        results = {
+            "empirical_relationships": {"correlation_asset_ids": asset_ids, "correlation_array": correlations},
+        }
+
+        with patch("src.visualizations.formulaic_visuals.HEATMAP_MAX_ASSETS", 2):
+            fig = visualizer.create_formula_dashboard(results)
+
+        heatmap = next(trace for trace in fig.data if trace.type == "heatmap")
+        assert list(heatmap.x) == ["ASSET_3", "ASSET_7"]
+        np.testing.assert_array_equal(heatmap.z, [[1.0, 0.9], [0.9, 1.0]])
+        assert heatmap.texttemplate == "%{z:.2f}"
+
+    def test_formula_dashboard_skips_cell_text_for_large_heatmaps(self, visualizer):
+        """Cell values are not printed above the cell threshold."""
+        results = {
+            "empirical_relationships": {
+                "correlation_asset_ids": [f"A{i}" for i in range(30)],
+                "correlation_array": np.eye(30),
+            },
+        }
+
+        with patch("src.visualizations.formulaic_visuals.HEATMAP_MAX_ASSETS", 30):
+            fig = visualizer.create_formula_dashboard(results)
+
+        heatmap = next(trace for trace in fig.data if trace.type == "heatmap")
+        assert len(heatmap.z) == 30
+        assert heatmap.texttemplate is None
+
+    def test_formula_dashboard_pair_mapping_lookup(self, visualizer):
+        """Pairs are read in either order and missing pairs default to 0.5."""
+        results = {
+            "empirical_relationships": {"correlation_matrix": {"A-B": 0.7, "C-A": 0.2, "A-A": 1.0}},
+        }
+
+        fig = visualizer.create_formula_dashboard(results)
+
+        heatmap = next(trace for trace in fig.data if trace.type == "heatmap")
+        assert list(heatmap.x) == ["A", "B", "C"]
+        np.testing.assert_array_equal(heatmap.z, [[1.0, 0.7, 0.2], [0.7, 1.0, 0.5], [0.2, 0.5, 1.0]])
+
     def test_formula_detail_view_with_special_characters(self, visualizer):
         """Test detail view with formulas containing special characters."""
         special_formula = Formula(
@@ -8,10 +8,14 @@ This module contains comprehensive unit tests for the graph_2d_visuals module in
 - Edge cases and error handling
 """
 
+from types import SimpleNamespace
+
 import pytest
 
 import plotly.graph_objects as go
 
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.models.financial_models import AssetClass
 from src.visualizations.graph_2d_visuals import (
     visualize_2d_graph,
     _create_circular_layout,
@@ -423,4 +427,71 @@ class TestEdgeCases:
         )
 
         # Assert
-        assert isinstance(traces, list)
\ No newline at end of file
+        assert isinstance(traces, list)
+
+@pytest.mark.unit
+class TestCentralityNodeSizes:
+    """Test sizing 2D nodes by centrality."""
+
+    @pytest.fixture
+    def star_graph(self):
+        """Graph with hub H connected to three leaves."""
+        graph = AssetRelationshipGraph()
+        graph.assets = {
+            asset_id: SimpleNamespace(asset_class=AssetClass.EQUITY) for asset_id in ("H", "A", "B", "C")
+        }
+        graph.relationships = {"H": [(leaf, "same_sector", 0.8) for leaf in "ABC"]}
+        for leaf in "ABC":
+            graph.relationships[leaf] = [("H", "same_sector", 0.8)]
+        return graph
+
+    def test_node_size_by_betweenness(self, star_graph):
+        """The hub gets the largest marker and leaves the smallest."""
+        fig = visualize_2d_graph(star_graph, layout_type="circular", node_size_by="betweenness")
+        node_trace = next(trace for trace in fig.data if trace.name == "Assets")
+        sizes = dict(zip(node_trace.text, node_trace.marker.size))
+        assert sizes["H"] == pytest.approx(50)
+        assert sizes["A"] == pytest.approx(20)
+
+    def test_unknown_measure_is_rejected(self, star_graph):
+        """Only known centrality measures can size nodes."""
+        with pytest.raises(ValueError):
+            visualize_2d_graph(star_graph, node_size_by="closeness")
+
+
+@pytest.mark.unit
+class TestWebGLRendering:
+    """Test the automatic WebGL path for large 2D graphs."""
+
+    @staticmethod
+    def _ring_graph(size):
+        """Ring of `size` equities whose edge strengths cycle through weak, medium and strong."""
+        graph = AssetRelationshipGraph()
+        ids = [f"N{i}" for i in range(size)]
+        graph.assets = {asset_id: SimpleNamespace(asset_class=AssetClass.EQUITY) for asset_id in ids}
+        graph.relationships = {
+            ids[i]: [(ids[(i + 1) % size], "correlation", (0.1, 0.5, 0.9)[i % 3])] for i in range(size)
+        }
+        return graph
+
+    def test_small_graph_uses_svg(self):
+        """Graphs under the thresholds keep SVG traces with labelled nodes."""
+        fig = visualize_2d_graph(self._ring_graph(6), layout_type="circular")
+        assert all(isinstance(trace, go.Scatter) for trace in fig.data)
+        assert fig.data[-1].mode == "markers+text"
+
+    def test_large_graph_switches_to_webgl(self, monkeypatch):
+        """Graphs over the edge threshold use Scattergl, batched by strength into one legend entry."""
+        monkeypatch.setattr("src.visualizations.graph_2d_visuals.WEBGL_EDGE_THRESHOLD", 10)
+        fig = visualize_2d_graph(self._ring_graph(30), layout_type="circular")
+        assert all(isinstance(trace, go.Scattergl) for trace in fig.data)
+        edges = [trace for trace in fig.data if trace.legendgroup == "correlation"]
+        assert sorted(trace.line.width for trace in edges) == [1, 2, 3]
+        assert sum(bool(trace.showlegend) for trace in edges) == 1
+        assert sum(len(trace.x) for trace in edges) == 3 * 30
+        assert fig.data[-1].mode == "markers"
+
+    def test_explicit_override(self):
+        """An explicit use_webgl wins over the automatic choice."""
+        fig = visualize_2d_graph(self._ring_graph(6), layout_type="grid", use_webgl=True)
+        assert all(isinstance(trace, go.Scattergl) for trace in fig.data)
@@ -0,0 +1,181 @@
+"""Unit tests for the compact CSR adjacency (src/logic/graph_adjacency.py)."""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_adjacency import CompactAdjacency, gather_ranges
+
+
+@pytest.fixture
+def relationships():
+    """A -> B -> C -> D chain plus a weak A -> D shortcut and an incoming E -> A edge."""
+    return {
+        "A": [("B", "same_sector", 0.9), ("D", "corporate_link", 0.1)],
+        "B": [("C", "same_sector", 0.8)],
+        "C": [("D", "corporate_link", 0.7)],
+        "E": [("A", "same_sector", 0.6)],
+    }
+
+
+@pytest.fixture
+def adjacency(relationships):
+    """Compact adjacency over the fixture edges plus an isolated node."""
+    return CompactAdjacency.build(relationships, extra_nodes=["Z"])
+
+
+@pytest.mark.unit
+class TestCompactAdjacencyBuild:
+    """Test the CSR layout."""
+
+    def test_gather_ranges(self):
+        """Ranges of the requested rows are concatenated in order."""
+        indptr = np.array([0, 2, 2, 5])
+        assert gather_ranges(indptr, np.array([2, 0])).tolist() == [2, 3, 4, 0, 1]
+        assert gather_ranges(indptr, np.array([1])).size == 0
+
+    def test_layout(self, adjacency):
+        """Nodes are sorted, edges are grouped by source and both indexes agree."""
+        assert adjacency.node_ids == ["A", "B", "C", "D", "E", "Z"]
+        assert adjacency.edge_count == 5
+        assert np.all(np.diff(adjacency.source) >= 0)
+        a = adjacency.node_index["A"]
+        outgoing = adjacency.target[adjacency.out_indptr[a] : adjacency.out_indptr[a + 1]]
+        assert sorted(adjacency.node_ids[i] for i in outgoing) == ["B", "D"]
+        incoming = adjacency.in_order[adjacency.in_indptr[a] : adjacency.in_indptr[a + 1]]
+        assert [adjacency.node_ids[adjacency.source[e]] for e in incoming] == ["E"]
+
+    def test_empty(self):
+        """An empty mapping yields an empty adjacency."""
+        empty = CompactAdjacency.build({})
+        assert empty.node_count == 0
+        assert empty.edge_count == 0
+
+
+@pytest.mark.unit
+class TestNeighborhood:
+    """Test k-hop neighborhood queries."""
+
+    def test_hop_distances(self, adjacency):
+        """Nodes carry their shortest hop distance and are ordered by it."""
+        result = adjacency.neighborhood("A", hops=2)
+        assert result.nodes == ["A", "B", "D", "E", "C"]
+        assert result.hops == [0, 1, 1, 1, 2]
+
+    def test_zero_hops(self, adjacency):
+        """Zero hops returns only the center."""
+        result = adjacency.neighborhood("A", hops=0)
+        assert result.nodes == ["A"]
+        assert result.edges == []
+
+    def test_direction(self, adjacency):
+        """Outgoing and incoming traversal follow edge direction."""
+        assert adjacency.neighborhood("A", hops=1, direction="out").nodes == ["A", "B", "D"]
+        assert adjacency.neighborhood("A", hops=1, direction="in").nodes == ["A", "E"]
+
+    def test_filters(self, adjacency):
+        """Type and strength filters restrict both traversal and returned edges."""
+        by_type = adjacency.neighborhood("A", hops=3, rel_types=["same_sector"], direction="out")
+        assert by_type.nodes == ["A", "B", "C"]
+        assert all(edge[2] == "same_sector" for edge in by_type.edges)
+
+        strong = adjacency.neighborhood("A", hops=1, min_strength=0.5, direction="out")
+        assert strong.nodes == ["A", "B"]
+        assert strong.edges == [("A", "B", "same_sector", 0.9)]
+
+    def test_induced_edges(self, adjacency):
+        """Edges between reached nodes are returned even if not on a BFS tree path."""
+        result = adjacency.neighborhood("B", hops=1)
+        assert set(result.nodes) == {"A", "B", "C"}
+        assert {(s, t) for s, t, _, _ in result.edges} == {("A", "B"), ("B", "C")}
+
+    def test_isolated_node(self, adjacency):
+        """Nodes without edges are valid centers."""
+        assert adjacency.neighborhood("Z", hops=3).nodes == ["Z"]
+
+    def test_errors(self, adjacency):
+        """Unknown ids, bad directions and negative hops are rejected."""
+        with pytest.raises(KeyError):
+            adjacency.neighborhood("missing")
+        with pytest.raises(ValueError):
+            adjacency.neighborhood("A", direction="sideways")
+        with pytest.raises(ValueError):
+            adjacency.neighborhood("A", hops=-1)
+
+
+@pytest.mark.unit
+class TestGraphAdjacencyCache:
+    """Test the adjacency cache on AssetRelationshipGraph."""
+
+    def test_cached_until_changed(self, relationships):
+        """The adjacency is reused until relationships change."""
+        graph = AssetRelationshipGraph()
+        graph.relationships = relationships
+        first = graph.compact_adjacency()
+        assert graph.compact_adjacency() is first
+
+        graph.add_relationship("F", "A", "same_sector", 0.5)
+        rebuilt = graph.compact_adjacency()
+        assert rebuilt is not first
+        assert "F" in rebuilt.node_index
+
+    def test_invalidate_caches(self, relationships):
+        """In-place edits that keep the source count are picked up after invalidation."""
+        graph = AssetRelationshipGraph()
+        graph.relationships = relationships
+        graph.compact_adjacency()
+        graph.relationships["B"].append(("E", "same_sector", 0.4))
+        graph.invalidate_caches()
+        assert graph.compact_adjacency().edge_count == 6
+
+    def test_version_keys_derived_structures(self, relationships):
+        """Validation and centrality follow the version, which covers events and invalidation."""
+        graph = AssetRelationshipGraph()
+        graph.relationships = relationships
+        graph.mark_validated()
+        scores = graph.centrality()
+        version = graph.version
+        assert graph.is_validated and graph.version == version
+
+        graph.add_regulatory_event(Mock())
+        assert graph.version > version
+        assert not graph.is_validated
+
+        graph.mark_validated()
+        graph.relationships["B"].append(("E", "same_sector", 0.4))
+        graph.invalidate_caches()
+        assert not graph.is_validated
+        assert graph.centrality() is not scores
+
+    def test_edge_added_to_existing_source(self, relationships):
+        """Adding an edge to a source that already has edges, or changing a strength, is seen at once."""
+        graph = AssetRelationshipGraph()
+        graph.relationships = relationships
+        assert graph.neighborhood("B", hops=1, direction="out").nodes == ["B", "C"]
+
+        graph.add_relationship("B", "E", "same_sector", 0.4)
+        assert graph.neighborhood("B", hops=1, direction="out").nodes == ["B", "C", "E"]
+
+        graph.add_relationship("B", "E", "same_sector", 0.9)
+        assert graph.relationships["B"] == [("C", "same_sector", 0.8), ("E", "same_sector", 0.9)]
+        assert graph.neighborhood("B", hops=1, min_strength=0.85, direction="out").nodes == ["B", "E"]
+
+    def test_mutation_methods(self):
+        """Assets, events and bidirectional relationships are added through the graph."""
+        graph = AssetRelationshipGraph()
+        asset = Mock(id="A")
+        graph.add_asset(asset)
+        graph.add_regulatory_event("event")
+        graph.add_relationship("A", "B", "correlation", 0.5, bidirectional=True)
+        assert graph.assets == {"A": asset}
+        assert graph.regulatory_events == ["event"]
+        assert graph.relationships == {"A": [("B", "correlation", 0.5)], "B": [("A", "correlation", 0.5)]}
+        assert graph.version == 4
+
+    def test_neighborhood_delegates(self, relationships):
+        """The graph method returns the adjacency's result."""
+        graph = AssetRelationshipGraph()
+        graph.relationships = relationships
+        assert graph.neighborhood("C", hops=1, direction="in").nodes == ["C", "B"]
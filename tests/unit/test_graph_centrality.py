@@ -0,0 +1,125 @@
+"""Unit tests for vectorized centrality measures (src/logic/graph_centrality.py)."""
+
+import numpy as np
+import pytest
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_adjacency import CompactAdjacency
+from src.logic.graph_centrality import (
+    betweenness_centrality,
+    compute_centrality,
+    eigenvector_centrality,
+    pagerank,
+    scale_node_sizes,
+)
+
+
+def _dense_pagerank(adjacency, damping=0.85, iterations=500):
+    """Reference PageRank from the dense transition matrix."""
+    n = adjacency.node_count
+    weights = np.zeros((n, n))
+    np.add.at(weights, (adjacency.source, adjacency.target), adjacency.strength)
+    out = weights.sum(axis=1)
+    transition = np.where(out[:, None] > 0, weights / np.where(out > 0, out, 1.0)[:, None], 1.0 / n)
+    rank = np.full(n, 1.0 / n)
+    for _ in range(iterations):
+        rank = (1 - damping) / n + damping * transition.T @ rank
+    return rank
+
+
+@pytest.fixture
+def star():
+    """Hub H linked to four leaves in both directions, plus a leaf-to-leaf edge."""
+    relationships = {"H": [(leaf, "same_sector", 0.8) for leaf in "ABCD"]}
+    for leaf in "ABCD":
+        relationships[leaf] = [("H", "same_sector", 0.8)]
+    relationships["A"].append(("B", "correlation", 0.3))
+    return CompactAdjacency.build(relationships)
+
+
+@pytest.fixture
+def random_graph():
+    """Random directed graph with 40 nodes and 120 weighted edges."""
+    rng = np.random.default_rng(7)
+    relationships = {}
+    for _ in range(120):
+        a, b = rng.integers(0, 40, 2)
+        relationships.setdefault(f"N{a:02d}", []).append((f"N{b:02d}", "x", float(rng.uniform(0.1, 1.0))))
+    return CompactAdjacency.build(relationships, extra_nodes=[f"N{i:02d}" for i in range(40)])
+
+
+@pytest.mark.unit
+class TestCentralityMeasures:
+    """Test each measure against known values or dense references."""
+
+    def test_pagerank_matches_dense_reference(self, random_graph):
+        """Sparse PageRank agrees with the dense power iteration, including dangling nodes."""
+        scores = pagerank(random_graph)
+        assert scores.sum() == pytest.approx(1.0)
+        np.testing.assert_allclose(scores, _dense_pagerank(random_graph), atol=1e-8)
+
+    def test_eigenvector_matches_dense_reference(self, star):
+        """Eigenvector centrality is the leading eigenvector of the symmetric strength matrix."""
+        n = star.node_count
+        weights = np.zeros((n, n))
+        np.add.at(weights, (star.source, star.target), star.strength)
+        symmetric = weights + weights.T
+        _, vectors = np.linalg.eigh(symmetric)
+        np.testing.assert_allclose(eigenvector_centrality(star), np.abs(vectors[:, -1]), atol=1e-8)
+
+    def test_hub_is_most_central(self, star):
+        """The hub leads every measure."""
+        scores = compute_centrality(star, betweenness_samples=None)
+        for name in ("pagerank", "eigenvector", "betweenness"):
+            assert scores.top(name, 1)[0][0] == "H"
+
+    def test_exact_betweenness_on_path(self):
+        """Interior nodes of a path A-B-C-D each lie on two of the three pairs they can separate."""
+        path = CompactAdjacency.build({"A": [("B", "x", 1.0)], "B": [("C", "x", 1.0)], "C": [("D", "x", 1.0)]})
+        scores, used = betweenness_centrality(path, samples=None)
+        assert used == 4
+        np.testing.assert_allclose(scores, [0.0, 2 / 3, 2 / 3, 0.0])
+
+    def test_sampled_betweenness_is_scaled_estimate(self, random_graph):
+        """Sampling uses the requested number of sources and stays on the exact scale."""
+        exact, _ = betweenness_centrality(random_graph, samples=None)
+        estimate, used = betweenness_centrality(random_graph, samples=20, seed=3)
+        assert used == 20
+        assert estimate.sum() == pytest.approx(exact.sum(), rel=0.5)
+
+    def test_empty_and_edgeless_graphs(self):
+        """Degenerate graphs produce zero or uniform scores without errors."""
+        empty = compute_centrality(CompactAdjacency.build({}))
+        assert empty.pagerank.size == 0
+        isolated = compute_centrality(CompactAdjacency.build({}, extra_nodes=["A", "B", "C"]))
+        np.testing.assert_allclose(isolated.pagerank, 1 / 3)
+        assert not isolated.eigenvector.any()
+        assert not isolated.betweenness.any()
+
+
+@pytest.mark.unit
+class TestCentralityScores:
+    """Test the score container and node sizing."""
+
+    def test_as_dict_and_unknown_measure(self, star):
+        """Scores serialize per node; unknown measure names are rejected."""
+        scores = compute_centrality(star)
+        assert set(scores.as_dict()["pagerank"]) == {"A", "B", "C", "D", "H"}
+        with pytest.raises(ValueError):
+            scores.measure("closeness")
+
+    def test_node_sizes(self, star):
+        """Sizes span the requested range and unknown ids get the smallest size."""
+        sizes = compute_centrality(star).node_sizes(["H", "C", "missing"], "pagerank", min_size=10, max_size=20)
+        assert sizes[0] == pytest.approx(20)
+        assert sizes[2] == pytest.approx(10)
+        np.testing.assert_allclose(scale_node_sizes(np.array([2.0, 2.0]), 10, 20), [15, 15])
+
+    def test_graph_caches_scores(self):
+        """Scores are reused until the adjacency is rebuilt."""
+        graph = AssetRelationshipGraph()
+        graph.relationships = {"A": [("B", "x", 0.5)]}
+        first = graph.centrality()
+        assert graph.centrality() is first
+        graph.relationships = {"A": [("B", "x", 0.5)], "B": [("C", "x", 0.5)]}
+        assert graph.centrality() is not first
@@ -0,0 +1,143 @@
+"""Unit tests for Louvain-style community detection (src/logic/graph_communities.py)."""
+
+import numpy as np
+import pytest
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_adjacency import CompactAdjacency
+from src.logic.graph_communities import CommunityAssignment, _align, detect_communities, modularity
+
+
+def _cliques(count=3, size=5, bridge=0.05):
+    """`count` cliques of `size` strongly linked nodes, joined in a ring by one weak edge each."""
+    relationships = {}
+    for c in range(count):
+        members = [f"C{c}N{i}" for i in range(size)]
+        for i, a in enumerate(members):
+            relationships[a] = [(b, "same_sector", 0.9) for b in members[i + 1 :]]
+        relationships[members[0]].append((f"C{(c + 1) % count}N0", "correlation", bridge))
+    return relationships
+
+
+@pytest.mark.unit
+class TestModularity:
+    """Test the modularity function against hand-computed values."""
+
+    def test_two_disjoint_edges(self):
+        """Two disjoint edges, each its own community, give modularity 0.5."""
+        first = np.array([0, 1, 2, 3])
+        second = np.array([1, 0, 3, 2])
+        weight = np.ones(4)
+        assert modularity(first, second, weight, np.array([0, 0, 1, 1])) == pytest.approx(0.5)
+        assert modularity(first, second, weight, np.array([0, 0, 0, 0])) == pytest.approx(0.0)
+
+    def test_empty_weight(self):
+        """A graph without weight has modularity 0."""
+        empty = np.empty(0, dtype=np.int64)
+        assert modularity(empty, empty, np.empty(0), np.zeros(3, dtype=np.int64)) == 0.0
+
+
+@pytest.mark.unit
+class TestDetectCommunities:
+    """Test partition quality, seeding and id alignment."""
+
+    def test_recovers_cliques(self):
+        """Weakly bridged cliques end up as one community each."""
+        adjacency = CompactAdjacency.build(_cliques())
+        result = detect_communities(adjacency)
+        clusters = result.as_dict()
+        assert result.community_count == 3
+        for c in range(3):
+            assert len({clusters[f"C{c}N{i}"] for i in range(5)}) == 1
+        first, second, weight = adjacency.undirected
+        assert result.modularity == pytest.approx(modularity(first, second, weight, result.labels))
+        assert result.modularity > 0.6
+
+    def test_ids_ordered_by_size(self):
+        """Without a seed, community 0 is the largest."""
+        relationships = _cliques(count=2)
+        relationships["C1N0"].extend(("X%d" % i, "same_sector", 0.9) for i in range(3))
+        result = detect_communities(CompactAdjacency.build(relationships))
+        assert result.as_dict()["C1N0"] == 0
+
+    def test_empty_graph(self):
+        """A graph without nodes gives an empty assignment."""
+        result = detect_communities(CompactAdjacency.build({}))
+        assert result.labels.size == 0
+        assert result.community_count == 0
+
+    def test_isolated_nodes_stay_alone(self):
+        """Nodes without edges form singleton communities."""
+        result = detect_communities(CompactAdjacency.build({"A": [("B", "x", 1.0)]}, extra_nodes=["C", "D"]))
+        clusters = result.as_dict()
+        assert clusters["A"] == clusters["B"]
+        assert len({clusters["A"], clusters["C"], clusters["D"]}) == 3
+
+    def test_seeded_run_keeps_ids(self):
+        """Seeding with permuted previous ids returns the same ids for the same communities."""
+        adjacency = CompactAdjacency.build(_cliques())
+        previous = detect_communities(adjacency).labels
+        renamed = np.array([7, 3, 5])[previous]
+        result = detect_communities(adjacency, initial_labels=renamed)
+        np.testing.assert_array_equal(result.labels, renamed)
+
+    def test_seeded_run_places_new_nodes(self):
+        """New nodes (-1 in the seed) join the clique they attach to without disturbing the other ids."""
+        relationships = _cliques()
+        before = detect_communities(CompactAdjacency.build(relationships))
+        relationships["C2N1"].append(("NEW", "same_sector", 0.9))
+        relationships["C2N2"].append(("NEW", "same_sector", 0.9))
+        adjacency = CompactAdjacency.build(relationships)
+        result = detect_communities(adjacency, initial_labels=before.labels_for(adjacency.node_ids))
+        clusters = result.as_dict()
+        assert clusters["NEW"] == clusters["C2N1"]
+        for node_id, label in before.as_dict().items():
+            assert clusters[node_id] == label
+
+    def test_rejects_bad_seed_shape(self):
+        """A seed without one entry per node is rejected."""
+        adjacency = CompactAdjacency.build(_cliques())
+        with pytest.raises(ValueError, match="initial_labels"):
+            detect_communities(adjacency, initial_labels=np.zeros(3))
+
+    def test_align_assigns_fresh_ids(self):
+        """A community that takes no previous id gets one above every previous id."""
+        labels = np.array([0, 0, 1, 1, 2])
+        previous = np.array([4, 4, 4, 4, -1])
+        aligned = _align(labels, previous)
+        assert aligned[0] == 4 and aligned[1] == 4
+        assert set(aligned[2:].tolist()) == {5, 6}
+
+
+@pytest.mark.unit
+class TestGraphCommunities:
+    """Test caching and seeding on AssetRelationshipGraph."""
+
+    def test_cached_per_adjacency(self):
+        """Communities are computed once until the relationships change."""
+        graph = AssetRelationshipGraph()
+        graph.relationships = _cliques()
+        first = graph.communities()
+        assert graph.communities() is first
+        graph.relationships["C0N1"].append(("C1N1", "x", 0.01))
+        graph.invalidate_caches()
+        second = graph.communities()
+        assert second is not first
+        np.testing.assert_array_equal(second.labels, first.labels)
+
+    def test_labels_for_unknown_ids(self):
+        """Ids missing from the assignment map to -1."""
+        assignment = CommunityAssignment(["A", "B"], np.array([2, 0]), 0.0, 1)
+        assert assignment.labels_for(["B", "Z", "A"]).tolist() == [0, -1, 2]
+
+    def test_seed_communities(self):
+        """A replacement graph starts from the published graph's communities and keeps their ids."""
+        old = AssetRelationshipGraph()
+        old.relationships = _cliques()
+        old._communities = CommunityAssignment(
+            old.communities().node_ids, np.array([9, 8, 7])[old.communities().labels], 0.0, 1
+        )
+        new = AssetRelationshipGraph()
+        new.relationships = _cliques()
+        new.seed_communities(old)
+        assert new.communities().as_dict() == old._communities.as_dict()
@@ -0,0 +1,145 @@
+"""Unit tests for the API lookup indexes and cursor helpers (api/graph_index.py)."""
+
+import pytest
+
+from api.graph_index import (
+    ASSET_CURSOR_TYPES,
+    RELATIONSHIP_CURSOR_TYPES,
+    AssetIndex,
+    RelationshipIndex,
+    decode_cursor,
+    encode_cursor,
+)
+from src.models.financial_models import AssetClass, Bond, Equity
+
+
+@pytest.fixture
+def assets():
+    """Small asset table spanning two classes and three sectors."""
+    return {
+        "MSFT": Equity(
+            id="MSFT", symbol="MSFT", name="Microsoft", asset_class=AssetClass.EQUITY, sector="Technology", price=320.0
+        ),
+        "AAPL": Equity(
+            id="AAPL", symbol="AAPL", name="Apple", asset_class=AssetClass.EQUITY, sector="Technology", price=150.0
+        ),
+        "XOM": Equity(id="XOM", symbol="XOM", name="Exxon", asset_class=AssetClass.EQUITY, sector="Energy", price=110.0),
+        "AAPL_BOND": Bond(
+            id="AAPL_BOND",
+            symbol="AAPL30",
+            name="Apple Bond",
+            asset_class=AssetClass.FIXED_INCOME,
+            sector="Technology",
+            price=1000.0,
+        ),
+    }
+
+
+@pytest.mark.unit
+class TestCursors:
+    """Test cursor encoding round-trips and rejection of malformed input."""
+
+    def test_round_trip(self):
+        """Decoding an encoded cursor restores the sort key."""
+        cursor = encode_cursor(("AAPL", "MSFT", "same_sector", 0.7, 1))
+        assert "=" not in cursor
+        assert decode_cursor(cursor, RELATIONSHIP_CURSOR_TYPES) == ("AAPL", "MSFT", "same_sector", 0.7, 1)
+
+    def test_integer_strength_accepted(self):
+        """A whole-number strength may be encoded as an integer and decodes as a float."""
+        key = decode_cursor(encode_cursor(("A", "B", "t", 1, 0)), RELATIONSHIP_CURSOR_TYPES)
+        assert key == ("A", "B", "t", 1.0, 0) and isinstance(key[3], float)
+
+    @pytest.mark.parametrize("key", [("A", "B", "t", "0.5", 0), ("A", "B", "t", 0.5, 0.5), ("A", "B", "t", True, 0)])
+    def test_wrong_component_type(self, key):
+        """Components of the wrong type are rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor(encode_cursor(key), RELATIONSHIP_CURSOR_TYPES)
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor(("A",)) + "x", "e30"])
+    def test_malformed_cursor(self, cursor):
+        """Garbage, truncated or wrongly shaped cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, RELATIONSHIP_CURSOR_TYPES)
+
+    def test_wrong_key_length(self):
+        """A cursor from another resource is rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor(encode_cursor(("AAPL",)), RELATIONSHIP_CURSOR_TYPES)
+        with pytest.raises(ValueError):
+            decode_cursor(encode_cursor(("AAPL", "MSFT", "same_sector", 0.7, 0)), ASSET_CURSOR_TYPES)
+
+
+@pytest.mark.unit
+class TestAssetIndex:
+    """Test filter push-down and id-ordered pagination."""
+
+    def test_select_uses_precomputed_lists(self, assets):
+        """Each filter combination maps to a sorted id list."""
+        index = AssetIndex.build(assets)
+        assert index.select() == ["AAPL", "AAPL_BOND", "MSFT", "XOM"]
+        assert index.select(asset_class="Equity") == ["AAPL", "MSFT", "XOM"]
+        assert index.select(sector="Technology") == ["AAPL", "AAPL_BOND", "MSFT"]
+        assert index.select(asset_class="Equity", sector="Technology") == ["AAPL", "MSFT"]
+        assert index.select(asset_class="Commodity") == []
+
+    def test_pages_cover_every_id_once(self, assets):
+        """Following next_cursor visits each asset exactly once."""
+        index = AssetIndex.build(assets)
+        seen, cursor = [], None
+        while True:
+            page = index.page(cursor=cursor, limit=3)
+            assert page.total == 4
+            seen.extend(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert seen == ["AAPL", "AAPL_BOND", "MSFT", "XOM"]
+
+    def test_cursor_survives_removed_item(self, assets):
+        """Key-based cursors stay valid even if the last returned id disappears."""
+        cursor = AssetIndex.build(assets).page(limit=2).next_cursor
+        del assets["AAPL_BOND"]
+        assert AssetIndex.build(assets).page(cursor=cursor).items == ["MSFT", "XOM"]
+
+
+@pytest.mark.unit
+class TestRelationshipIndex:
+    """Test edge ordering, type filters and pagination."""
+
+    def test_build_sorts_and_groups(self):
+        """Edges are sorted by (source, target, type) and grouped per type."""
+        index = RelationshipIndex.build(
+            {
+                "MSFT": [("AAPL", "same_sector", 0.7)],
+                "AAPL": [("XOM", "market_cap_similar", 0.4), ("MSFT", "same_sector", 0.7)],
+            }
+        )
+        assert [edge[:2] for edge in index.edges] == [("AAPL", "MSFT"), ("AAPL", "XOM"), ("MSFT", "AAPL")]
+        assert len(index.select("same_sector")) == 2
+        assert index.select("unknown") == []
+
+        first = index.page(limit=2)
+        assert first.total == 3
+        second = index.page(cursor=first.next_cursor, limit=2)
+        assert second.items == [("MSFT", "AAPL", "same_sector", 0.7)]
+        assert second.next_cursor is None
+
+    @pytest.mark.parametrize("limit", [1, 2, 3, 4])
+    def test_duplicate_edges_across_page_boundaries(self, limit):
+        """Edges sharing source, target and type, even with equal strength, are each returned exactly once."""
+        index = RelationshipIndex.build(
+            {
+                "A": [("B", "t", 0.5), ("B", "t", 0.5), ("B", "t", 0.2), ("B", "t", 0.5), ("C", "t", 0.1)],
+                "B": [("A", "t", 0.3)],
+            }
+        )
+        seen, cursor = [], None
+        while True:
+            page = index.page(cursor=cursor, limit=limit)
+            seen.extend(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert seen == index.edges
+        assert len(seen) == 6
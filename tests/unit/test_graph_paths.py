@@ -0,0 +1,84 @@
+"""Unit tests for weighted shortest-path queries (src/logic/graph_paths.py)."""
+
+import math
+
+import pytest
+
+from src.logic.asset_graph import AssetRelationshipGraph
+from src.logic.graph_adjacency import CompactAdjacency
+from src.logic.graph_paths import shortest_paths
+
+
+@pytest.fixture
+def adjacency():
+    """XOM reaches CL directly (weak), via CVX (strong) and via BP (medium)."""
+    return CompactAdjacency.build(
+        {
+            "XOM": [("CL", "commodity_exposure", 0.3), ("CVX", "same_sector", 0.9), ("BP", "same_sector", 0.8)],
+            "CVX": [("CL", "commodity_exposure", 0.8)],
+            "BP": [("CL", "commodity_exposure", 0.5)],
+            "CL": [("NG", "correlation", 0.0)],
+        },
+        extra_nodes=["ISLAND"],
+    )
+
+
+@pytest.mark.unit
+class TestShortestPaths:
+    """Test path ranking, filters and errors."""
+
+    def test_strongest_path_first(self, adjacency):
+        """The path with the largest strength product wins over fewer hops."""
+        (path,) = shortest_paths(adjacency, "XOM", "CL")
+        assert path.nodes == ["XOM", "CVX", "CL"]
+        assert path.hops == 2
+        assert path.strength == pytest.approx(0.72)
+        assert path.cost == pytest.approx(-math.log(0.72))
+        assert path.edges[0] == ("XOM", "CVX", "same_sector", 0.9)
+
+    def test_k_paths_are_ranked_and_distinct(self, adjacency):
+        """Yen's alternatives come in non-decreasing cost order without repeats."""
+        paths = shortest_paths(adjacency, "XOM", "CL", k=5, direction="out")
+        assert [p.nodes for p in paths] == [["XOM", "CVX", "CL"], ["XOM", "BP", "CL"], ["XOM", "CL"]]
+        costs = [p.cost for p in paths]
+        assert costs == sorted(costs)
+
+    def test_direction(self, adjacency):
+        """Outgoing-only search cannot walk edges backwards; "in" reverses the query."""
+        assert shortest_paths(adjacency, "CL", "XOM", direction="out") == []
+        assert shortest_paths(adjacency, "CL", "XOM", direction="in")[0].nodes == ["CL", "CVX", "XOM"]
+        both = shortest_paths(adjacency, "CVX", "BP")[0]
+        assert both.nodes == ["CVX", "XOM", "BP"]
+        assert both.edges[0] == ("XOM", "CVX", "same_sector", 0.9)
+
+    def test_filters(self, adjacency):
+        """Type and strength filters remove edges from the search."""
+        direct = shortest_paths(adjacency, "XOM", "CL", rel_types=["commodity_exposure"])
+        assert direct[0].nodes == ["XOM", "CL"]
+        assert shortest_paths(adjacency, "XOM", "CL", min_strength=0.85) == []
+
+    def test_zero_strength_edges_are_not_traversed(self, adjacency):
+        """A zero-strength edge has infinite cost."""
+        assert shortest_paths(adjacency, "CL", "NG") == []
+
+    def test_unreachable_and_trivial(self, adjacency):
+        """Disconnected assets give no paths; a node reaches itself with an empty path."""
+        assert shortest_paths(adjacency, "XOM", "ISLAND") == []
+        (path,) = shortest_paths(adjacency, "XOM", "XOM", k=3)
+        assert path.nodes == ["XOM"]
+        assert path.strength == 1.0
+
+    def test_errors(self, adjacency):
+        """Unknown assets, bad k and bad directions are rejected."""
+        with pytest.raises(KeyError):
+            shortest_paths(adjacency, "XOM", "missing")
+        with pytest.raises(ValueError):
+            shortest_paths(adjacency, "XOM", "CL", k=0)
+        with pytest.raises(ValueError):
+            shortest_paths(adjacency, "XOM", "CL", direction="sideways")
+
+    def test_graph_method(self):
+        """AssetRelationshipGraph.shortest_paths searches its compact adjacency."""
+        graph = AssetRelationshipGraph()
+        graph.relationships = {"A": [("B", "same_sector", 0.5)], "B": [("C", "same_sector", 0.5)]}
+        assert graph.shortest_paths("A", "C")[0].strength == pytest.approx(0.25)
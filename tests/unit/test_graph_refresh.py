@@ -0,0 +1,89 @@
+"""Unit tests for the background graph refresh scheduler (api/graph_refresh.py)."""
+
+import threading
+
+import pytest
+
+from api.graph_refresh import GraphRefreshScheduler
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestGraphRefreshScheduler:
+    """Test building, publishing and metrics of the refresh scheduler."""
+
+    def test_refresh_now_publishes_and_records(self):
+        """A successful refresh publishes the built graph and updates the metrics."""
+        published = []
+        clock = FakeClock()
+        scheduler = GraphRefreshScheduler(build=lambda: "graph-1", publish=published.append, clock=clock)
+
+        assert scheduler.refresh_now() is True
+        assert published == ["graph-1"]
+        status = scheduler.status()
+        assert status["refresh_count"] == 1
+        assert status["failure_count"] == 0
+        assert status["last_duration_seconds"] >= 0
+
+        clock.now += 30
+        assert scheduler.status()["staleness_seconds"] == pytest.approx(30, abs=1)
+
+    def test_failed_build_keeps_current_graph(self):
+        """A failing build is counted and nothing is published."""
+        published = []
+
+        def build():
+            raise RuntimeError("upstream unavailable")
+
+        scheduler = GraphRefreshScheduler(build=build, publish=published.append)
+        assert scheduler.refresh_now() is False
+        assert published == []
+        status = scheduler.status()
+        assert status["failure_count"] == 1
+        assert status["last_error"] == "upstream unavailable"
+        assert status["staleness_seconds"] is None
+
+    def test_trigger_refreshes_in_background(self):
+        """Triggering starts the worker thread and publishes without blocking the caller."""
+        done = threading.Event()
+        published = []
+
+        def publish(graph):
+            published.append(graph)
+            done.set()
+
+        scheduler = GraphRefreshScheduler(build=lambda: "graph-2", publish=publish)
+        try:
+            scheduler.trigger()
+            assert done.wait(5)
+            assert scheduler.running
+        finally:
+            scheduler.stop()
+        assert published == ["graph-2"]
+        assert not scheduler.running
+
+    def test_interval_refresh(self):
+        """With an interval the worker refreshes periodically without triggers."""
+        refreshed = threading.Semaphore(0)
+        scheduler = GraphRefreshScheduler(build=object, publish=lambda g: refreshed.release(), interval_seconds=0.01)
+        try:
+            scheduler.start()
+            assert refreshed.acquire(timeout=5)
+            assert refreshed.acquire(timeout=5)
+        finally:
+            scheduler.stop()
+        assert scheduler.status()["refresh_count"] >= 2
+
+    def test_non_positive_interval_disables_periodic_refresh(self):
+        """Zero means manual refresh only."""
+        scheduler = GraphRefreshScheduler(build=object, publish=lambda g: None, interval_seconds=0)
+        assert scheduler.interval_seconds is None
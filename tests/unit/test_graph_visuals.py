@@ -1,13 +1,19 @@
 from src.logic.asset_graph import AssetRelationshipGraph
+from unittest.mock import patch
+
 import numpy as np
 import plotly.graph_objects as go
 import pytest
 
 from src.visualizations.graph_visuals import (REL_TYPE_COLORS,
+                                              RELATIONSHIP_FILTERS,
                                               _build_asset_id_index,
                                               _build_relationship_index,
                                               _create_directional_arrows,
-                                              _create_relationship_traces)
+                                              _create_relationship_traces,
+                                              validate_graph_snapshot,
+                                              visualize_3d_graph,
+                                              visualize_3d_graph_with_filters)
 
 
 class DummyGraph(AssetRelationshipGraph):
@@ -216,3 +222,172 @@ def test_create_directional_arrows_bidirectional_no_arrows():
     asset_ids = ["A", "B"]
     arrows = _create_directional_arrows(graph, positions, asset_ids)
     assert arrows == []
+
+
+def test_create_directional_arrows_single_trace_for_many_edges():
+    graph = DummyGraph({
+        "A": [("B", "correlation", 0.9), ("C", "correlation", 0.9)],
+        "B": [("C", "same_sector", 0.5), ("A", "correlation", 0.9)],
+    })
+    positions = np.array([[0.0, 0.0, 0.0], [10.0, 0.0, 0.0], [0.0, 10.0, 0.0]])
+    arrows = _create_directional_arrows(graph, positions, ["A", "B", "C"])
+    assert len(arrows) == 1
+    # A -> B is bidirectional; A -> C and B -> C get an arrow 70% along the edge
+    np.testing.assert_allclose(sorted(zip(arrows[0].x, arrows[0].y)), [(0.0, 7.0), (3.0, 7.0)])
+    assert "Direction: A → C<br>Type: correlation" in list(arrows[0].hovertext)
+
+
+def test_create_directional_arrows_samples_above_limit():
+    graph = DummyGraph({f"N{i}": [(f"N{i + 1}", "correlation", 0.5)] for i in range(50)})
+    asset_ids = [f"N{i}" for i in range(51)]
+    positions = np.arange(51 * 3, dtype=float).reshape(51, 3)
+    arrows = _create_directional_arrows(graph, positions, asset_ids, max_arrows=10)
+    assert len(arrows[0].x) == 10
+    assert len(_create_directional_arrows(graph, positions, asset_ids, max_arrows=None)[0].x) == 50
+
+
+def test_create_directional_arrows_cone_style():
+    graph = DummyGraph({"A": [("B", "correlation", 0.9)], "C": [("C", "correlation", 0.9)]})
+    positions = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 5.0], [1.0, 1.0, 1.0]])
+    arrows = _create_directional_arrows(graph, positions, ["A", "B", "C"], arrow_style="cone")
+    assert len(arrows) == 1
+    cone = arrows[0]
+    assert isinstance(cone, go.Cone)
+    assert cone.showscale is False
+    # Unit direction along +z, scaled to the arrowhead length
+    assert cone.u[0] == 0.0 and cone.v[0] == 0.0 and cone.w[0] > 0.0
+    assert cone.z[0] == pytest.approx(3.5)
+
+
+def test_create_directional_arrows_rejects_unknown_style():
+    graph = DummyGraph({"A": [("B", "correlation", 0.9)]})
+    with pytest.raises(ValueError, match="arrow_style"):
+        _create_directional_arrows(graph, np.zeros((2, 3)), ["A", "B"], arrow_style="arrows")
+    with pytest.raises(ValueError, match="arrow_style"):
+        visualize_3d_graph_with_filters(graph, arrow_style="arrows")
+
+
+def test_filtered_figure_cone_arrows_cached_per_style():
+    graph = DummyGraph({"A": [("B", "correlation", 0.9)]})
+    markers = visualize_3d_graph_with_filters(graph)
+    cones = visualize_3d_graph_with_filters(graph, arrow_style="cone")
+    assert [trace.type for trace in markers.data if trace.name == "Direction Arrows"] == ["scatter3d"]
+    assert [trace.type for trace in cones.data if trace.name == "Direction Arrows"] == ["cone"]
+
+
+def test_visualize_3d_graph_node_size_by_centrality():
+    graph = DummyGraph({
+        "H": [("A", "correlation", 0.9), ("B", "correlation", 0.9), ("C", "correlation", 0.9)],
+        "A": [("H", "correlation", 0.9)],
+    })
+    fig = visualize_3d_graph(graph, node_size_by="pagerank")
+    node_trace = next(trace for trace in fig.data if trace.name == "Assets")
+    sizes = dict(zip(node_trace.text, node_trace.marker.size))
+    assert sizes["H"] == max(sizes.values())
+    assert visualize_3d_graph(graph).data[-1].marker.size == 15
+
+
+def test_visualize_3d_graph_rejects_unknown_size_measure():
+    graph = DummyGraph({"A": [("B", "correlation", 0.9)]})
+    with pytest.raises(ValueError):
+        visualize_3d_graph(graph, node_size_by="closeness")
+
+
+class CountingGraph(DummyGraph):
+    def __init__(self, relationships):
+        super().__init__(relationships)
+        self.layout_calls = 0
+
+    def get_3d_visualization_data_enhanced(self):
+        self.layout_calls += 1
+        return super().get_3d_visualization_data_enhanced()
+
+
+def _filter_graph():
+    return CountingGraph({
+        "A": [("B", "same_sector", 0.9), ("C", "correlation", 0.5), ("D", "custom_link", 0.4)],
+        "B": [("A", "same_sector", 0.9)],
+    })
+
+
+def test_visualize_3d_graph_with_filters_reuses_cached_traces():
+    graph = _filter_graph()
+    everything = visualize_3d_graph_with_filters(graph)
+    names = {trace.name for trace in everything.data}
+    assert {"Same Sector (↔)", "Correlation (→)", "Custom Link (→)", "Assets"} <= names
+
+    filtered = visualize_3d_graph_with_filters(graph, show_all_relationships=False, show_correlation=False)
+    names = {trace.name for trace in filtered.data}
+    assert "Correlation (→)" not in names
+    # Relationship types without a filter are always shown
+    assert {"Same Sector (↔)", "Custom Link (→)"} <= names
+    assert graph.layout_calls == 1
+
+
+def test_visualize_3d_graph_with_filters_all_disabled_keeps_unfiltered_types():
+    graph = _filter_graph()
+    flags = {name: False for name, _ in RELATIONSHIP_FILTERS}
+    fig = visualize_3d_graph_with_filters(graph, show_all_relationships=False, toggle_arrows=False, **flags)
+    assert [trace.name for trace in fig.data] == ["Custom Link (→)", "Assets"]
+
+
+def test_visualize_3d_graph_with_filters_rebuilds_after_graph_change():
+    graph = _filter_graph()
+    visualize_3d_graph_with_filters(graph)
+    graph.add_relationship("C", "D", "regulatory_impact", 0.3)
+    fig = visualize_3d_graph_with_filters(graph)
+    assert graph.layout_calls == 2
+    assert "Regulatory Impact (→)" in {trace.name for trace in fig.data}
+
+
+def test_visualize_3d_graph_with_filters_skips_compact_adjacency():
+    graph = _filter_graph()
+    with patch.object(graph, "compact_adjacency", side_effect=AssertionError("adjacency built")):
+        visualize_3d_graph_with_filters(graph)
+    assert graph.layout_calls == 1
+
+
+def test_visualize_3d_graph_with_filters_rejects_malformed_relationships():
+    graph = CountingGraph({"A": [("B", "same_sector", "strong")]})
+    with pytest.raises(ValueError, match="Failed to create relationship traces"):
+        visualize_3d_graph_with_filters(graph)
+
+
+def test_visualize_3d_graph_with_filters_figures_do_not_share_trace_data():
+    graph = _filter_graph()
+    first = visualize_3d_graph_with_filters(graph)
+    name, length = first.data[0].name, len(first.data[0].x)
+    first.data[0].update(name="changed", x=[0.0])
+    second = visualize_3d_graph_with_filters(graph)
+    assert second.data[0].name == name
+    assert len(second.data[0].x) == length
+
+
+def test_validate_graph_snapshot_trusts_graph_until_it_changes(monkeypatch):
+    graph = DummyGraph({"A": [("B", "correlation", 0.9)], "B": [("C", "same_sector", 0.5)]})
+    assert not graph.is_validated
+    validate_graph_snapshot(graph)
+    assert graph.is_validated
+
+    def fail(*args, **kwargs):
+        raise AssertionError("trusted graphs are not revalidated")
+
+    monkeypatch.setattr("src.visualizations.graph_visuals._validate_visualization_data", fail)
+    fig = visualize_3d_graph(graph)
+    assert fig.data[-1].name == "Assets"
+    assert _build_relationship_index(graph, ["A", "B", "C"]) == {
+        ("A", "B", "correlation"): 0.9,
+        ("B", "C", "same_sector"): 0.5,
+    }
+
+    graph.relationships = {"A": [("B", "correlation", "strong")]}
+    assert not graph.is_validated
+    with pytest.raises(ValueError, match="strength"):
+        _build_relationship_index(graph, ["A", "B"])
+
+
+def test_validate_graph_snapshot_rejects_invalid_data():
+    graph = DummyGraph({"A": [("B", "correlation", "strong")]})
+    with pytest.raises(ValueError, match="strength"):
+        validate_graph_snapshot(graph)
+    assert not graph.is_validated
@@ -0,0 +1,94 @@
+"""Unit tests for layout level-of-detail helpers (src/logic/level_of_detail.py)."""
+
+import numpy as np
+import pytest
+
+from src.logic.level_of_detail import LayoutIndex, top_k_per_source
+
+
+@pytest.fixture
+def layout():
+    """Four nodes at the corners of a unit square, plus one far away, with five edges."""
+    positions = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [1.0, 1.0, 0.0],
+            [10.0, 10.0, 5.0],
+        ]
+    )
+    relationships = {
+        "A": [("B", "same_sector", 0.9), ("C", "correlation", 0.2), ("E", "correlation", 0.6)],
+        "B": [("D", "same_sector", 0.5)],
+        "D": [("A", "same_sector", 0.4), ("MISSING", "same_sector", 1.0)],
+    }
+    return LayoutIndex.build(positions, ["A", "B", "C", "D", "E"], ["red", "red", "blue", "red", "blue"], relationships)
+
+
+@pytest.mark.unit
+class TestLayoutIndex:
+    """Test viewport queries and edge thinning."""
+
+    def test_build_encodes_edges(self, layout):
+        """Edges become index arrays and unknown endpoints are dropped."""
+        assert layout.edge_source.tolist() == [0, 0, 0, 1, 3]
+        assert layout.edge_target.tolist() == [1, 2, 4, 3, 0]
+        assert layout.relationship_types == ["same_sector", "correlation"]
+        assert layout.edge_type.tolist() == [0, 1, 1, 0, 0]
+
+    def test_query_bbox(self, layout):
+        """Only nodes inside the box (inclusive) are returned."""
+        assert layout.query_bbox((0.5, -1.0, -1.0), (1.0, 2.0, 1.0)).tolist() == [1, 3]
+        assert layout.query_bbox((-1.0, -1.0, -1.0), (2.0, 2.0, 1.0)).tolist() == [0, 1, 2, 3]
+        assert layout.query_bbox((20.0, 0.0, 0.0), (30.0, 1.0, 1.0)).size == 0
+
+    def test_select_edges_within_viewport(self, layout):
+        """Edges leaving the selection are dropped and weak edges are filtered."""
+        visible = layout.query_bbox((-1.0, -1.0, -1.0), (2.0, 2.0, 1.0))
+        assert layout.select_edges(visible).tolist() == [0, 1, 3, 4]
+        assert layout.select_edges(visible, min_strength=0.45).tolist() == [0, 3]
+
+    def test_top_k_per_source(self, layout):
+        """Only the strongest outgoing edges of each node are kept."""
+        assert layout.select_edges(top_k=1).tolist() == [0, 3, 4]
+        source = np.array([2, 0, 2, 2])
+        strength = np.array([0.1, 0.5, 0.9, 0.3])
+        assert top_k_per_source(source, strength, 2).tolist() == [1, 2, 3]
+
+
+@pytest.mark.unit
+class TestClusterAggregation:
+    """Test spatial cluster aggregation."""
+
+    def test_cluster_count_is_bounded(self, layout):
+        """At most max_clusters clusters are produced and every node is assigned."""
+        nodes = np.arange(layout.node_count)
+        clusters = layout.aggregate(nodes, layout.select_edges(), max_clusters=8)
+        assert clusters.counts.size <= 8
+        assert clusters.counts.sum() == layout.node_count
+        assert clusters.labels.size == layout.node_count
+
+    def test_single_cluster_drops_internal_edges(self, layout):
+        """With one cluster every edge is internal and the centroid is the mean position."""
+        nodes = np.arange(4)
+        clusters = layout.aggregate(nodes, layout.select_edges(nodes), max_clusters=1)
+        assert clusters.counts.tolist() == [4]
+        assert clusters.colors == ["red"]
+        np.testing.assert_allclose(clusters.centroids[0], [0.5, 0.5, 0.0])
+        assert clusters.edge_source.size == 0
+
+    def test_parallel_edges_are_merged(self, layout):
+        """Edges between the same pair of clusters are summed."""
+        nodes = np.arange(layout.node_count)
+        clusters = layout.aggregate(nodes, layout.select_edges(), max_clusters=8)
+        near, far = clusters.labels[0], clusters.labels[4]
+        mask = (clusters.edge_source == near) & (clusters.edge_target == far)
+        assert clusters.edge_weight[mask].tolist() == [pytest.approx(0.6)]
+        assert clusters.edge_count[mask].tolist() == [1]
+
+    def test_empty_selection(self, layout):
+        """Aggregating nothing yields an empty level."""
+        clusters = layout.aggregate(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), max_clusters=8)
+        assert clusters.counts.size == 0
+        assert clusters.colors == []
@@ -0,0 +1,79 @@
+"""Unit tests for the compute executor (api/offload.py)."""
+
+import asyncio
+import threading
+
+import pytest
+
+from api.offload import ComputeBusyError, ComputeExecutor, ComputeTimeoutError
+
+
+@pytest.fixture
+def executor():
+    """Yield a two-worker executor with no queue and shut it down afterwards."""
+    compute = ComputeExecutor(max_workers=2, timeout_seconds=5, max_pending=0)
+    yield compute
+    compute.shutdown()
+
+
+@pytest.mark.unit
+class TestComputeExecutor:
+    """Test offloading, admission control and timeouts."""
+
+    def test_runs_on_worker_thread(self, executor):
+        """The callable runs off the event loop thread and its result is returned."""
+        caller = threading.get_ident()
+        result = asyncio.run(executor.run(lambda x: (x * 2, threading.get_ident()), 21))
+        assert result[0] == 42
+        assert result[1] != caller
+        assert executor.active == 0
+
+    def test_exceptions_propagate(self, executor):
+        """Errors raised by the callable reach the awaiting request."""
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(executor.run(fail))
+        assert executor.active == 0
+
+    def test_timeout(self, executor):
+        """Slow computations raise ComputeTimeoutError while the loop stays free."""
+        release = threading.Event()
+        with pytest.raises(ComputeTimeoutError):
+            asyncio.run(executor.run(release.wait, 5, timeout=0.05))
+        release.set()
+
+    def test_saturation_is_rejected(self, executor):
+        """Once every worker is busy and the queue is full, new work is refused."""
+        release = threading.Event()
+
+        async def scenario():
+            running = [asyncio.ensure_future(executor.run(release.wait, 5)) for _ in range(2)]
+            await asyncio.sleep(0)
+            try:
+                with pytest.raises(ComputeBusyError):
+                    await executor.run(lambda: None)
+            finally:
+                release.set()
+                await asyncio.gather(*running)
+
+        asyncio.run(scenario())
+        assert executor.active == 0
+
+    def test_event_loop_stays_responsive(self, executor):
+        """Other coroutines keep running while a computation blocks its worker."""
+        release = threading.Event()
+
+        async def scenario():
+            slow = asyncio.ensure_future(executor.run(release.wait, 5))
+            ticks = 0
+            for _ in range(5):
+                await asyncio.sleep(0.001)
+                ticks += 1
+            release.set()
+            await slow
+            return ticks
+
+        assert asyncio.run(scenario()) == 5
@@ -0,0 +1,38 @@
+"""Unit tests for the JSON graph cache serialization helpers (src/data/real_data_fetcher.py)."""
+
+import pytest
+
+from src.data.real_data_fetcher import _deserialize_asset, _deserialize_event, _serialize_dataclass
+from src.models.financial_models import AssetClass, Equity, RegulatoryActivity, RegulatoryEvent
+
+
+@pytest.mark.unit
+class TestCacheSerialization:
+    """Test that cached assets and events deserialize to what was serialized."""
+
+    def test_event_round_trip(self):
+        """A serialized regulatory event, including its type tag, deserializes to an equal event."""
+        event = RegulatoryEvent(
+            id="EV1",
+            asset_id="AAPL",
+            event_type=RegulatoryActivity.EARNINGS_REPORT,
+            date="2024-01-15",
+            description="Quarterly earnings report",
+            impact_score=0.2,
+            related_assets=["MSFT"],
+        )
+        payload = _serialize_dataclass(event)
+        assert payload["__type__"] == "RegulatoryEvent"
+        assert _deserialize_event(payload) == event
+
+    def test_asset_round_trip(self):
+        """A serialized equity deserializes to an equal equity."""
+        equity = Equity(
+            id="AAPL",
+            symbol="AAPL",
+            name="Apple Inc.",
+            asset_class=AssetClass.EQUITY,
+            sector="Technology",
+            price=150.0,
+        )
+        assert _deserialize_asset(_serialize_dataclass(equity)) == equity
@@ -0,0 +1,105 @@
+"""Unit tests for the version-keyed response cache (api/response_cache.py)."""
+
+import pytest
+
+from api.response_cache import CachedResponse, ResponseCache, compute_etag, etag_matches
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Test snapshot binding, LRU eviction and lazy building."""
+
+    def test_get_or_create_builds_once(self):
+        """Factory should only run on the first lookup for a key."""
+        cache = ResponseCache(max_entries=4)
+        owner = object()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return b"[]"
+
+        first = cache.get_or_create(owner, 1, ("assets",), factory)
+        second = cache.get_or_create(owner, 1, ("assets",), factory)
+
+        assert first is second
+        assert first.body == b"[]"
+        assert first.media_type == "application/json"
+        assert len(calls) == 1
+
+    def test_version_change_discards_entries(self):
+        """Entries built for an older version must not be served."""
+        cache = ResponseCache(max_entries=4)
+        owner = object()
+        cache.put(owner, 1, ("assets",), CachedResponse(body=b"old"))
+
+        assert cache.get(owner, 2, ("assets",)) is None
+        assert len(cache) == 0
+
+    def test_owner_change_discards_entries(self):
+        """Swapping the graph object invalidates the cache even if the version is unchanged."""
+        cache = ResponseCache(max_entries=4)
+        cache.put(object(), 1, ("assets",), CachedResponse(body=b"old"))
+
+        assert cache.get(object(), 1, ("assets",)) is None
+
+    def test_stale_version_keeps_newer_entries(self):
+        """A request still on an older snapshot neither replaces nor reads the newer snapshot's entries."""
+        cache = ResponseCache(max_entries=4)
+        old_owner, new_owner = object(), object()
+        cache.put(new_owner, 2, ("assets",), CachedResponse(body=b"new"))
+
+        stale = CachedResponse(body=b"old")
+        assert cache.put(old_owner, 1, ("assets",), stale) is stale
+        assert cache.get(old_owner, 1, ("assets",)) is None
+        assert cache.get_or_create(old_owner, 1, ("assets",), lambda: b"rebuilt").body == b"rebuilt"
+        assert cache.get(new_owner, 2, ("assets",)).body == b"new"
+        assert len(cache) == 1
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted once the bound is reached."""
+        cache = ResponseCache(max_entries=2)
+        owner = object()
+        cache.put(owner, 1, "a", CachedResponse(body=b"a"))
+        cache.put(owner, 1, "b", CachedResponse(body=b"b"))
+        cache.get(owner, 1, "a")
+        cache.put(owner, 1, "c", CachedResponse(body=b"c"))
+
+        assert cache.get(owner, 1, "b") is None
+        assert cache.get(owner, 1, "a").body == b"a"
+        assert cache.get(owner, 1, "c").body == b"c"
+
+    def test_max_entries_from_environment(self, monkeypatch):
+        """The default bound should be read from RESPONSE_CACHE_MAX_ENTRIES."""
+        monkeypatch.setenv("RESPONSE_CACHE_MAX_ENTRIES", "3")
+        assert ResponseCache().max_entries == 3
+
+    def test_clear(self):
+        """clear() empties the cache."""
+        cache = ResponseCache()
+        owner = object()
+        cache.put(owner, 1, "a", CachedResponse(body=b"a"))
+        cache.clear()
+        assert len(cache) == 0
+
+
+@pytest.mark.unit
+class TestEntityTags:
+    """Test ETag computation and If-None-Match matching."""
+
+    def test_etag_is_content_derived(self):
+        """Identical bodies share a tag, different bodies do not."""
+        assert compute_etag(b"[1]") == compute_etag(b"[1]")
+        assert compute_etag(b"[1]") != compute_etag(b"[2]")
+        assert CachedResponse(body=b"[1]").etag == compute_etag(b"[1]")
+
+    def test_etag_matches(self):
+        """Matching uses weak comparison over a comma-separated list."""
+        etag = compute_etag(b"body")
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", {etag}', etag)
+        assert etag_matches(f"W/{etag}", etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches("", etag)
@@ -0,0 +1,101 @@
+"""Unit tests for headless PNG/SVG rendering (src/visualizations/static_render.py)."""
+
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from src.logic.level_of_detail import LayoutIndex
+from src.visualizations.static_render import encode_png, parse_color, project_positions, render_png, render_svg
+
+
+def _decode_png(data):
+    """Decode an 8-bit RGB PNG written by `encode_png` (filter type 0 only)."""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    width, height = struct.unpack(">II", data[16:24])
+    idat = data.index(b"IDAT")
+    length = struct.unpack(">I", data[idat - 4 : idat])[0]
+    rows = np.frombuffer(zlib.decompress(data[idat + 4 : idat + 4 + length]), dtype=np.uint8)
+    return rows.reshape(height, 1 + width * 3)[:, 1:].reshape(height, width, 3)
+
+
+def _layout():
+    positions = np.array([[0.0, 0.0, 0.0], [4.0, -4.0, 0.0], [0.0, 0.0, 9.0]])
+    relationships = {"A": [("B", "same_sector", 0.9), ("C", "correlation", 0.2)]}
+    return LayoutIndex.build(positions, ["A", "B", "C"], ["#000000", "#0000ff", "rgb(0, 255, 0)"], relationships)
+
+
+@pytest.mark.unit
+class TestColorsAndProjection:
+    """Test color parsing and the image-plane projection."""
+
+    @pytest.mark.parametrize(
+        "color, rgb",
+        [
+            ("#ff6b6b", (255, 107, 107)),
+            ("#0f0", (0, 255, 0)),
+            ("rgba(1, 2, 3, 0.5)", (1, 2, 3)),
+            ("teal", (136, 136, 136)),
+        ],
+    )
+    def test_parse_color(self, color, rgb):
+        """Hex and rgb() colors are parsed; anything else falls back to gray."""
+        assert parse_color(color) == rgb
+
+    def test_projection_fits_inside_margin(self):
+        """Projected nodes span the image inside the margin, with nearer nodes at larger depth."""
+        pixels, depth = project_positions(_layout().positions, 200, 100, margin=5)
+        assert pixels.min() >= 5 - 1e-9
+        assert pixels[:, 0].max() <= 195 + 1e-9 and pixels[:, 1].max() <= 95 + 1e-9
+        assert depth[2] > depth[0]
+
+    def test_single_node_is_centered(self):
+        """A layout without extent is drawn in the middle of the image."""
+        pixels, _ = project_positions(np.ones((1, 3)), 100, 60, margin=5)
+        np.testing.assert_allclose(pixels, [[50.0, 30.0]])
+
+
+@pytest.mark.unit
+class TestRendering:
+    """Test the PNG and SVG renderers."""
+
+    def test_encode_png_roundtrip(self):
+        """Encoded images decode back to the same pixels."""
+        image = np.arange(4 * 5 * 3, dtype=np.uint8).reshape(4, 5, 3)
+        np.testing.assert_array_equal(_decode_png(encode_png(image)), image)
+
+    def test_png_draws_nodes_and_edges(self):
+        """Node colors appear at their projected positions and edges tint the background."""
+        layout = _layout()
+        image = _decode_png(render_png(layout, width=120, height=90))
+        assert image.shape == (90, 120, 3)
+        pixels, _ = project_positions(layout.positions, 120, 90, margin=5)
+        x, y = np.rint(pixels[1]).astype(int)
+        assert tuple(image[y, x]) == (0, 0, 255)
+        x, y = np.rint(pixels[2]).astype(int)
+        assert tuple(image[y, x]) == (0, 255, 0)
+        assert ((image != 255).any(axis=2)).sum() > 2 * 9
+
+    def test_png_edge_selection(self):
+        """Only the selected edges are drawn."""
+        layout = _layout()
+        without = _decode_png(render_png(layout, np.empty(0, dtype=np.int64), width=120, height=90))
+        with_edges = _decode_png(render_png(layout, width=120, height=90))
+        assert (without != with_edges).any()
+
+    def test_svg_groups_edges_by_type(self):
+        """Edges become one path per relationship type and nodes one circle each."""
+        svg = render_svg(_layout(), width=120, height=90).decode("utf-8")
+        assert svg.startswith("<svg") and svg.endswith("</svg>")
+        assert svg.count("<path") == 2 and svg.count("<circle") == 3
+        assert 'stroke="#FF6B6B"' in svg
+        only_first = render_svg(_layout(), np.array([0]), width=120, height=90).decode("utf-8")
+        assert only_first.count("<path") == 1
+
+    def test_empty_layout(self):
+        """A layout without nodes renders a blank image."""
+        layout = LayoutIndex.build(np.empty((0, 3)), [], [], {})
+        image = _decode_png(render_png(layout, width=64, height=64))
+        assert (image == 255).all()
+        assert "<circle" not in render_svg(layout).decode("utf-8")
@@ -0,0 +1,137 @@
+"""Unit tests for synthetic universe generation (src/data/synthetic_data.py)."""
+
+import numpy as np
+import pytest
+
+from src.data.synthetic_data import (
+    CLASS_WEIGHTS,
+    EQUITY_SECTORS,
+    class_counts,
+    create_synthetic_database,
+    iter_price_histories,
+    iter_synthetic_assets,
+    iter_synthetic_events,
+)
+from src.models.financial_models import AssetClass, Bond, Equity
+
+
+@pytest.mark.unit
+class TestSyntheticAssets:
+    """Test class mix, determinism and cross-asset references."""
+
+    def test_class_counts_follow_weights(self):
+        """Counts follow the class weights and sum to the requested size."""
+        counts = class_counts(1000)
+        assert sum(counts.values()) == 1000
+        for asset_class, weight in CLASS_WEIGHTS.items():
+            assert counts[asset_class] == int(1000 * weight)
+
+    def test_small_universe_has_every_class(self):
+        """A universe large enough for one asset per class gets one."""
+        counts = class_counts(4)
+        assert all(count == 1 for count in counts.values())
+        assert sum(class_counts(2).values()) == 2
+
+    def test_negative_count_rejected(self):
+        """A negative universe size is an error."""
+        with pytest.raises(ValueError):
+            class_counts(-1)
+        with pytest.raises(ValueError):
+            list(iter_synthetic_assets(-5))
+
+    def test_generation_is_deterministic(self):
+        """The same size and seed give the same assets; another seed gives others."""
+        first = list(iter_synthetic_assets(300, seed=7))
+        second = list(iter_synthetic_assets(300, seed=7))
+        other = list(iter_synthetic_assets(300, seed=8))
+        assert first == second
+        assert [asset.price for asset in first] != [asset.price for asset in other]
+
+    def test_ids_and_symbols_are_unique(self):
+        """Every asset has a unique id and ticker."""
+        assets = list(iter_synthetic_assets(2000))
+        assert len({asset.id for asset in assets}) == 2000
+        assert len({asset.symbol for asset in assets}) == 2000
+
+    def test_market_cap_decreases_with_rank(self):
+        """Equities come in market-cap rank order, up to noise."""
+        caps = [asset.market_cap for asset in iter_synthetic_assets(1000) if isinstance(asset, Equity)]
+        assert caps[0] > caps[-1] * 100
+        assert np.corrcoef(np.log1p(np.arange(len(caps))), np.log(caps))[0, 1] < -0.9
+
+    def test_bond_issuers_are_generated_equities_of_the_same_sector(self):
+        """Corporate bonds reference an existing equity and share its sector."""
+        assets = {asset.id: asset for asset in iter_synthetic_assets(1500, seed=3)}
+        bonds = [asset for asset in assets.values() if isinstance(asset, Bond)]
+        corporate = [bond for bond in bonds if bond.issuer_id is not None]
+        assert corporate and len(corporate) < len(bonds)
+        for bond in corporate:
+            assert bond.issuer_id in assets
+            assert assets[bond.issuer_id].sector == bond.sector
+            assert bond.sector in EQUITY_SECTORS
+
+
+@pytest.mark.unit
+class TestSyntheticEvents:
+    """Test regulatory events and price histories."""
+
+    def test_events_reference_same_sector_equities(self):
+        """Events concern generated equities and relate them to distinct same-sector peers."""
+        assets = {asset.id: asset for asset in iter_synthetic_assets(5000)}
+        events = list(iter_synthetic_events(5000, event_rate=0.05, max_related=2))
+        assert len(events) == 250
+        assert len({event.id for event in events}) == 250
+        for event in events:
+            subject = assets[event.asset_id]
+            assert subject.asset_class == AssetClass.EQUITY
+            assert len(event.related_assets) <= 2
+            assert len(set(event.related_assets)) == len(event.related_assets)
+            assert event.asset_id not in event.related_assets
+            assert all(assets[peer].sector == subject.sector for peer in event.related_assets)
+
+    def test_no_events_without_equities(self):
+        """An empty universe has no events; a negative rate is an error."""
+        assert list(iter_synthetic_events(0)) == []
+        with pytest.raises(ValueError):
+            list(iter_synthetic_events(100, event_rate=-0.1))
+
+    def test_price_histories_end_at_price(self):
+        """Every history has the requested length and ends at the asset's price."""
+        assets = list(iter_synthetic_assets(50))
+        histories = dict(iter_price_histories(assets, days=30, seed=1))
+        assert set(histories) == {asset.id for asset in assets}
+        for asset in assets:
+            history = histories[asset.id]
+            assert history.shape == (30,)
+            assert np.all(history > 0)
+            assert history[-1] == pytest.approx(asset.price)
+
+
+@pytest.mark.unit
+class TestSyntheticDatabase:
+    """Test the graph built over a synthetic universe."""
+
+    def test_counts(self):
+        """Assets, events and derived relationships of a small universe land on the graph."""
+        graph = create_synthetic_database(200, event_rate=0.1)
+        counts = class_counts(200)
+        assert len(graph.assets) == 200
+        assert len(graph.regulatory_events) == 20
+
+        bonds = [asset for asset in graph.assets.values() if isinstance(asset, Bond) and asset.issuer_id]
+        sectors = {asset.sector for asset in graph.assets.values() if isinstance(asset, Equity)}
+        edges = [(source_id, *edge) for source_id, edges in graph.relationships.items() for edge in edges]
+        by_type = {}
+        for _source_id, _target_id, rel_type, _strength in edges:
+            by_type[rel_type] = by_type.get(rel_type, 0) + 1
+        assert by_type["corporate_bond_to_equity"] == len(bonds)
+        assert by_type["same_sector"] == 2 * (counts[AssetClass.EQUITY] - len(sectors))
+        assert 0 < by_type["regulatory_impact"] <= sum(len(event.related_assets) for event in graph.regulatory_events)
+        assert all(target_id in graph.assets for _source_id, target_id, _type, _strength in edges)
+        assert graph.compact_adjacency().edge_count == len(edges)
+
+    def test_without_relationships(self):
+        """Relationships are left empty on request."""
+        graph = create_synthetic_database(50, build_relationships=False)
+        assert len(graph.assets) == 50
+        assert graph.relationships == {}